@@ -28,6 +28,7 @@ build_app = typer.Typer(
     pretty_exceptions_show_locals=False
 )
 build_app.callback(invoke_without_command=True)(build.main)
+build_app.command("analyze")(build.analyze)
 
 # Add build as a subcommand
 app.add_typer(build_app, name="build", help="Build BrowserOS browser")
@@ -40,6 +41,10 @@ app.add_typer(dev.app, name="dev", help="Dev patch management")
 from .cli import release
 app.add_typer(release.app, name="release", help="Release automation")
 
+# Structured build event log queries
+from .cli import logs
+app.add_typer(logs.app, name="logs", help="Query structured build logs")
+
 
 if __name__ == "__main__":
     app()
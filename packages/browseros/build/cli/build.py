@@ -5,14 +5,21 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional, Type
 
 import typer
 
 # Import common modules
 from ..common.context import Context
 from ..common.config import load_config, validate_required_envs
-from ..common.pipeline import validate_pipeline, show_available_modules
+from ..common.pipeline import (
+    validate_pipeline,
+    show_available_modules,
+    show_pipeline_plan,
+)
+from ..common.history import BuildHistory
+from ..common.logger import log_event, set_log_module
+from ..common.console import set_console_mode
 from ..common.resolver import resolve_config, resolve_pipeline
 from ..common.notify import (
     notify_pipeline_start,
@@ -22,65 +29,115 @@ from ..common.notify import (
     notify_module_completion,
     set_build_context,
 )
-from ..common.module import ValidationError
+from ..common.module import CommandModule, ValidationError
+from ..common.registry import LazyModuleRegistry
 from ..common.utils import (
     log_error,
     log_info,
     log_success,
     log_warning,
+    get_platform,
+    get_platform_arch,
     IS_MACOS,
     IS_WINDOWS,
     IS_LINUX,
 )
 
-# Import all module classes
-from ..modules.setup.clean import CleanModule
-from ..modules.setup.git import GitSetupModule, SparkleSetupModule
-from ..modules.setup.configure import ConfigureModule
-from ..modules.compile import CompileModule, UniversalBuildModule
-from ..modules.patches.patches import PatchesModule
-from ..modules.patches.series_patches import SeriesPatchesModule
-from ..modules.resources.chromium_replace import ChromiumReplaceModule
-from ..modules.resources.string_replaces import StringReplacesModule
-from ..modules.resources.resources import ResourcesModule
-from ..modules.upload import UploadModule
-
-# Platform-specific modules (imported unconditionally - validation handles platform checks)
-from ..modules.sign.macos import MacOSSignModule
-from ..modules.sign.windows import WindowsSignModule
-from ..modules.sign.linux import LinuxSignModule
-from ..modules.sign.sparkle import SparkleSignModule
-from ..modules.package.macos import MacOSPackageModule
-from ..modules.package.windows import WindowsPackageModule
-from ..modules.package.linux import LinuxPackageModule
-
-AVAILABLE_MODULES = {
-    # Setup & Environment
-    "clean": CleanModule,
-    "git_setup": GitSetupModule,
-    "sparkle_setup": SparkleSetupModule,
-    "configure": ConfigureModule,
-    # Patches & Resources
-    "patches": PatchesModule,
-    "series_patches": SeriesPatchesModule,
-    "chromium_replace": ChromiumReplaceModule,
-    "string_replaces": StringReplacesModule,
-    "resources": ResourcesModule,
-    # Build
-    "compile": CompileModule,
-    "universal_build": UniversalBuildModule,  # macOS universal binary (arm64 + x64)
-    # Sign (platform-specific, validated at runtime)
-    "sign_macos": MacOSSignModule,
-    "sign_windows": WindowsSignModule,
-    "sign_linux": LinuxSignModule,
-    "sparkle_sign": SparkleSignModule,  # macOS Sparkle signing for auto-update
-    # Package (platform-specific, validated at runtime)
-    "package_macos": MacOSPackageModule,
-    "package_windows": WindowsPackageModule,
-    "package_linux": LinuxPackageModule,
-    # Upload
-    "upload": UploadModule,
-}
+# Module registry - classes are imported lazily on first lookup so that
+# --list, --plan and the dev CLI don't pay for sign/package/upload imports.
+# Descriptions are kept here (mirroring each module's `description`) so that
+# listing modules doesn't import them.
+AVAILABLE_MODULES = LazyModuleRegistry(
+    {
+        # Setup & Environment
+        "clean": (
+            "..modules.setup.clean:CleanModule",
+            "Clean build artifacts and reset git state",
+        ),
+        "git_setup": (
+            "..modules.setup.git:GitSetupModule",
+            "Checkout Chromium version and sync dependencies",
+        ),
+        "sparkle_setup": (
+            "..modules.setup.git:SparkleSetupModule",
+            "Download and setup Sparkle framework (macOS only)",
+        ),
+        "configure": (
+            "..modules.setup.configure:ConfigureModule",
+            "Configure build with GN",
+        ),
+        # Patches & Resources
+        "patches": (
+            "..modules.patches.patches:PatchesModule",
+            "Apply BrowserOS patches to Chromium",
+        ),
+        "series_patches": (
+            "..modules.patches.series_patches:SeriesPatchesModule",
+            "Apply series-based patches (GNU Quilt format)",
+        ),
+        "chromium_replace": (
+            "..modules.resources.chromium_replace:ChromiumReplaceModule",
+            "Replace Chromium source files with custom versions",
+        ),
+        "string_replaces": (
+            "..modules.resources.string_replaces:StringReplacesModule",
+            "Apply branding string replacements in Chromium",
+        ),
+        "resources": (
+            "..modules.resources.resources:ResourcesModule",
+            "Copy resources (icons, extensions) to Chromium",
+        ),
+        # Build
+        "compile": (
+            "..modules.compile:CompileModule",
+            "Build BrowserOS using autoninja",
+        ),
+        "universal_build": (
+            "..modules.compile:UniversalBuildModule",
+            "Build, sign, package, and upload universal binary (arm64 + x64) for macOS",
+        ),  # macOS universal binary (arm64 + x64)
+        "compile_multiarch": (
+            "..modules.compile:MultiArchBuildModule",
+            "Build multiple architectures from one prepared checkout (shared prep)",
+        ),  # shared prep, per-arch configure/compile/package
+        # Sign (platform-specific, validated at runtime)
+        "sign_macos": (
+            "..modules.sign.macos:MacOSSignModule",
+            "Sign and notarize macOS application",
+        ),
+        "sign_windows": (
+            "..modules.sign.windows:WindowsSignModule",
+            "Sign Windows binaries and create signed installer",
+        ),
+        "sign_linux": (
+            "..modules.sign.linux:LinuxSignModule",
+            "Linux code signing (no-op)",
+        ),
+        "sparkle_sign": (
+            "..modules.sign.sparkle:SparkleSignModule",
+            "Sign DMG files with Sparkle Ed25519 key for auto-update",
+        ),  # macOS Sparkle signing for auto-update
+        # Package (platform-specific, validated at runtime)
+        "package_macos": (
+            "..modules.package.macos:MacOSPackageModule",
+            "Create DMG package for macOS",
+        ),
+        "package_windows": (
+            "..modules.package.windows:WindowsPackageModule",
+            "Create Windows installer and portable ZIP",
+        ),
+        "package_linux": (
+            "..modules.package.linux:LinuxPackageModule",
+            "Create AppImage and .deb packages for Linux",
+        ),
+        # Upload
+        "upload": (
+            "..modules.upload:UploadModule",
+            "Upload build artifacts to Cloudflare R2",
+        ),
+    },
+    package=__package__,
+)
 
 
 def _get_sign_module():
@@ -109,30 +166,36 @@ def _get_package_module():
         sys.exit(1)
 
 
-# Fixed execution order - flags enable/disable phases, order is always the same
-EXECUTION_ORDER = [
-    # Phase 1: Setup & Clean
-    ("setup", ["clean", "git_setup", "sparkle_setup"]),
-    # Phase 2: Patches & Resources
-    (
-        "prep",
-        [
-            "resources",
-            "chromium_replace",
-            "string_replaces",
-            "patches",
-            "configure",
-        ],
-    ),
-    # Phase 3: Build
-    ("build", ["compile"]),
-    # Phase 4: Code Signing (platform-aware)
-    ("sign", [_get_sign_module()]),
-    # Phase 5: Packaging (platform-aware)
-    ("package", [_get_package_module()]),
-    # Phase 6: Upload
-    ("upload", ["upload"]),
-]
+def get_execution_order() -> list[tuple[str, list[str]]]:
+    """Fixed execution order - flags enable/disable phases, order is always the same
+
+    Built on demand (not at import) because sign/package phases probe the
+    current platform.
+    """
+    return [
+        # Phase 1: Setup & Clean
+        ("setup", ["clean", "git_setup", "sparkle_setup"]),
+        # Phase 2: Patches & Resources
+        (
+            "prep",
+            [
+                "resources",
+                "chromium_replace",
+                "string_replaces",
+                "patches",
+                "configure",
+            ],
+        ),
+        # Phase 3: Build
+        ("build", ["compile"]),
+        # Phase 4: Code Signing (platform-aware)
+        ("sign", [_get_sign_module()]),
+        # Phase 5: Packaging (platform-aware)
+        ("package", [_get_package_module()]),
+        # Phase 6: Upload
+        ("upload", ["upload"]),
+    ]
+
 
 # Modules that trigger Slack notifications (to reduce verbosity)
 NOTIFY_MODULES = [
@@ -150,7 +213,7 @@ NOTIFY_MODULES = [
 def execute_pipeline(
     ctx: Context,
     pipeline: list[str],
-    available_modules: dict,
+    available_modules: Mapping[str, Type[CommandModule]],
     pipeline_name: str = "build",
 ) -> None:
     """Execute a build pipeline by running modules sequentially.
@@ -158,7 +221,7 @@ def execute_pipeline(
     Args:
         ctx: Build context with paths and configuration
         pipeline: List of module names to execute in order
-        available_modules: Dictionary mapping module names to module classes
+        available_modules: Mapping of module names to module classes
         pipeline_name: Name of pipeline for notifications (default: "build")
 
     Raises:
@@ -173,9 +236,11 @@ def execute_pipeline(
     """
     start_time = time.time()
     notify_pipeline_start(pipeline_name, pipeline)
+    history = BuildHistory()
 
     try:
         for module_name in pipeline:
+            set_log_module(module_name)
             log_info(f"\n{'='*70}")
             log_info(f"🔧 Running module: {module_name}")
             log_info(f"{'='*70}")
@@ -206,18 +271,34 @@ def execute_pipeline(
                 if module_name in NOTIFY_MODULES:
                     notify_module_completion(module_name, module_duration)
                 log_success(f"Module {module_name} completed in {module_duration:.1f}s")
+                log_event(
+                    "success",
+                    f"Module {module_name} completed",
+                    duration=round(module_duration, 3),
+                )
+                _record_module_duration(
+                    history, ctx, module_name, module_start, module_duration
+                )
             except Exception as e:
                 log_error(f"Module {module_name} failed: {e}")
+                log_event(
+                    "error",
+                    f"Module {module_name} failed",
+                    duration=round(time.time() - module_start, 3),
+                )
                 notify_pipeline_error(pipeline_name, f"{module_name} failed: {e}")
                 raise typer.Exit(1)
 
         # Pipeline completed successfully
+        set_log_module(None)
         duration = time.time() - start_time
         mins = int(duration / 60)
         secs = int(duration % 60)
 
         log_info("\n" + "=" * 70)
         log_success(f"✅ Pipeline completed successfully in {mins}m {secs}s")
+        for line in ctx.summary:
+            log_info(f"   {line}")
         log_info("=" * 70)
 
         notify_pipeline_end(pipeline_name, duration)
@@ -235,7 +316,29 @@ def execute_pipeline(
         raise typer.Exit(1)
 
 
+def _record_module_duration(
+    history: BuildHistory,
+    ctx: Context,
+    module_name: str,
+    started_at: float,
+    duration: float,
+) -> None:
+    """Append a module run to build history (never fails the pipeline)"""
+    try:
+        history.record(
+            module_name,
+            get_platform(),
+            ctx.architecture,
+            ctx.build_type,
+            duration,
+            started_at=started_at,
+        )
+    except Exception as e:
+        log_warning(f"Failed to record build history for {module_name}: {e}")
+
+
 def main(
+    typer_ctx: typer.Context,
     config: Optional[Path] = typer.Option(
         None,
         "--config",
@@ -255,6 +358,11 @@ def main(
         "-l",
         help="List all available modules and exit",
     ),
+    plan: bool = typer.Option(
+        False,
+        "--plan",
+        help="Show predicted module durations from build history and exit",
+    ),
     # Pipeline phase flags (auto-ordered execution)
     setup: bool = typer.Option(
         False,
@@ -305,6 +413,29 @@ def main(
         "-S",
         help="Path to Chromium source directory",
     ),
+    jobs: Optional[str] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Compile parallelism: default (autoninja), auto (from cores and free "
+        "memory, retries OOM-killed edges at lower -j) or a job count. "
+        "Default: build.jobs in YAML, BROWSEROS_COMPILE_JOBS env or default",
+    ),
+    clean_mode: Optional[str] = typer.Option(
+        None,
+        "--clean-mode",
+        help="What the clean module resets: full (git reset/clean + remove out dir), "
+        "sources-only (git reset/clean, keep out dir) or patched-files-only "
+        "(reset only files touched by patches/chromium_files/resources, keep out dir). "
+        "Default: build.clean_mode in YAML, BROWSEROS_CLEAN_MODE env or full",
+    ),
+    console: Optional[str] = typer.Option(
+        None,
+        "--console",
+        help="Command output on console: full (every line) or progress "
+        "(collapse ninja [N/M] lines into one status line). "
+        "Default: BROWSEROS_CONSOLE env or full",
+    ),
 ):
     """BrowserOS Build System - Modular pipeline executor
 
@@ -328,10 +459,22 @@ def main(
     List Available:
       browseros build --list                   # Show all modules and phases
 
+    \b
+    Plan (predicted durations from build history):
+      browseros build --setup --build --plan
+
+    \b
+    Analyze Last Compile:
+      browseros build analyze -S /path/to/chromium
+
     Note: Phase flags always execute in correct order regardless of how you write them.
           --sign and --package auto-select platform (macos/windows/linux)
     """
 
+    # Sub-commands (e.g. analyze) handle their own options
+    if typer_ctx.invoked_subcommand is not None:
+        return
+
     # Handle --list flag
     if list_modules:
         show_available_modules(AVAILABLE_MODULES)
@@ -376,6 +519,13 @@ def main(
             log_error("Remove the conflicting flags or don't use --config")
             raise typer.Exit(1)
 
+    if console is not None:
+        try:
+            set_console_mode(console)
+        except ValueError as e:
+            log_error(str(e))
+            raise typer.Exit(1)
+
     log_info("🚀 BrowserOS Build System")
     log_info("=" * 70)
 
@@ -388,6 +538,8 @@ def main(
         "chromium_src": chromium_src,
         "arch": arch,
         "build_type": build_type,
+        "jobs": jobs,
+        "clean_mode": clean_mode,
         "modules": modules,
         "setup": setup,
         "prep": prep,
@@ -409,12 +561,20 @@ def main(
         pipeline = resolve_pipeline(
             cli_args,
             config_data,
-            execution_order=EXECUTION_ORDER,
+            execution_order=get_execution_order(),
         )
     except ValueError as e:
         log_error(str(e))
         raise typer.Exit(1)
 
+    # --plan: predict durations from history instead of executing
+    if plan:
+        validate_pipeline(pipeline, AVAILABLE_MODULES)
+        show_pipeline_plan(
+            pipeline, get_platform(), ctx.architecture, ctx.build_type
+        )
+        return
+
     # Show execution plan for flag-based mode
     if has_flags:
         log_info("\n📋 Execution Plan (auto-ordered):")
@@ -471,3 +631,95 @@ def main(
 
     # Execute pipeline
     execute_pipeline(ctx, pipeline, AVAILABLE_MODULES, pipeline_name="build")
+
+
+def analyze(
+    chromium_src: Optional[Path] = typer.Option(
+        None,
+        "--chromium-src",
+        "-S",
+        help="Path to Chromium source directory (default: CHROMIUM_SRC env)",
+    ),
+    arch: Optional[str] = typer.Option(
+        None,
+        "--arch",
+        "-a",
+        help="Architecture whose out dir to analyze (default: platform arch)",
+    ),
+    out_dir: Optional[Path] = typer.Option(
+        None,
+        "--out-dir",
+        "-o",
+        help="Explicit out dir (overrides --arch), e.g. out/Default_arm64",
+    ),
+    top: int = typer.Option(20, "--top", "-n", help="Rows per report section"),
+    depth: int = typer.Option(
+        3, "--depth", help="Directory depth for per-directory aggregates"
+    ),
+    buckets: int = typer.Option(
+        20, "--buckets", help="Time buckets for the parallelism timeline"
+    ),
+    baseline: Optional[str] = typer.Option(
+        None, "--baseline", "-b", help="Diff against this saved baseline"
+    ),
+    save_baseline: Optional[str] = typer.Option(
+        None, "--save-baseline", help="Save this build's timings as a named baseline"
+    ),
+):
+    """Analyze .ninja_log of the most recent compile
+
+    Reports slowest targets, per-directory time, the estimated critical path,
+    parallelism over time, and optionally a diff against a saved baseline.
+
+    \b
+    Examples:
+      browseros build analyze -S /chromium
+      browseros build analyze -S /chromium --save-baseline before-patch
+      browseros build analyze -S /chromium --baseline before-patch
+    """
+    from ..common.env import EnvConfig
+    from ..modules.compile.ninja_log import (
+        load_baseline,
+        parse_ninja_log,
+        report,
+        save_baseline as save_ninja_baseline,
+    )
+
+    env = EnvConfig()
+    if chromium_src is None and env.chromium_src:
+        chromium_src = Path(env.chromium_src)
+
+    if out_dir is not None and out_dir.is_absolute():
+        build_dir = out_dir
+    elif chromium_src is None:
+        log_error("Chromium source required: --chromium-src or CHROMIUM_SRC")
+        raise typer.Exit(1)
+    else:
+        # Same layout as Context.out_dir
+        build_dir = chromium_src / (
+            out_dir or Path("out") / f"Default_{arch or get_platform_arch()}"
+        )
+
+    log_path = build_dir / ".ninja_log"
+    if not log_path.exists():
+        log_error(f"No .ninja_log found: {log_path}")
+        raise typer.Exit(1)
+
+    baseline_data = None
+    if baseline:
+        baseline_data = load_baseline(baseline)
+        if baseline_data is None:
+            log_error(f"Baseline not found: {baseline}")
+            raise typer.Exit(1)
+
+    log_info(f"📊 Analyzing {log_path}")
+    edges = parse_ninja_log(log_path)
+    if not edges:
+        log_warning("No build entries in .ninja_log")
+        return
+
+    report(edges, top=top, depth=depth, buckets=buckets, baseline=baseline_data)
+
+    if save_baseline:
+        path = save_ninja_baseline(edges, save_baseline)
+        log_success(f"Saved baseline '{save_baseline}': {path}")
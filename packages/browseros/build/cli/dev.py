@@ -18,8 +18,15 @@ from ..common.context import Context
 from ..common.utils import log_info, log_error, log_success, log_warning
 
 
-def create_build_context(chromium_src: Optional[Path] = None) -> Optional[Context]:
-    """Create BuildContext for dev CLI operations"""
+def create_build_context(
+    chromium_src: Optional[Path] = None, architecture: str = "", build_type: str = "debug"
+) -> Optional[Context]:
+    """Create BuildContext for dev CLI operations
+
+    architecture only matters for commands that use the out dir or evaluate
+    arch conditions (default: platform architecture); build_type only for
+    build-type conditions.
+    """
     try:
         if not chromium_src:
             log_error("Chromium source directory not specified")
@@ -34,8 +41,8 @@ def create_build_context(chromium_src: Optional[Path] = None) -> Optional[Contex
 
         ctx = Context(
             chromium_src=chromium_src,
-            architecture="",  # Not needed for patch operations
-            build_type="debug",  # Not needed for patch operations
+            architecture=architecture,  # Only used to pick the out dir
+            build_type=build_type,  # Not needed for patch operations
         )
 
         return ctx
@@ -94,6 +101,13 @@ def main(
       browseros dev feature list
       browseros dev feature add my-feature HEAD
       browseros dev feature show my-feature
+
+    Build only what changed:
+      browseros dev build-changed
+      browseros dev build-changed --commit HEAD
+
+    Preview resource copies:
+      browseros dev resources --plan
     """
     state.chromium_src = chromium_src
     state.verbose = verbose
@@ -515,6 +529,91 @@ def feature_classify():
         raise typer.Exit(1)
 
 
+# Impact build command
+@app.command(name="build-changed")
+def build_changed(
+    commit: Optional[str] = Option(
+        None, "--commit", "-c", help="browseros commit whose patch changes to build"
+    ),
+    range_start: Optional[str] = Option(
+        None, "--range-start", help="Start commit of range (exclusive)"
+    ),
+    range_end: Optional[str] = Option(
+        None, "--range-end", help="End commit of range (inclusive)"
+    ),
+    arch: str = Option("", "--arch", "-a", help="Out dir architecture (default: platform)"),
+    no_tests: bool = Option(
+        False, "--no-tests", help="Only build owning targets, not test executables"
+    ),
+    dry_run: bool = Option(False, "--dry-run", help="Only print the affected targets"),
+):
+    """Build only the GN targets affected by changed patches.
+
+    Without --commit/--range, uses files in the Chromium checkout modified
+    since the last build. Each file is mapped to its owning GN targets via
+    `gn refs` (cached per out dir), plus the nearest test executable.
+
+    Examples:
+        browseros dev build-changed -S /chromium
+        browseros dev build-changed --commit HEAD --dry-run -S /chromium
+    """
+    ctx = create_build_context(state.chromium_src, architecture=arch)
+    if not ctx:
+        raise typer.Exit(1)
+
+    from ..modules.compile.impact import ImpactCompileModule
+
+    module = ImpactCompileModule()
+    try:
+        module.validate(ctx)
+        module.execute(
+            ctx,
+            commit=commit,
+            range_start=range_start,
+            range_end=range_end,
+            with_tests=not no_tests,
+            dry_run=dry_run,
+        )
+    except Exception as e:
+        log_error(f"Failed to build changed targets: {e}")
+        raise typer.Exit(1)
+
+
+# Resources command
+@app.command(name="resources")
+def resources_cmd(
+    plan: bool = Option(False, "--plan", help="Only print what would be copied"),
+    commit: bool = Option(
+        False, "--commit", help="Commit the changed files of each operation separately"
+    ),
+    arch: str = Option("", "--arch", "-a", help="Architecture for arch conditions"),
+    build_type: str = Option(
+        "debug", "--build-type", "-t", help="Build type for build_type conditions"
+    ),
+):
+    """Copy resources from copy_resources.yaml into Chromium.
+
+    Only new or modified files are written; --plan shows them without
+    touching the checkout.
+
+    Examples:
+        browseros dev resources --plan -S /chromium
+        browseros dev resources --commit -t release -S /chromium
+    """
+    ctx = create_build_context(state.chromium_src, architecture=arch, build_type=build_type)
+    if not ctx:
+        raise typer.Exit(1)
+
+    from ..modules.resources.resources import copy_resources_impl
+
+    try:
+        if not copy_resources_impl(ctx, commit_each=commit, plan_only=plan):
+            raise typer.Exit(1)
+    except FileNotFoundError as e:
+        log_error(str(e))
+        raise typer.Exit(1)
+
+
 # Annotate command
 @app.command(name="annotate")
 def annotate_cmd(
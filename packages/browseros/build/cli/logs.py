@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Logs CLI - Query structured build event logs
+
+Output goes through typer.echo rather than log_info so that querying logs
+doesn't itself create new log files.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from ..common.log_query import (
+    EventFilter,
+    aggregate_events,
+    find_event_files,
+    iter_events,
+    parse_time,
+    slowest_events,
+)
+
+app = typer.Typer(
+    help="Query structured build event logs",
+    no_args_is_help=True,
+    pretty_exceptions_enable=False,
+    pretty_exceptions_show_locals=False,
+)
+
+GROUP_FIELDS = ["module", "level", "cmd", "subprocess_id"]
+
+
+def _split(value: Optional[str]) -> Optional[List[str]]:
+    if value is None:
+        return None
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _format_ts(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_event(event: dict) -> str:
+    duration = event.get("duration")
+    duration_str = f"{duration:9.1f}s" if isinstance(duration, (int, float)) else " " * 10
+    return (
+        f"{_format_ts(event.get('ts', 0))}  {event.get('level', ''):8} "
+        f"{(event.get('module') or '-'):18} {duration_str}  {event.get('message', '')}"
+    )
+
+
+@app.command(name="query")
+def query(
+    module: Optional[str] = typer.Option(
+        None, "--module", "-m", help="Comma-separated module names to include"
+    ),
+    level: Optional[str] = typer.Option(
+        None, "--level", "-l", help="Comma-separated levels (info,warning,error,success,debug)"
+    ),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Start of time range: relative (30m, 12h, 7d, 2w) or ISO date"
+    ),
+    until: Optional[str] = typer.Option(
+        None, "--until", help="End of time range: relative or ISO date"
+    ),
+    contains: Optional[str] = typer.Option(
+        None, "--contains", "-c", help="Only events whose message contains this text"
+    ),
+    group_by: Optional[str] = typer.Option(
+        None, "--group-by", "-g", help=f"Aggregate by field: {', '.join(GROUP_FIELDS)}"
+    ),
+    slowest: Optional[int] = typer.Option(
+        None, "--slowest", "-s", help="Show the N slowest timed events (commands, modules)"
+    ),
+    limit: int = typer.Option(
+        100, "--limit", "-n", help="Max events to print when listing (0 = no limit)"
+    ),
+    logs_dir: Optional[Path] = typer.Option(
+        None, "--logs-dir", help="Logs directory (default: packages/browseros/logs)"
+    ),
+):
+    """Filter and aggregate JSONL build events
+
+    \b
+    Examples:
+      browseros logs query --since 7d --slowest 10          # slowest commands/modules last week
+      browseros logs query --since 7d --group-by module     # time spent per module
+      browseros logs query --level error --since 24h        # all errors from the last day
+      browseros logs query -m compile --group-by cmd        # compile commands aggregated
+    """
+    if group_by is not None and slowest is not None:
+        typer.secho("Use only one of --group-by or --slowest", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+    if group_by is not None and group_by not in GROUP_FIELDS:
+        typer.secho(
+            f"Invalid --group-by field: {group_by} (expected one of {', '.join(GROUP_FIELDS)})",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    try:
+        event_filter = EventFilter(
+            modules=_split(module),
+            levels=_split(level),
+            since=parse_time(since) if since else None,
+            until=parse_time(until) if until else None,
+            contains=contains,
+        )
+    except ValueError as e:
+        typer.secho(f"Invalid time: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+    files = find_event_files(logs_dir, event_filter)
+    if not files:
+        typer.secho("No event logs found for the given range", fg=typer.colors.YELLOW)
+        return
+
+    events = iter_events(files, event_filter)
+
+    if slowest is not None:
+        for event in slowest_events(events, slowest):
+            typer.echo(_format_event(event))
+        return
+
+    if group_by is not None:
+        typer.echo(
+            f"{group_by:30} {'count':>8} {'timed':>6} {'total':>10} {'max':>10} {'avg':>9}  levels"
+        )
+        typer.echo("-" * 100)
+        for group in aggregate_events(events, group_by):
+            avg = group.total_duration / group.timed if group.timed else 0.0
+            levels = ", ".join(f"{k}={v}" for k, v in sorted(group.levels.items()))
+            typer.echo(
+                f"{group.key[:30]:30} {group.count:>8} {group.timed:>6} "
+                f"{group.total_duration:>9.1f}s {group.max_duration:>9.1f}s "
+                f"{avg:>8.1f}s  {levels}"
+            )
+        return
+
+    shown = 0
+    for event in events:
+        if limit and shown >= limit:
+            typer.echo("... (more events; raise --limit to see them)")
+            break
+        typer.echo(_format_event(event))
+        shown += 1
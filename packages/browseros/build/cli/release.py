@@ -10,14 +10,8 @@ from ..common.context import Context
 from ..common.module import ValidationError
 from ..common.utils import log_info, log_error, log_success
 
-from ..modules.release import (
-    AVAILABLE_MODULES,
-    ListModule,
-    AppcastModule,
-    GithubModule,
-    PublishModule,
-    DownloadModule,
-)
+# Release modules pull in boto3/requests - imported inside commands so that
+# other CLI commands don't pay for them at startup
 
 app = typer.Typer(
     help="Release automation commands",
@@ -113,6 +107,8 @@ def main(
       browseros release --show-modules
     """
     if show_modules:
+        from ..modules.release import AVAILABLE_MODULES
+
         log_info("\n📦 Available Release Modules:")
         log_info("-" * 50)
         for name, module_class in AVAILABLE_MODULES.items():
@@ -141,6 +137,13 @@ def main(
         log_error("--version is required for this operation")
         raise typer.Exit(1)
 
+    from ..modules.release import (
+        ListModule,
+        AppcastModule,
+        PublishModule,
+        DownloadModule,
+    )
+
     # Create context
     release_ctx = create_release_context(version or "")
 
@@ -194,6 +197,8 @@ def github_create(
       browseros release github create --version 0.31.0 --publish  # Also publish to download/
       browseros release github create --version 0.31.0 --no-draft # Create published release
     """
+    from ..modules.release import GithubModule, PublishModule
+
     ctx = create_release_context(version, repo)
 
     log_info(f"🚀 Creating GitHub release for v{version}")
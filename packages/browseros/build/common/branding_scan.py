@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Tree-wide branding scan
+
+string_replaces only rebrands a hand-maintained list of .grd files, so
+upstream strings leak wherever the list is incomplete. The scanner walks
+chromium_src for resource files (globs below) and finds the ones that
+contain any branding pattern:
+
+1. One os.scandir walk, pruning excluded directories; "**/*.ext" globs
+   become a suffix-set check instead of one rglob per pattern
+2. Literal prefilter: the branding literals are reduced to a minimal set
+   (a literal containing another one is implied by it; identity rules never
+   change anything) and searched as bytes - in C, via mmap for large files -
+   so the vast majority of files never see a regex or a decode
+3. Per-file cache (size, mtime, content hash, verdict), invalidated when the
+   literal set changes. Unchanged files are skipped without being opened;
+   files touched but not modified are recognised by their hash.
+
+Configured in the build YAML:
+
+    build:
+      branding_scan:
+        mode: report          # report leaks, or `apply` to rebrand them too
+        globs: ["**/*.grd", "**/*.grdp", "**/*.xtb", "**/*.json", "**/*.plist"]
+        exclude: ["out", "third_party", ".git", "node_modules"]
+
+Without explicit globs, `apply` only covers .grd/.grdp/.xtb: .json and
+.plist files hold code identifiers (e.g. ChromeSetting $refs) that a
+blind rewrite breaks, so rebranding them has to be asked for by name.
+
+or in direct mode via BROWSEROS_BRANDING_SCAN=report|apply.
+"""
+
+import fnmatch
+import hashlib
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCAN_MODES = ("report", "apply")
+
+DEFAULT_GLOBS = ["**/*.grd", "**/*.grdp", "**/*.xtb", "**/*.json", "**/*.plist"]
+
+# Default for `apply`: only user-visible string resources get rewritten
+APPLY_DEFAULT_GLOBS = ["**/*.grd", "**/*.grdp", "**/*.xtb"]
+
+# Directory names pruned anywhere in the tree
+DEFAULT_EXCLUDE = ["out", "third_party", ".git", "node_modules"]
+
+# Files at least this big are searched through mmap instead of read()
+MMAP_THRESHOLD = 1024 * 1024
+
+CACHE_VERSION = 1
+
+SCAN_WORKERS = min(16, (os.cpu_count() or 4))
+
+
+@dataclass
+class BrandingScanConfig:
+    """Which files the tree-wide scan covers and what it does with hits"""
+
+    mode: str = "report"
+    globs: List[str] = field(default_factory=lambda: list(DEFAULT_GLOBS))
+    exclude: List[str] = field(default_factory=lambda: list(DEFAULT_EXCLUDE))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BrandingScanConfig":
+        """Build from the `branding_scan` YAML section
+
+        Raises:
+            ValueError: If mode is not supported
+        """
+        mode = str(data.get("mode", "report"))
+        if mode not in SCAN_MODES:
+            raise ValueError(
+                f"Unsupported branding scan mode: {mode} (expected {' or '.join(SCAN_MODES)})"
+            )
+        default_globs = APPLY_DEFAULT_GLOBS if mode == "apply" else DEFAULT_GLOBS
+        return cls(
+            mode=mode,
+            globs=list(data.get("globs") or default_globs),
+            exclude=list(data.get("exclude") or DEFAULT_EXCLUDE),
+        )
+
+
+def minimal_literals(literals: Iterable[str]) -> List[str]:
+    """Drop literals implied by a shorter one they contain
+
+    A file containing "Google Chrome" also contains "Chrome", so only the
+    latter has to be searched for.
+    """
+    unique = sorted(set(l for l in literals if l), key=len)
+    kept: List[str] = []
+    for literal in unique:
+        if not any(k in literal for k in kept):
+            kept.append(literal)
+    return kept
+
+
+class _GlobMatcher:
+    """Glob list split into a suffix fast path and generic fnmatch patterns"""
+
+    def __init__(self, globs: List[str]):
+        self.suffixes = set()
+        self.patterns = []
+        for pattern in globs:
+            tail = pattern[len("**/*") :] if pattern.startswith("**/*") else None
+            if tail and not any(c in tail for c in "*?[/"):
+                self.suffixes.add(tail)
+            else:
+                self.patterns.append(pattern)
+        self.suffix_tuple = tuple(self.suffixes)
+
+    def matches(self, name: str, relative: str) -> bool:
+        if self.suffix_tuple and name.endswith(self.suffix_tuple):
+            return True
+        return any(fnmatch.fnmatch(relative, p) for p in self.patterns)
+
+
+def walk_files(root: Path, globs: List[str], exclude: List[str]) -> Iterable[Tuple[str, os.stat_result]]:
+    """Yield (relative posix path, stat) for files under root matching globs"""
+    matcher = _GlobMatcher(globs)
+    excluded = set(exclude)
+    stack = [("", str(root))]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                relative = prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded and relative not in excluded:
+                            stack.append((relative + "/", entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        if matcher.matches(entry.name, relative):
+                            yield relative, entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+
+
+def _check_file(
+    path: str, size: int, needles: List[bytes], known: Optional[List[Any]]
+) -> Tuple[str, bool]:
+    """(content hash, contains a literal) for one file
+
+    If the content hash matches the cached entry (file touched but not
+    modified, e.g. by a git checkout) the cached verdict is reused.
+    """
+    with open(path, "rb") as f:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+                if known and known[2] == digest:
+                    return digest, known[3]
+                return digest, any(data.find(n) != -1 for n in needles)
+        data = f.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if known and known[2] == digest:
+        return digest, known[3]
+    return digest, any(n in data for n in needles)
+
+
+@dataclass
+class ScanResult:
+    """Files containing a branding literal, plus how the scan got there"""
+
+    hits: List[str] = field(default_factory=list)
+    scanned: int = 0
+    cached: int = 0
+    read: int = 0
+
+    def summary(self) -> str:
+        """e.g. '412310 files: 412002 cached, 308 read, 17 with branding'"""
+        return (
+            f"{self.scanned} files: {self.cached} cached, {self.read} read, "
+            f"{len(self.hits)} with branding"
+        )
+
+
+class BrandingScanner:
+    """Finds files under chromium_src that contain branding literals"""
+
+    def __init__(
+        self,
+        chromium_src: Path,
+        config: BrandingScanConfig,
+        literals: Iterable[str],
+        cache_path: Optional[Path] = None,
+    ):
+        self.chromium_src = chromium_src
+        self.config = config
+        self.literals = minimal_literals(literals)
+        self.needles = [l.encode("utf-8") for l in self.literals]
+        self.cache_path = cache_path
+        self.fingerprint = hashlib.sha256(
+            json.dumps([self.literals, config.globs, config.exclude]).encode()
+        ).hexdigest()
+        self._entries: Dict[str, List[Any]] = {}
+        self._load_cache()
+
+    def _load_cache(self) -> None:
+        if not self.cache_path:
+            return
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION and data.get("fingerprint") == self.fingerprint:
+            self._entries = data.get("files", {})
+
+    def _save_cache(self, entries: Dict[str, List[Any]]) -> None:
+        if not self.cache_path:
+            return
+        data = {"version": CACHE_VERSION, "fingerprint": self.fingerprint, "files": entries}
+        tmp = self.cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, self.cache_path)
+
+    def scan(self) -> ScanResult:
+        result = ScanResult()
+        if not self.needles:
+            return result
+
+        entries: Dict[str, List[Any]] = {}
+        to_read: List[Tuple[str, os.stat_result]] = []
+        own_cache = None
+        if self.cache_path:
+            try:
+                own_cache = self.cache_path.relative_to(self.chromium_src).as_posix()
+            except ValueError:
+                pass
+
+        for relative, st in walk_files(self.chromium_src, self.config.globs, self.config.exclude):
+            if relative == own_cache:
+                continue
+            result.scanned += 1
+            cached = self._entries.get(relative)
+            # [size, mtime_ns, content hash, contains branding]
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                entries[relative] = cached
+                result.cached += 1
+            else:
+                to_read.append((relative, st))
+
+        def check(item: Tuple[str, os.stat_result]) -> Optional[Tuple[str, List[Any]]]:
+            relative, st = item
+            try:
+                digest, found = _check_file(
+                    os.path.join(self.chromium_src, relative),
+                    st.st_size,
+                    self.needles,
+                    self._entries.get(relative),
+                )
+            except (OSError, ValueError):
+                return None
+            return relative, [st.st_size, st.st_mtime_ns, digest, found]
+
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for checked in pool.map(check, to_read):
+                if checked:
+                    relative, entry = checked
+                    entries[relative] = entry
+                    result.read += 1
+
+        result.hits = sorted(path for path, entry in entries.items() if entry[3])
+        self._entries = entries
+        self._save_cache(entries)
+        return result
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Local compiler cache (ccache / sccache) integration
+
+Configured in the build YAML:
+
+    build:
+      compiler_cache:
+        tool: ccache            # or sccache
+        dir: ~/.cache/browseros-ccache
+        max_size: 100G          # cache evicts least-recently-used entries beyond this
+
+or in direct mode via BROWSEROS_COMPILER_CACHE / _DIR / _SIZE env vars.
+
+ConfigureModule adds `cc_wrapper` to args.gn, and CompileModule snapshots the
+cache statistics before and after the build so the hit rate of that compile
+can be reported in the pipeline summary.
+
+CCACHE_BASEDIR is set to the Chromium checkout so cache keys don't contain
+absolute paths - out/Default_arm64 and out/Default_x64 compile with the same
+relative include paths, which lets host-toolchain objects hit across the
+passes of a universal build.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SUPPORTED_TOOLS = ("ccache", "sccache")
+
+
+@dataclass
+class CompilerCacheConfig:
+    """Which cache tool to use, where, and how big it may grow"""
+
+    tool: str = "ccache"
+    dir: Optional[Path] = None
+    max_size: Optional[str] = None  # ccache/sccache size syntax, e.g. "50G"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompilerCacheConfig":
+        """Build from the `compiler_cache` YAML section
+
+        Raises:
+            ValueError: If tool is not supported
+        """
+        tool = str(data.get("tool", "ccache"))
+        if tool not in SUPPORTED_TOOLS:
+            raise ValueError(
+                f"Unsupported compiler cache: {tool} (expected {' or '.join(SUPPORTED_TOOLS)})"
+            )
+        cache_dir = data.get("dir")
+        max_size = data.get("max_size")
+        return cls(
+            tool=tool,
+            dir=Path(cache_dir).expanduser() if cache_dir else None,
+            max_size=str(max_size) if max_size else None,
+        )
+
+    def is_available(self) -> bool:
+        return shutil.which(self.tool) is not None
+
+    def environment(self, chromium_src: Path) -> Dict[str, str]:
+        """Environment variables the cache tool reads"""
+        env = {}
+        if self.tool == "ccache":
+            env["CCACHE_BASEDIR"] = str(chromium_src)
+            # __DATE__/__TIME__ are neutralised by Chromium's build already
+            env["CCACHE_SLOPPINESS"] = "time_macros,include_file_mtime,include_file_ctime"
+            if self.dir:
+                env["CCACHE_DIR"] = str(self.dir)
+            if self.max_size:
+                env["CCACHE_MAXSIZE"] = self.max_size
+        else:
+            if self.dir:
+                env["SCCACHE_DIR"] = str(self.dir)
+            if self.max_size:
+                env["SCCACHE_CACHE_SIZE"] = self.max_size
+        return env
+
+    def apply_environment(self, chromium_src: Path) -> None:
+        """Export the cache settings so gn/autoninja child processes see them"""
+        os.environ.update(self.environment(chromium_src))
+        if self.dir:
+            self.dir.mkdir(parents=True, exist_ok=True)
+
+    def gn_args(self) -> str:
+        """args.gn lines enabling the wrapper"""
+        return f'cc_wrapper = "{self.tool}"\n'
+
+
+@dataclass
+class CacheStats:
+    """Cumulative cache counters at a point in time"""
+
+    hits: int = 0
+    misses: int = 0
+    size_bytes: int = 0
+
+    def __sub__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            hits=self.hits - other.hits,
+            misses=self.misses - other.misses,
+            size_bytes=self.size_bytes - other.size_bytes,
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self) -> str:
+        """e.g. '9120 hits / 310 misses (96.7%), cache +1.2 GB'"""
+        sign = "+" if self.size_bytes >= 0 else "-"
+        return (
+            f"{self.hits} hits / {self.misses} misses ({self.hit_rate * 100:.1f}%), "
+            f"cache {sign}{abs(self.size_bytes) / 1024**3:.1f} GB"
+        )
+
+
+def _parse_ccache_stats(output: str) -> CacheStats:
+    """Parse `ccache --print-stats` (tab-separated key/value, ccache >= 4)"""
+    values = {}
+    for line in output.splitlines():
+        key, _, value = line.partition("\t")
+        if value.strip().isdigit():
+            values[key.strip()] = int(value)
+    return CacheStats(
+        hits=values.get("direct_cache_hit", 0) + values.get("preprocessed_cache_hit", 0),
+        misses=values.get("cache_miss", 0),
+        size_bytes=values.get("cache_size_kibibyte", 0) * 1024,
+    )
+
+
+def _parse_sccache_stats(output: str) -> CacheStats:
+    """Parse `sccache --show-stats --stats-format=json`"""
+    data = json.loads(output)
+    stats = data.get("stats", {})
+    return CacheStats(
+        hits=sum(stats.get("cache_hits", {}).get("counts", {}).values()),
+        misses=sum(stats.get("cache_misses", {}).get("counts", {}).values()),
+        size_bytes=data.get("cache_size") or 0,
+    )
+
+
+def read_cache_stats(config: CompilerCacheConfig) -> Optional[CacheStats]:
+    """Current cumulative statistics (None if the tool can't report them)"""
+    if config.tool == "ccache":
+        cmd, parse = ["ccache", "--print-stats"], _parse_ccache_stats
+    else:
+        cmd, parse = ["sccache", "--show-stats", "--stats-format=json"], _parse_sccache_stats
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            return None
+        return parse(result.stdout)
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return None
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Console rendering of subprocess output for run_command
+
+Two modes:
+- full:     every output line is echoed (default, same as always)
+- progress: ninja-style "[N/M] ..." progress lines are collapsed into a single
+            status line with rate and ETA; every other line (compiler warnings,
+            errors, FAILED: edges, gclient output) is still printed in full
+
+The file log always receives the complete stream regardless of mode - only
+the terminal/CI console is rate-limited.
+
+On a TTY the status line is redrawn in place at most STATUS_INTERVAL_TTY
+times per second. When output is piped (CI log collectors) a plain status
+line is printed every STATUS_INTERVAL_PIPE seconds instead.
+"""
+
+import re
+import shutil
+import sys
+import time
+from collections import deque
+from typing import Deque, Optional, TextIO, Tuple
+
+CONSOLE_MODES = ("full", "progress")
+
+# Seconds between status line updates
+STATUS_INTERVAL_TTY = 0.1
+STATUS_INTERVAL_PIPE = 30.0
+
+# Window for the completion-rate estimate behind the ETA
+RATE_WINDOW_SECONDS = 120.0
+
+# ninja / autoninja default NINJA_STATUS is "[%f/%t] "
+NINJA_PROGRESS = re.compile(r"^\[(\d+)/(\d+)\]\s*(.*)$")
+
+_console_mode: Optional[str] = None
+
+
+def set_console_mode(mode: str) -> None:
+    """Set console mode for all subsequent run_command calls
+
+    Raises:
+        ValueError: If mode is not one of CONSOLE_MODES
+    """
+    global _console_mode
+    if mode not in CONSOLE_MODES:
+        raise ValueError(
+            f"Invalid console mode: {mode} (expected one of {', '.join(CONSOLE_MODES)})"
+        )
+    _console_mode = mode
+
+
+def get_console_mode() -> str:
+    """Get console mode (set_console_mode() > BROWSEROS_CONSOLE env > full)"""
+    if _console_mode is not None:
+        return _console_mode
+
+    from .env import EnvConfig
+
+    mode = EnvConfig().console_mode
+    return mode if mode in CONSOLE_MODES else "full"
+
+
+def _format_eta(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 60}m{seconds % 60:02d}s"
+
+
+class ConsoleRenderer:
+    """Renders a command's output lines to the console according to mode
+
+    Usage:
+        renderer = ConsoleRenderer()
+        for line in lines:
+            renderer.write(line)
+        renderer.close()
+    """
+
+    def __init__(self, mode: Optional[str] = None, stream: Optional[TextIO] = None):
+        self.mode = mode or get_console_mode()
+        self.stream = stream or sys.stdout
+        self.is_tty = self.stream.isatty()
+        self._interval = STATUS_INTERVAL_TTY if self.is_tty else STATUS_INTERVAL_PIPE
+        self._last_render = float("-inf")
+        self._status_visible = False
+        self._pending_status: Optional[str] = None
+        self._samples: Deque[Tuple[float, int]] = deque()
+        self.collapsed_lines = 0
+
+    def write(self, line: str) -> None:
+        """Render one output line (without trailing newline)"""
+        if self.mode == "full":
+            print(line, file=self.stream)
+            return
+
+        match = NINJA_PROGRESS.match(line)
+        if not match:
+            self._clear_status()
+            print(line, file=self.stream)
+            return
+
+        self.collapsed_lines += 1
+        done, total, description = int(match.group(1)), int(match.group(2)), match.group(3)
+        now = time.monotonic()
+        if self._samples and done < self._samples[-1][1]:
+            # ninja restarted counting (e.g. after regenerating build files)
+            self._samples.clear()
+        self._samples.append((now, done))
+        while len(self._samples) > 2 and now - self._samples[0][0] > RATE_WINDOW_SECONDS:
+            self._samples.popleft()
+
+        self._pending_status = self._status_text(done, total, description)
+        if now - self._last_render >= self._interval or done == total:
+            self._render_status(now)
+
+    def close(self) -> None:
+        """Flush the final status line and end it with a newline"""
+        if self.mode == "full":
+            return
+        if self._pending_status is not None:
+            self._render_status(time.monotonic())
+        if self._status_visible:
+            self.stream.write("\n")
+            self._status_visible = False
+        self.stream.flush()
+
+    def _status_text(self, done: int, total: int, description: str) -> str:
+        percent = done * 100 // total if total else 0
+        text = f"[{done}/{total}] {percent:3d}%"
+
+        first_time, first_done = self._samples[0]
+        last_time, _ = self._samples[-1]
+        elapsed = last_time - first_time
+        if elapsed > 0 and done > first_done:
+            rate = (done - first_done) / elapsed
+            text += f" {rate:6.1f}/s ETA {_format_eta((total - done) / rate)}"
+
+        return f"{text}  {description}"
+
+    def _render_status(self, now: float) -> None:
+        status = self._pending_status
+        self._pending_status = None
+        self._last_render = now
+        if status is None:
+            return
+
+        if self.is_tty:
+            width = shutil.get_terminal_size((120, 20)).columns
+            self.stream.write("\r\x1b[K" + status[: width - 1])
+            self._status_visible = True
+        else:
+            self.stream.write(status + "\n")
+        self.stream.flush()
+
+    def _clear_status(self) -> None:
+        if self._status_visible:
+            self.stream.write("\r\x1b[K")
+            self._status_visible = False
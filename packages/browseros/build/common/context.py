@@ -20,6 +20,9 @@ from .utils import (
     IS_MACOS,
 )
 from .env import EnvConfig
+from .compiler_cache import CompilerCacheConfig
+from .snapshots import SnapshotConfig
+from .branding_scan import BrandingScanConfig
 from .paths import get_package_root
 
 
@@ -194,6 +197,12 @@ class Context:
     semantic_version: str = ""  # e.g., "0.31.0" from resources/BROWSEROS_VERSION
     release_version: str = ""  # Explicit version for release operations (overrides semantic_version)
     github_repo: str = ""  # GitHub repo for release operations (owner/repo)
+    compile_jobs: str = "default"  # default | auto | N (see modules/compile/parallelism.py)
+    compiler_cache: Optional[CompilerCacheConfig] = None  # None = no cc_wrapper
+    architectures: List[str] = field(default_factory=list)  # compile_multiarch targets
+    snapshots: Optional[SnapshotConfig] = None  # None = no out-dir snapshots
+    branding_scan: Optional[BrandingScanConfig] = None  # None = listed target_files only
+    clean_mode: str = "full"  # full | sources-only | patched-files-only (see modules/setup/clean.py)
     start_time: float = 0.0
 
     # App names - will be set based on platform
@@ -208,6 +217,9 @@ class Context:
     # New code should use ctx.artifacts (ArtifactRegistry) instead
     artifacts: Dict[str, List[Path]] = field(default_factory=dict)
 
+    # Extra lines for the end-of-pipeline summary (e.g. compiler cache hit rate)
+    summary: List[str] = field(default_factory=list)
+
     # Fixed app path - used by UniversalBuildModule to prevent auto-detection
     # When set, get_app_path() returns this directly instead of auto-detecting
     _fixed_app_path: Optional[Path] = None
@@ -572,3 +584,12 @@ class Context:
     def get_series_patches_dir(self) -> Path:
         """Get series patches directory (GNU Quilt format)"""
         return join_paths(self.root_dir, "series_patches")
+
+    def get_state_dir(self) -> Path:
+        """Directory for build-system caches tied to the Chromium checkout
+
+        The checkout's .git dir when there is one: it survives `git clean`
+        and stays out of `git status`.
+        """
+        git_dir = join_paths(self.chromium_src, ".git")
+        return git_dir if git_dir.is_dir() else self.chromium_src
@@ -8,12 +8,17 @@ It provides type-safe access, defaults, and clear documentation of what each var
 The module automatically loads .env files from the project root on import.
 """
 
+import math
 import os
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
 
+# Peak RSS of a typical chromium clang edge (GB), assumed by auto
+# parallelism when BROWSEROS_COMPILE_MEMORY_PER_JOB_GB is unset
+DEFAULT_MEMORY_PER_JOB_GB = 2.0
+
 
 def _load_dotenv_file():
     """Load .env file from project root"""
@@ -74,6 +79,80 @@ class EnvConfig:
         """Windows depot_tools toolchain setting (0 = use system toolchain)"""
         return os.environ.get("DEPOT_TOOLS_WIN_TOOLCHAIN", "0")
 
+    @property
+    def console_mode(self) -> str:
+        """Console rendering of command output: full (default) or progress"""
+        return os.environ.get("BROWSEROS_CONSOLE", "full")
+
+    @property
+    def compile_jobs(self) -> Optional[str]:
+        """Compile parallelism: default (autoninja), auto (memory-aware) or a job count"""
+        return os.environ.get("BROWSEROS_COMPILE_JOBS")
+
+    @property
+    def compile_memory_per_job_gb(self) -> float:
+        """Memory estimate per compile job (GB) used by auto parallelism
+
+        Falls back to DEFAULT_MEMORY_PER_JOB_GB (with a warning) when the
+        value isn't a positive number.
+        """
+        value = os.environ.get("BROWSEROS_COMPILE_MEMORY_PER_JOB_GB")
+        if not value:
+            return DEFAULT_MEMORY_PER_JOB_GB
+        try:
+            memory = float(value)
+        except ValueError:
+            memory = 0.0
+        if not (math.isfinite(memory) and memory > 0):
+            from .logger import log_warning
+
+            log_warning(
+                f"Invalid BROWSEROS_COMPILE_MEMORY_PER_JOB_GB={value!r} (expected a "
+                f"positive number of GB), using {DEFAULT_MEMORY_PER_JOB_GB:g}"
+            )
+            return DEFAULT_MEMORY_PER_JOB_GB
+        return memory
+
+    @property
+    def compiler_cache(self) -> Optional[str]:
+        """Compiler cache tool for direct mode: ccache or sccache (unset = off)"""
+        return os.environ.get("BROWSEROS_COMPILER_CACHE")
+
+    @property
+    def compiler_cache_dir(self) -> Optional[str]:
+        """Compiler cache directory (default: the tool's own default)"""
+        return os.environ.get("BROWSEROS_COMPILER_CACHE_DIR")
+
+    @property
+    def compiler_cache_size(self) -> Optional[str]:
+        """Compiler cache size limit, e.g. 50G"""
+        return os.environ.get("BROWSEROS_COMPILER_CACHE_SIZE")
+
+    @property
+    def snapshot_dir(self) -> Optional[str]:
+        """Out-dir snapshot store for direct mode (unset = snapshots off)"""
+        return os.environ.get("BROWSEROS_SNAPSHOT_DIR")
+
+    @property
+    def copy_method(self) -> Optional[str]:
+        """Resource copy method: copy, reflink or hardlink (overrides copy_resources.yaml)"""
+        return os.environ.get("BROWSEROS_COPY_METHOD")
+
+    @property
+    def branding_scan(self) -> Optional[str]:
+        """Tree-wide branding scan for direct mode: report or apply (unset = off)"""
+        return os.environ.get("BROWSEROS_BRANDING_SCAN")
+
+    @property
+    def gclient_jobs(self) -> int:
+        """Parallel jobs for gclient sync (default: core count)"""
+        return int(os.environ.get("BROWSEROS_GCLIENT_JOBS") or os.cpu_count() or 8)
+
+    @property
+    def clean_mode(self) -> Optional[str]:
+        """What the clean module resets: full, sources-only or patched-files-only"""
+        return os.environ.get("BROWSEROS_CLEAN_MODE")
+
     # === macOS Code Signing ===
 
     @property
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Build history database for BrowserOS build system
+
+Records per-module durations of every pipeline run in a local SQLite file so
+that future runs can be planned (predicted durations) and regressions spotted
+without any external service.
+
+Rows are keyed by (module, platform, architecture, build_type) - a debug x64
+compile and a release arm64 compile have nothing in common timing-wise.
+"""
+
+import sqlite3
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .paths import get_package_root
+
+# Number of most recent runs considered when computing medians
+HISTORY_WINDOW = 20
+
+# Latest run slower than median by more than this ratio is flagged
+REGRESSION_THRESHOLD = 0.20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS module_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    module TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    arch TEXT NOT NULL,
+    build_type TEXT NOT NULL,
+    duration REAL NOT NULL,
+    started_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_module_runs_key
+    ON module_runs (module, platform, arch, build_type, started_at);
+"""
+
+
+def get_history_db_path() -> Path:
+    """Get path of the build history database (logs/build_history.db)"""
+    return get_package_root() / "logs" / "build_history.db"
+
+
+@dataclass
+class ModuleEstimate:
+    """Predicted duration for a module, derived from historical runs"""
+
+    module: str
+    samples: int
+    median: Optional[float]
+    latest: Optional[float]
+
+    @property
+    def is_regression(self) -> bool:
+        """True if the latest run was >20% slower than the median of prior runs"""
+        if self.median is None or self.latest is None or self.samples < 2:
+            return False
+        return self.latest > self.median * (1 + REGRESSION_THRESHOLD)
+
+
+class BuildHistory:
+    """
+    SQLite-backed store of module durations
+
+    Example:
+        history = BuildHistory()
+        history.record("compile", "macos", "arm64", "release", 5321.4)
+        estimate = history.estimate("compile", "macos", "arm64", "release")
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or get_history_db_path()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def record(
+        self,
+        module: str,
+        platform: str,
+        arch: str,
+        build_type: str,
+        duration: float,
+        started_at: Optional[float] = None,
+    ) -> None:
+        """Append a successful module run to the history"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO module_runs "
+                    "(module, platform, arch, build_type, duration, started_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        module,
+                        platform,
+                        arch,
+                        build_type,
+                        duration,
+                        started_at if started_at is not None else time.time(),
+                    ),
+                )
+        finally:
+            conn.close()
+
+    def recent_durations(
+        self,
+        module: str,
+        platform: str,
+        arch: str,
+        build_type: str,
+        limit: int = HISTORY_WINDOW,
+    ) -> List[float]:
+        """Get most recent durations for a key, newest first"""
+        if not self.db_path.exists():
+            return []
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT duration FROM module_runs "
+                "WHERE module = ? AND platform = ? AND arch = ? AND build_type = ? "
+                "ORDER BY started_at DESC LIMIT ?",
+                (module, platform, arch, build_type, limit),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row[0] for row in rows]
+
+    def estimate(
+        self, module: str, platform: str, arch: str, build_type: str
+    ) -> ModuleEstimate:
+        """Estimate module duration from the median of its recent runs
+
+        The median excludes the latest run when older runs exist, so the latest
+        run can be compared against it for regression detection.
+        """
+        durations = self.recent_durations(module, platform, arch, build_type)
+        if not durations:
+            return ModuleEstimate(module=module, samples=0, median=None, latest=None)
+
+        latest = durations[0]
+        baseline = durations[1:] or durations
+        return ModuleEstimate(
+            module=module,
+            samples=len(durations),
+            median=statistics.median(baseline),
+            latest=latest,
+        )
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '1h 02m', '12m 05s' or '42.0s'"""
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}h {int(seconds % 3600 // 60):02d}m"
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m {int(seconds % 60):02d}s"
+    return f"{seconds:.1f}s"
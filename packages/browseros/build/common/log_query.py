@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Streaming queries over the structured JSONL event logs
+
+Reads logs/events_*.jsonl (plus rotated/compressed .jsonl.gz / .jsonl.zst
+segments) one line at a time - files are never loaded whole, so a week of
+build logs can be filtered and aggregated in constant memory.
+"""
+
+import gzip
+import heapq
+import io
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .paths import get_package_root
+
+EVENT_FILE_GLOB = "events_*.jsonl*"
+
+_RELATIVE_TIME = re.compile(r"^(\d+(?:\.\d+)?)([smhdw])$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_FILE_TIMESTAMP = re.compile(r"events_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})")
+
+
+def get_logs_dir() -> Path:
+    """Get the build logs directory"""
+    return get_package_root() / "logs"
+
+
+def parse_time(value: str, now: Optional[float] = None) -> float:
+    """Parse a relative ('30m', '12h', '7d', '2w') or ISO time into epoch seconds
+
+    Raises:
+        ValueError: If value is neither format
+    """
+    match = _RELATIVE_TIME.match(value.strip())
+    if match:
+        amount, unit = match.groups()
+        return (now if now is not None else time.time()) - float(amount) * _UNIT_SECONDS[unit]
+    return datetime.fromisoformat(value.strip()).timestamp()
+
+
+@dataclass
+class EventFilter:
+    """Criteria an event must match; None means 'any'"""
+
+    modules: Optional[List[str]] = None
+    levels: Optional[List[str]] = None
+    since: Optional[float] = None
+    until: Optional[float] = None
+    contains: Optional[str] = None
+
+    def matches(self, event: Dict[str, Any]) -> bool:
+        ts = event.get("ts", 0)
+        if self.since is not None and ts < self.since:
+            return False
+        if self.until is not None and ts > self.until:
+            return False
+        if self.modules is not None and event.get("module") not in self.modules:
+            return False
+        if self.levels is not None and event.get("level") not in self.levels:
+            return False
+        if self.contains is not None and self.contains not in event.get("message", ""):
+            return False
+        return True
+
+
+def _file_start_time(path: Path) -> Optional[float]:
+    """Start time of the run that wrote path, from its file name"""
+    match = _FILE_TIMESTAMP.search(path.name)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y-%m-%d_%H-%M-%S").timestamp()
+
+
+def _open_text(path: Path) -> io.TextIOBase:
+    """Open a plain, gzip or zstd compressed event file for text reading"""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        import zstandard
+
+        raw = open(path, "rb")
+        return io.TextIOWrapper(
+            zstandard.ZstdDecompressor().stream_reader(raw, closefd=True),
+            encoding="utf-8",
+        )
+    return open(path, "r", encoding="utf-8")
+
+
+def find_event_files(
+    logs_dir: Optional[Path] = None, event_filter: Optional[EventFilter] = None
+) -> List[Path]:
+    """List event files, skipping those that cannot contain matching events
+
+    A file whose run started after `until`, or which was last written before
+    `since`, is skipped without being opened.
+    """
+    logs_dir = logs_dir or get_logs_dir()
+    if not logs_dir.exists():
+        return []
+
+    files = []
+    for path in sorted(logs_dir.glob(EVENT_FILE_GLOB)):
+        if path.name.endswith(".tmp"):
+            continue
+        if event_filter is not None:
+            started = _file_start_time(path)
+            if event_filter.until is not None and started and started > event_filter.until:
+                continue
+            if event_filter.since is not None and path.stat().st_mtime < event_filter.since:
+                continue
+        files.append(path)
+    return files
+
+
+def iter_events(
+    files: Iterable[Path], event_filter: Optional[EventFilter] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream matching events from files, one line at a time
+
+    Malformed lines (e.g. a partially written last line) are skipped.
+    Compressed zstd files are skipped if zstandard is not installed.
+    """
+    for path in files:
+        try:
+            handle = _open_text(path)
+        except (ImportError, OSError):
+            continue
+        with handle:
+            for line in handle:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event_filter is None or event_filter.matches(event):
+                    yield event
+
+
+@dataclass
+class EventGroup:
+    """Aggregate over events sharing a group key"""
+
+    key: str
+    count: int = 0
+    timed: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    levels: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, event: Dict[str, Any], timed: bool = True) -> None:
+        """Count event; timed=False leaves its duration out of the totals"""
+        self.count += 1
+        level = event.get("level", "")
+        self.levels[level] = self.levels.get(level, 0) + 1
+        duration = event.get("duration")
+        if timed and isinstance(duration, (int, float)):
+            self.timed += 1
+            self.total_duration += duration
+            self.max_duration = max(self.max_duration, duration)
+
+
+def aggregate_events(
+    events: Iterable[Dict[str, Any]], group_by: str
+) -> List[EventGroup]:
+    """Group events by a field (module, level, cmd, ...), sorted by total duration
+
+    By module, only the module completed/failed events are timed: their
+    duration already spans every command the module ran, so adding the
+    command events too would count each module about twice.
+    """
+    groups: Dict[str, EventGroup] = {}
+    for event in events:
+        key = str(event.get(group_by) or "-")
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = EventGroup(key=key)
+        group.add(event, timed=not (group_by == "module" and "cmd" in event))
+    return sorted(
+        groups.values(), key=lambda g: (g.total_duration, g.count), reverse=True
+    )
+
+
+def slowest_events(events: Iterable[Dict[str, Any]], n: int) -> List[Dict[str, Any]]:
+    """Top-n events by duration (streams; keeps only n events in memory)"""
+    timed = (e for e in events if isinstance(e.get("duration"), (int, float)))
+    return heapq.nlargest(n, timed, key=lambda e: e["duration"])
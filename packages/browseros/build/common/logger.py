@@ -2,83 +2,384 @@
 """
 Logging utilities for the build system
 Provides consistent logging with Typer output and file logging
+
+File logging is asynchronous: log calls only enqueue the message, and a
+background writer thread formats timestamps and writes lines in batches
+(one write + flush per batch instead of per line). The queue is bounded, so a
+flood of subprocess output applies backpressure instead of growing memory.
+
+The log is flushed at exit and whenever an error is logged. Files larger than
+MAX_LOG_BYTES are rotated, and rotated segments as well as logs left over
+from earlier runs are compressed (zstd if available, gzip otherwise).
+
+Alongside the free-form text log, a structured sink writes one JSON object
+per event to logs/events_<timestamp>.jsonl:
+
+    {"ts": 1718000000.123, "level": "info", "module": "compile",
+     "message": "...", "subprocess_id": 3, "duration": 812.4, ...}
+
+`module` is the pipeline module currently running (see set_log_module()).
+Query these files with `browseros logs query`.
 """
 
+import atexit
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
 import typer
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# Rotate the active log file once it grows past this size
+MAX_LOG_BYTES = 256 * 1024 * 1024
+
+# Writer tuning: queue bound (backpressure) and max lines per write batch
+_QUEUE_MAX_LINES = 20000
+_BATCH_MAX_LINES = 2000
+
+# Old logs are only compressed once untouched for this long, so logs of
+# builds still running in another process are left alone
+_COMPRESS_MIN_AGE = 10 * 60
+
+# Sentinel telling the writer thread to exit
+_STOP = object()
+
+try:
+    import zstandard
+
+    _COMPRESS_SUFFIX = ".zst"
+except ImportError:
+    zstandard = None
+    _COMPRESS_SUFFIX = ".gz"
+
+
+def _compress_file(path: Path) -> None:
+    """Compress path to path + .zst/.gz and remove the original"""
+    target = path.with_name(path.name + _COMPRESS_SUFFIX)
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with open(path, "rb") as src, open(tmp, "wb") as dst:
+            if zstandard is not None:
+                zstandard.ZstdCompressor(level=10).copy_stream(src, dst)
+            else:
+                with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6) as gz:
+                    shutil.copyfileobj(src, gz, 1024 * 1024)
+        os.replace(tmp, target)
+        path.unlink()
+    except OSError:
+        # Compression is best-effort - never break logging over it
+        tmp.unlink(missing_ok=True)
+
 
-# Global log file handle
-_log_file = None
+def _compress_old_logs(log_dir: Path, active: List[Path]) -> None:
+    """Compress uncompressed build and event logs from earlier runs"""
+    cutoff = time.time() - _COMPRESS_MIN_AGE
+    old_logs = list(log_dir.glob("build_*.log")) + list(log_dir.glob("events_*.jsonl"))
+    for path in old_logs:
+        if path in active:
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                _compress_file(path)
+        except OSError:
+            continue
 
 
-def _ensure_log_file():
-    """Ensure log file is created with timestamp"""
-    global _log_file
-    if _log_file is None:
-        from .paths import get_package_root
+class _LogWriter:
+    """Background thread that batches queued log lines into the log file"""
 
-        # Create logs directory if it doesn't exist
-        log_dir = get_package_root() / "logs"
-        log_dir.mkdir(exist_ok=True)
+    def __init__(self, log_file_path: Path, header: Optional[str] = None):
+        self.path = log_file_path
+        self._queue: "queue.Queue" = queue.Queue(maxsize=_QUEUE_MAX_LINES)
+        self._segment = 0
+        self._last_second = -1
+        self._last_stamp = ""
+        self._file = self._open(header)
+        # Serialises writes when the thread is gone and callers write directly
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="build-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _open(self, header: Optional[str]):
+        # UTF-8; lone surrogates (e.g. from undecodable subprocess output)
+        # are escaped instead of failing the write
+        log_file = open(self.path, "w", encoding="utf-8", errors="backslashreplace")
+        if header:
+            log_file.write(header)
+            log_file.write("=" * 80 + "\n\n")
+            log_file.flush()
+        return log_file
+
+    def put(self, payload: Any) -> None:
+        item = (time.time(), payload)
+        # Block on a full queue only while the writer is there to drain it
+        while self._thread.is_alive():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+        self._write_batch([item])
+
+    def _format(self, when: float, message: Any) -> str:
+        return f"[{self._timestamp(when)}] {message}\n"
+
+    def flush(self) -> None:
+        """Block until every queued line has been written and flushed"""
+        done = self._queue.all_tasks_done
+        with done:
+            while self._queue.unfinished_tasks and self._thread.is_alive():
+                done.wait(0.5)
+        if not self._thread.is_alive():
+            self._drain()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._drain()
+        self._file.close()
+
+    def _drain(self) -> None:
+        """Write whatever the (dead) writer thread left in the queue"""
+        batch: List[Tuple[float, Any]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+            self._queue.task_done()
+        if batch:
+            self._write_batch(batch)
 
-        # Create log file with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        log_file_path = log_dir / f"build_{timestamp}.log"
-        # Open with UTF-8 encoding to handle any characters
-        _log_file = open(log_file_path, "w", encoding="utf-8")
-        _log_file.write(
-            f"BrowserOS Build Log - Started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    def _write_batch(self, batch: List[Tuple[float, Any]]) -> None:
+        """Write and flush lines; never raises"""
+        lines = []
+        for when, payload in batch:
+            try:
+                lines.append(self._format(when, payload))
+            except Exception:
+                continue  # one unformattable payload must not cost the batch
+        with self._write_lock:
+            try:
+                self._file.write("".join(lines))
+                self._file.flush()
+                if self._file.tell() > MAX_LOG_BYTES:
+                    self._rotate()
+            except Exception:
+                # Logging must never take the build down
+                pass
+
+    def _timestamp(self, when: float) -> str:
+        second = int(when)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_stamp = datetime.fromtimestamp(second).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+        return self._last_stamp
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Tuple[float, Any]] = []
+            item = self._queue.get()
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            taken = 1
+
+            while not stop and len(batch) < _BATCH_MAX_LINES:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            try:
+                if batch:
+                    self._write_batch(batch)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _rotate(self) -> None:
+        """Move the full log aside, compress it, and continue in a fresh file"""
+        self._segment += 1
+        self._file.close()
+        rotated = self.path.with_name(
+            f"{self.path.stem}.{self._segment}{self.path.suffix}"
         )
-        _log_file.write("=" * 80 + "\n\n")
-    return _log_file
+        os.replace(self.path, rotated)
+        self._file = self._open(self._continuation_header(rotated))
+        threading.Thread(target=_compress_file, args=(rotated,), daemon=True).start()
+
+    def _continuation_header(self, rotated: Path) -> Optional[str]:
+        return (
+            f"BrowserOS Build Log - Continued (part {self._segment + 1}), "
+            f"previous part: {rotated.name}{_COMPRESS_SUFFIX}\n"
+        )
+
+
+class _EventWriter(_LogWriter):
+    """Structured sink: one JSON object per line, no headers"""
+
+    def _format(self, when: float, event: Dict[str, Any]) -> str:
+        # default=str: an odd value (Path, exception) shouldn't drop the event
+        return json.dumps({"ts": round(when, 3), **event}, ensure_ascii=False, default=str) + "\n"
+
+    def _continuation_header(self, rotated: Path) -> Optional[str]:
+        return None
+
+
+# Global log writers (text log + structured event log)
+_log_writer: Optional[_LogWriter] = None
+_event_writer: Optional[_EventWriter] = None
+_log_writer_lock = threading.Lock()
+
+# Fields attached to every structured event (e.g. current pipeline module)
+_log_context: Dict[str, Any] = {"module": None}
+
+
+def _ensure_log_file() -> _LogWriter:
+    """Ensure log files and their writer threads are created"""
+    global _log_writer, _event_writer
+    if _log_writer is None:
+        with _log_writer_lock:
+            if _log_writer is None:
+                from .paths import get_package_root
+
+                # Create logs directory if it doesn't exist
+                log_dir = get_package_root() / "logs"
+                log_dir.mkdir(exist_ok=True)
+
+                # Create log file with timestamp
+                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+                log_file_path = log_dir / f"build_{timestamp}.log"
+                event_file_path = log_dir / f"events_{timestamp}.jsonl"
+                _event_writer = _EventWriter(event_file_path)
+                _log_writer = _LogWriter(
+                    log_file_path,
+                    f"BrowserOS Build Log - Started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                )
+
+                threading.Thread(
+                    target=_compress_old_logs,
+                    args=(log_dir, [log_file_path, event_file_path]),
+                    name="build-log-compress",
+                    daemon=True,
+                ).start()
+    return _log_writer
 
 
 def _log_to_file(message: str):
-    """Write message to log file with timestamp"""
-    log_file = _ensure_log_file()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_file.write(f"[{timestamp}] {message}\n")
-    log_file.flush()
+    """Queue message for the log file (timestamped by the writer thread)"""
+    _ensure_log_file().put(message)
+
+
+def log_event(level: str, message: str, **fields: Any):
+    """Write a structured event to the JSONL event log
+
+    Args:
+        level: info, warning, error, success or debug
+        message: Human-readable message (without emoji prefix)
+        **fields: Extra fields, e.g. subprocess_id, duration, cmd, exit_code
+    """
+    _ensure_log_file()
+    writer = _event_writer
+    if writer:
+        writer.put({"level": level, **_log_context, "message": message, **fields})
+
+
+def set_log_module(module: Optional[str]):
+    """Set the pipeline module attached to subsequent structured events"""
+    _log_context["module"] = module
+
+
+def _record(level: str, message: str):
+    """Write message to both the text log and the structured event log"""
+    _log_to_file(f"{level.upper()}: {message}")
+    log_event(level, message)
+
+
+def flush_log_file():
+    """Block until all queued log lines are on disk"""
+    if _log_writer:
+        _log_writer.flush()
+    if _event_writer:
+        _event_writer.flush()
+
+
+def get_log_file_path() -> Optional[Path]:
+    """Get path of the active log file (None if nothing was logged yet)"""
+    return _log_writer.path if _log_writer else None
 
 
 def log_info(message: str):
     """Print info message using Typer"""
     typer.echo(message)
-    _log_to_file(f"INFO: {message}")
+    _record("info", message)
 
 
 def log_warning(message: str):
     """Print warning message with color"""
     typer.secho(f"⚠️  {message}", fg=typer.colors.YELLOW)
-    _log_to_file(f"WARNING: {message}")
+    _record("warning", message)
 
 
 def log_error(message: str):
-    """Print error message to stderr with color"""
+    """Print error message to stderr with color
+
+    Flushes the log file so the error (and everything before it) is on disk
+    even if the process dies right after.
+    """
     typer.secho(f"❌ {message}", fg=typer.colors.RED, err=True)
-    _log_to_file(f"ERROR: {message}")
+    _record("error", message)
+    flush_log_file()
 
 
 def log_success(message: str):
     """Print success message with color"""
     typer.secho(f"✅ {message}", fg=typer.colors.GREEN)
-    _log_to_file(f"SUCCESS: {message}")
+    _record("success", message)
 
 
 def log_debug(message: str, enabled: bool = False):
     """Print debug message if enabled"""
     if enabled:
         typer.secho(f"🔍 {message}", fg=typer.colors.BLUE, dim=True)
-        _log_to_file(f"DEBUG: {message}")
+        _record("debug", message)
 
 
 def close_log_file():
-    """Close the log file if it's open"""
-    global _log_file
-    if _log_file:
-        _log_file.close()
-        _log_file = None
+    """Flush pending lines and close the log files if they're open"""
+    global _log_writer, _event_writer
+    with _log_writer_lock:
+        if _log_writer:
+            _log_writer.close()
+            _log_writer = None
+        if _event_writer:
+            _event_writer.close()
+            _event_writer = None
+
+
+# Drain queued lines before the interpreter exits
+atexit.register(close_log_file)
 
 
 # Export all logging functions
@@ -89,5 +390,9 @@ __all__ = [
     'log_success',
     'log_debug',
     'close_log_file',
+    'flush_log_file',
+    'log_event',
+    'set_log_module',
+    'get_log_file_path',
     '_log_to_file',  # Internal use by utils.run_command
-]
\ No newline at end of file
+]
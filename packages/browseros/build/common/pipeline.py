@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 """Pipeline validation for BrowserOS build system"""
 
-from typing import Dict, List, Type
+from typing import List, Mapping, Optional, Type
+from .history import BuildHistory, format_duration
 from .module import CommandModule
-from .utils import log_error, log_info
+from .registry import LazyModuleRegistry
+from .utils import log_error, log_info, log_warning
 
 
-def validate_pipeline(pipeline: List[str], available_modules: Dict[str, Type[CommandModule]]) -> None:
+def _describe(available_modules: Mapping[str, Type[CommandModule]], module_name: str) -> str:
+    """Module description, without importing the module when the registry is lazy"""
+    if isinstance(available_modules, LazyModuleRegistry):
+        return available_modules.describe(module_name)
+    return available_modules[module_name].description
+
+
+def validate_pipeline(pipeline: List[str], available_modules: Mapping[str, Type[CommandModule]]) -> None:
     """Validate that all modules in pipeline exist in available_modules
     
     Raises SystemExit if validation fails
@@ -24,13 +33,12 @@ def validate_pipeline(pipeline: List[str], available_modules: Dict[str, Type[Com
         
         log_error("\nAvailable modules:")
         for module_name in sorted(available_modules.keys()):
-            module_class = available_modules[module_name]
-            log_info(f"  - {module_name}: {module_class.description}")
+            log_info(f"  - {module_name}: {_describe(available_modules, module_name)}")
         
         raise SystemExit(1)
 
 
-def show_available_modules(available_modules: Dict[str, Type[CommandModule]]) -> None:
+def show_available_modules(available_modules: Mapping[str, Type[CommandModule]]) -> None:
     """Display all available modules with descriptions, grouped by category"""
 
     # Group modules by prefix
@@ -57,8 +65,7 @@ def show_available_modules(available_modules: Dict[str, Type[CommandModule]]) ->
         log_info("-" * 70)
 
         for module_name in group_modules:
-            module_class = available_modules[module_name]
-            log_info(f"  {module_name:20} {module_class.description}")
+            log_info(f"  {module_name:20} {_describe(available_modules, module_name)}")
 
     # Show any modules not in groups (for extensibility)
     all_grouped = set(m for group in groups.values() for m in group)
@@ -68,8 +75,7 @@ def show_available_modules(available_modules: Dict[str, Type[CommandModule]]) ->
         log_info("\nOther:")
         log_info("-" * 70)
         for module_name in ungrouped:
-            module_class = available_modules[module_name]
-            log_info(f"  {module_name:20} {module_class.description}")
+            log_info(f"  {module_name:20} {_describe(available_modules, module_name)}")
 
     log_info("\n" + "=" * 70)
     log_info("Example Usage:")
@@ -78,3 +84,64 @@ def show_available_modules(available_modules: Dict[str, Type[CommandModule]]) ->
     log_info("  browseros build --modules compile,sign_macos,package_macos")
     log_info("  browseros build --config release.yaml")
     log_info("=" * 70 + "\n")
+
+
+def show_pipeline_plan(
+    pipeline: List[str],
+    platform: str,
+    architecture: str,
+    build_type: str,
+    history: Optional[BuildHistory] = None,
+) -> None:
+    """Display predicted duration of each pipeline module from build history
+
+    Predictions are medians of recent runs with the same module, platform,
+    architecture and build type. Modules whose latest run was more than 20%
+    slower than that median are flagged as regressions.
+    """
+    history = history or BuildHistory()
+
+    log_info("\n" + "=" * 70)
+    log_info(f"Build Plan ({platform}/{architecture}/{build_type})")
+    log_info("=" * 70)
+    log_info(f"  {'Module':20} {'Predicted':>10} {'Latest':>10} {'Runs':>5}")
+    log_info("-" * 70)
+
+    total = 0.0
+    unknown = []
+    regressions = []
+
+    for module_name in pipeline:
+        estimate = history.estimate(module_name, platform, architecture, build_type)
+        if estimate.median is None:
+            unknown.append(module_name)
+            log_info(f"  {module_name:20} {'?':>10} {'-':>10} {0:>5}")
+            continue
+
+        total += estimate.median
+        latest = format_duration(estimate.latest) if estimate.latest is not None else "-"
+        line = (
+            f"  {module_name:20} {format_duration(estimate.median):>10} "
+            f"{latest:>10} {estimate.samples:>5}"
+        )
+        if estimate.is_regression:
+            regressions.append(estimate)
+            log_warning(f"{line}  ⬆ regression")
+        else:
+            log_info(line)
+
+    log_info("-" * 70)
+    log_info(f"  {'Total':20} {format_duration(total):>10}")
+    if unknown:
+        log_info(f"  (no history for: {', '.join(unknown)})")
+
+    for estimate in regressions:
+        # is_regression guarantees both are set
+        assert estimate.latest is not None and estimate.median is not None
+        slowdown = (estimate.latest / estimate.median - 1) * 100
+        log_warning(
+            f"{estimate.module}: latest run {format_duration(estimate.latest)} is "
+            f"{slowdown:.0f}% slower than median {format_duration(estimate.median)}"
+        )
+
+    log_info("=" * 70 + "\n")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Lazy module registry for BrowserOS build system
+
+Maps module names to import paths ("package.module:ClassName") plus a
+one-line description, and imports each module class only when it is first
+looked up. This keeps CLI startup
+fast: `browseros build --list` or `browseros dev status` no longer pay for
+importing sign, package and upload modules (and their boto3 dependency)
+unless they are actually used.
+"""
+
+import importlib
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Type
+
+from .module import CommandModule
+
+
+class LazyModuleRegistry(Mapping[str, Type[CommandModule]]):
+    """
+    Read-only mapping of module name -> module class, resolved on first use
+
+    Membership tests, len(), iteration over names and describe() never
+    import anything; only item access does. Resolved classes are cached.
+
+    Example:
+        AVAILABLE_MODULES = LazyModuleRegistry(
+            {"clean": ("..modules.setup.clean:CleanModule", "Clean build artifacts")},
+            package=__package__,
+        )
+        "clean" in AVAILABLE_MODULES       # no import
+        AVAILABLE_MODULES.describe("clean") # no import
+        AVAILABLE_MODULES["clean"]()        # imports build.modules.setup.clean
+    """
+
+    def __init__(self, entries: Dict[str, Tuple[str, str]], package: Optional[str] = None):
+        """
+        Args:
+            entries: Module name -> ("dotted.module.path:ClassName", description)
+            package: Anchor package for relative import paths (pass __package__)
+        """
+        self._import_paths = {name: path for name, (path, _) in entries.items()}
+        self._descriptions = {name: description for name, (_, description) in entries.items()}
+        self._package = package
+        self._resolved: Dict[str, Type[CommandModule]] = {}
+
+    def __getitem__(self, name: str) -> Type[CommandModule]:
+        if name not in self._resolved:
+            import_path = self._import_paths[name]
+            module_path, _, class_name = import_path.partition(":")
+            module = importlib.import_module(module_path, package=self._package)
+            self._resolved[name] = getattr(module, class_name)
+        return self._resolved[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._import_paths)
+
+    def __len__(self) -> int:
+        return len(self._import_paths)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._import_paths
+
+    def import_path(self, name: str) -> str:
+        """Get the import path for a module name without importing it"""
+        return self._import_paths[name]
+
+    def describe(self, name: str) -> str:
+        """Get the description for a module name without importing it"""
+        return self._descriptions[name]
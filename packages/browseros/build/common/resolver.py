@@ -22,7 +22,10 @@ This centralizes ALL configuration resolution in one place.
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 
+from .compiler_cache import CompilerCacheConfig
 from .context import Context
+from .snapshots import SnapshotConfig
+from .branding_scan import BrandingScanConfig
 from .env import EnvConfig
 from .utils import get_platform_arch, log_info
 
@@ -114,10 +117,46 @@ def _resolve_config_mode(
     log_info(f"✓ CONFIG MODE: architecture={architecture} ({arch_source})")
     log_info(f"✓ CONFIG MODE: build_type={build_type} ({build_type_source})")
 
+    # compile_jobs: CLI override > YAML > Env > autoninja default
+    compile_jobs = (
+        cli_args.get("jobs")
+        or build_section.get("jobs")
+        or EnvConfig().compile_jobs
+        or "default"
+    )
+
+    # compiler_cache: YAML only (see common/compiler_cache.py)
+    cache_section = build_section.get("compiler_cache")
+    compiler_cache = CompilerCacheConfig.from_dict(cache_section) if cache_section else None
+
+    # snapshots: YAML only (see common/snapshots.py)
+    snapshot_section = build_section.get("snapshots")
+    snapshots = SnapshotConfig.from_dict(snapshot_section) if snapshot_section else None
+
+    # branding_scan: YAML > Env > off (see common/branding_scan.py)
+    scan_section = build_section.get("branding_scan")
+    if not scan_section and EnvConfig().branding_scan:
+        scan_section = {"mode": EnvConfig().branding_scan}
+    branding_scan = BrandingScanConfig.from_dict(scan_section) if scan_section else None
+
+    # clean_mode: CLI override > YAML > Env > full
+    clean_mode = (
+        cli_args.get("clean_mode")
+        or build_section.get("clean_mode")
+        or EnvConfig().clean_mode
+        or "full"
+    )
+
     return Context(
         chromium_src=chromium_src,
         architecture=architecture,
         build_type=build_type,
+        compile_jobs=str(compile_jobs),
+        compiler_cache=compiler_cache,
+        architectures=list(build_section.get("architectures") or []),
+        snapshots=snapshots,
+        branding_scan=branding_scan,
+        clean_mode=clean_mode,
     )
 
 
@@ -167,10 +206,42 @@ def _resolve_direct_mode(cli_args: Dict[str, Any]) -> Context:
     log_info(f"✓ DIRECT MODE: architecture={architecture} (cli/env/default)")
     log_info(f"✓ DIRECT MODE: build_type={build_type} (cli/default)")
 
+    # compile_jobs: CLI > Env > autoninja default
+    compile_jobs = cli_args.get("jobs") or env.compile_jobs or "default"
+
+    # compiler_cache: Env > off
+    compiler_cache = None
+    if env.compiler_cache:
+        compiler_cache = CompilerCacheConfig.from_dict(
+            {
+                "tool": env.compiler_cache,
+                "dir": env.compiler_cache_dir,
+                "max_size": env.compiler_cache_size,
+            }
+        )
+
+    # snapshots: Env > off
+    snapshots = None
+    if env.snapshot_dir:
+        snapshots = SnapshotConfig.from_dict({"dir": env.snapshot_dir})
+
+    # branding_scan: Env > off
+    branding_scan = None
+    if env.branding_scan:
+        branding_scan = BrandingScanConfig.from_dict({"mode": env.branding_scan})
+
+    # clean_mode: CLI > Env > full
+    clean_mode = cli_args.get("clean_mode") or env.clean_mode or "full"
+
     return Context(
         chromium_src=chromium_src,
         architecture=architecture,
         build_type=build_type,
+        compile_jobs=str(compile_jobs),
+        compiler_cache=compiler_cache,
+        snapshots=snapshots,
+        branding_scan=branding_scan,
+        clean_mode=clean_mode,
     )
 
 
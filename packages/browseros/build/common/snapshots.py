@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Warm out-dir snapshots for fast clean builds
+
+After a successful compile the out dir is stored in a content-addressed
+object store: each file is hashed (sha256), compressed once (zstd if
+zstandard is installed, gzip otherwise) and shared between every snapshot
+that contains the same bytes. A snapshot itself is just a manifest of
+(path, object, mode, mtime) entries, keyed by:
+
+    (Chromium version, args.gn hash, patch-set hash)
+
+A later build whose out dir has never been compiled restores the best match
+before compiling - the exact key, or failing that the newest snapshot with
+the same Chromium version and args.gn ("near" key: only patches differ).
+Files keep their original mtimes, so ninja rebuilds exactly the outputs
+whose inputs have changed since. A restore is all-or-nothing: every object
+is checked before anything is written, and a failure midway removes the
+files restored so far.
+
+Saves and restores hold a shared lock on the store, eviction an exclusive
+one, so evicting never deletes objects an in-flight save (e.g. another
+arch's compile) has written but not yet referenced from a manifest.
+
+Configured in the build YAML:
+
+    build:
+      snapshots:
+        dir: /var/cache/browseros/snapshots
+        keep: 3            # snapshots kept (most recently used first)
+        max_size: 200G     # object store limit; oldest snapshots evicted
+
+or in direct mode via BROWSEROS_SNAPSHOT_DIR.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+_CHUNK_SIZE = 1024 * 1024
+_SIZE_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+MANIFEST_VERSION = 1
+
+# Written by the build system itself, not by ninja
+EXCLUDED_NAMES = {"browseros_gn_refs.json", "browseros_resources_manifest.json"}
+
+HASH_WORKERS = min(16, (os.cpu_count() or 4))
+
+LOCK_NAME = ".lock"
+
+# Without fcntl the store lock only serializes within this process
+_process_lock = threading.Lock()
+
+
+def parse_size(value: str) -> int:
+    """'200G' / '512M' / '1048576' -> bytes
+
+    Raises:
+        ValueError: If value is not a size
+    """
+    text = str(value).strip().upper().rstrip("B")
+    if text and text[-1] in _SIZE_UNITS:
+        return int(float(text[:-1]) * _SIZE_UNITS[text[-1]])
+    return int(text)
+
+
+@dataclass
+class SnapshotConfig:
+    """Where snapshots live and how many/how much to keep"""
+
+    dir: Path
+    keep: int = 3
+    max_size: int = 200 * 1024**3
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SnapshotConfig":
+        """Build from the `snapshots` YAML section
+
+        Raises:
+            ValueError: If dir is missing or a value is invalid
+        """
+        if not data.get("dir"):
+            raise ValueError("snapshots.dir is required")
+        return cls(
+            dir=Path(str(data["dir"])).expanduser(),
+            keep=int(data.get("keep", 3)),
+            max_size=parse_size(data.get("max_size", "200G")),
+        )
+
+
+@dataclass
+class SnapshotKey:
+    chromium_version: str
+    args_hash: str
+    patches_hash: str
+
+    @property
+    def id(self) -> str:
+        return f"{self.chromium_version}-{self.args_hash[:12]}-{self.patches_hash[:12]}"
+
+    def is_near(self, other: "SnapshotKey") -> bool:
+        """Same Chromium and args - only patches differ"""
+        return (
+            self.chromium_version == other.chromium_version
+            and self.args_hash == other.args_hash
+        )
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_tree(root: Path) -> str:
+    """Hash of every file's relative path and content under root"""
+    digest = hashlib.sha256()
+    if root.exists():
+        for path in sorted(p for p in root.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def make_snapshot_key(
+    chromium_version: str, args_file: Path, patches_dir: Path
+) -> SnapshotKey:
+    args_hash = hashlib.sha256(args_file.read_bytes()).hexdigest() if args_file.exists() else ""
+    return SnapshotKey(
+        chromium_version=chromium_version,
+        args_hash=args_hash,
+        patches_hash=hash_tree(patches_dir),
+    )
+
+
+def _walk_out_dir(out_path: Path) -> Iterator[Tuple[str, os.stat_result, bool]]:
+    """(relative path, lstat, is_symlink) for every file and symlink"""
+    stack = [out_path]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.name in EXCLUDED_NAMES:
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                rel = Path(entry.path).relative_to(out_path).as_posix()
+                if stat.S_ISLNK(st.st_mode):
+                    yield rel, st, True
+                elif stat.S_ISDIR(st.st_mode):
+                    stack.append(Path(entry.path))
+                elif stat.S_ISREG(st.st_mode):
+                    yield rel, st, False
+
+
+class SnapshotStore:
+    """Content-addressed store of out-dir snapshots"""
+
+    def __init__(self, config: SnapshotConfig):
+        self.config = config
+        self.objects_dir = config.dir / "objects"
+        self.manifests_dir = config.dir / "snapshots"
+        self.suffix = ".zst" if zstandard is not None else ".gz"
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the store lock: shared for save/restore, exclusive for evict"""
+        if fcntl is None:
+            with _process_lock:
+                yield
+            return
+        self.config.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.config.dir / LOCK_NAME, "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    # === Objects ===
+
+    def _object_path(self, digest: str) -> Optional[Path]:
+        """Existing object for digest (any compression), or None"""
+        base = self.objects_dir / digest[:2] / digest[2:]
+        for suffix in (".zst", ".gz"):
+            path = base.with_name(base.name + suffix)
+            if path.exists():
+                return path
+        return None
+
+    def _put_object(self, source: Path, digest: str) -> int:
+        """Compress source into the store unless present; returns bytes written"""
+        if self._object_path(digest) is not None:
+            return 0
+        target = self.objects_dir / digest[:2] / (digest[2:] + self.suffix)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per thread: identical files may be stored concurrently
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(source, "rb") as src, open(tmp, "wb") as dst:
+            if zstandard is not None:
+                zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+            else:
+                with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=1) as gz:
+                    shutil.copyfileobj(src, gz, _CHUNK_SIZE)
+        os.replace(tmp, target)
+        return target.stat().st_size
+
+    def _get_object(self, digest: str, dest: Path) -> None:
+        source = self._object_path(digest)
+        if source is None:
+            raise FileNotFoundError(f"Snapshot object missing: {digest}")
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            if source.suffix == ".zst":
+                if zstandard is None:
+                    raise RuntimeError("zstandard is required to restore this snapshot")
+                zstandard.ZstdDecompressor().copy_stream(src, dst)
+            else:
+                with gzip.GzipFile(fileobj=src, mode="rb") as gz:
+                    shutil.copyfileobj(gz, dst, _CHUNK_SIZE)
+
+    # === Manifests ===
+
+    def _manifest_path(self, snapshot_id: str) -> Path:
+        return self.manifests_dir / f"{snapshot_id}.json.gz"
+
+    def _read_manifest(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        path = self._manifest_path(manifest["id"])
+        tmp = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, path)
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """All readable manifests, most recently used first"""
+        if not self.manifests_dir.exists():
+            return []
+        manifests = []
+        for path in self.manifests_dir.glob("*.json.gz"):
+            manifest = self._read_manifest(path)
+            if manifest is not None:
+                manifests.append(manifest)
+        return sorted(manifests, key=lambda m: m.get("last_used", 0), reverse=True)
+
+    def find(self, key: SnapshotKey) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Best snapshot for key and how it matched ('exact', 'near' or '')"""
+        near = None
+        for manifest in self.list_snapshots():
+            candidate = SnapshotKey(**manifest["key"])
+            if candidate == key:
+                return manifest, "exact"
+            if near is None and candidate.is_near(key):
+                near = manifest
+        return (near, "near") if near else (None, "")
+
+    # === Save / restore ===
+
+    def save(self, out_path: Path, key: SnapshotKey) -> Dict[str, Any]:
+        """Snapshot out_path under key
+
+        Files whose (size, mtime) match the previous snapshot of this key
+        family reuse its hash instead of being re-read.
+        """
+        with self._locked(exclusive=False):
+            return self._save(out_path, key)
+
+    def _save(self, out_path: Path, key: SnapshotKey) -> Dict[str, Any]:
+        previous, _ = self.find(key)
+        known: Dict[str, Tuple[int, int, str]] = {}
+        if previous is not None:
+            for entry in previous["files"]:
+                known[entry["path"]] = (entry["size"], entry["mtime_ns"], entry["hash"])
+
+        files: List[Dict[str, Any]] = []
+        symlinks: List[Dict[str, str]] = []
+        to_store: List[Tuple[Dict[str, Any], Path]] = []
+        for rel, st, is_link in _walk_out_dir(out_path):
+            if is_link:
+                symlinks.append({"path": rel, "target": os.readlink(out_path / rel)})
+                continue
+            entry = {
+                "path": rel,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "mode": stat.S_IMODE(st.st_mode),
+                "hash": "",
+            }
+            cached = known.get(rel)
+            if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+                entry["hash"] = cached[2]
+            files.append(entry)
+            to_store.append((entry, out_path / rel))
+
+        def store(item: Tuple[Dict[str, Any], Path]) -> int:
+            entry, path = item
+            if not entry["hash"]:
+                entry["hash"] = hash_file(path)
+            return self._put_object(path, entry["hash"])
+
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            written = sum(pool.map(store, to_store))
+
+        now = time.time()
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "id": key.id,
+            "key": key.__dict__,
+            "created": now,
+            "last_used": now,
+            "size": sum(e["size"] for e in files),
+            "files": files,
+            "symlinks": symlinks,
+        }
+        self._write_manifest(manifest)
+        manifest["bytes_written"] = written
+        return manifest
+
+    def restore(self, manifest: Dict[str, Any], out_path: Path) -> int:
+        """Restore a snapshot into out_path without touching existing files
+
+        Files already present (e.g. args.gn and build.ninja just written by
+        configure) are kept. Returns the number of files restored.
+
+        Raises:
+            FileNotFoundError: If any object the snapshot needs is missing
+                (nothing is written)
+            Exception: Whatever stopped the restore midway, after the files
+                restored so far have been removed again
+        """
+        pending = [
+            e for e in manifest["files"] if not (out_path / e["path"]).exists()
+        ]
+        links = [
+            link for link in manifest.get("symlinks", [])
+            if not os.path.lexists(out_path / link["path"])
+        ]
+        restored: List[Path] = []
+
+        def restore_one(entry: Dict[str, Any]) -> None:
+            dest = out_path / entry["path"]
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            restored.append(dest)
+            self._get_object(entry["hash"], dest)
+            os.chmod(dest, entry["mode"])
+            os.utime(dest, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+
+        with self._locked(exclusive=False):
+            missing = {e["hash"] for e in pending if self._object_path(e["hash"]) is None}
+            if missing:
+                raise FileNotFoundError(
+                    f"Snapshot {manifest['id']} is missing {len(missing)} object(s)"
+                )
+
+            try:
+                with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+                    list(pool.map(restore_one, pending))
+                for link in links:
+                    dest = out_path / link["path"]
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    restored.append(dest)
+                    os.symlink(link["target"], dest)
+            except BaseException:
+                for path in restored:
+                    if os.path.lexists(path):
+                        path.unlink()
+                raise
+
+            manifest["last_used"] = time.time()
+            self._write_manifest(manifest)
+        return len(pending)
+
+    # === Retention ===
+
+    def drop(self, snapshot_id: str) -> None:
+        """Remove a snapshot that can't be restored
+
+        Its objects are left for the next evict() to collect if nothing
+        else references them.
+        """
+        with self._locked(exclusive=True):
+            self._manifest_path(snapshot_id).unlink(missing_ok=True)
+
+    def _object_bytes(self) -> Dict[str, int]:
+        """On-disk size of every object, by digest"""
+        sizes = {}
+        if not self.objects_dir.exists():
+            return sizes
+        for prefix in os.scandir(self.objects_dir):
+            if not prefix.is_dir():
+                continue
+            for obj in os.scandir(prefix.path):
+                name = obj.name.split(".", 1)[0]
+                sizes[prefix.name + name] = obj.stat().st_size
+        return sizes
+
+    def evict(self, protect: Optional[str] = None) -> Tuple[int, int]:
+        """Apply keep/max_size, then delete unreferenced objects
+
+        Snapshots are dropped least recently used first; `protect` (the
+        snapshot just saved) is never dropped.
+
+        Returns:
+            (snapshots removed, bytes freed)
+        """
+        with self._locked(exclusive=True):
+            return self._evict(protect)
+
+    def _evict(self, protect: Optional[str]) -> Tuple[int, int]:
+        snapshots = self.list_snapshots()
+        kept = snapshots[: self.config.keep]
+        dropped = snapshots[self.config.keep :]
+        if protect and protect not in {m["id"] for m in kept}:
+            kept = [m for m in snapshots if m["id"] == protect] + kept[:-1]
+            dropped = [m for m in snapshots if m not in kept]
+
+        sizes = self._object_bytes()
+
+        def referenced(manifests: List[Dict[str, Any]]) -> set:
+            return {e["hash"] for m in manifests for e in m["files"]}
+
+        while len(kept) > 1:
+            live = referenced(kept)
+            if sum(sizes.get(d, 0) for d in live) <= self.config.max_size:
+                break
+            victim = next((m for m in reversed(kept) if m["id"] != protect), None)
+            if victim is None:
+                break
+            kept.remove(victim)
+            dropped.append(victim)
+
+        for manifest in dropped:
+            self._manifest_path(manifest["id"]).unlink(missing_ok=True)
+
+        live = referenced(kept)
+        freed = 0
+        for digest, size in sizes.items():
+            if digest not in live:
+                path = self._object_path(digest)
+                if path is not None:
+                    path.unlink(missing_ok=True)
+                    freed += size
+        return len(dropped), freed
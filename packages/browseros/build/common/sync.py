@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Content-aware file sync primitives for the prep phase
+
+Ninja decides what to rebuild from mtimes, so rewriting a file with identical
+content (chrome/VERSION, replaced chromium_files, copied resources, branded
+.grd files) makes it recompile everything depending on it. These helpers
+compare content first - size, then bytes - and leave identical files
+untouched, so their mtimes survive.
+
+When a file does change, it is written with a fresh mtime (copyfile, not
+copy2): preserving the source's older mtime could make ninja consider stale
+outputs up to date.
+
+Copy methods for changed files:
+    copy      plain byte copy
+    reflink   copy-on-write clone (FICLONE on btrfs/xfs; falls back to copy
+              where the filesystem or platform can't clone). Fresh inode and
+              mtime, so as safe as a copy.
+    hardlink  share the source inode (falls back to copy across devices).
+              Only for files nothing rewrites in place - an in-place write to
+              the destination would change the BrowserOS source too - and the
+              destination keeps the source's mtime.
+
+Changed files are always written to a temp file next to the destination and
+renamed over it, never rewritten in place: the destination may still be a
+hardlink into the BrowserOS tree from an earlier `hardlink` run, and an
+in-place write would go through it into the source.
+"""
+
+import os
+import shutil
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+_CHUNK_SIZE = 1024 * 1024
+
+COPY_METHODS = ("copy", "reflink", "hardlink")
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+SYNC_WORKERS = min(16, (os.cpu_count() or 4))
+
+
+@dataclass
+class SyncStats:
+    """Counts of files written vs. left untouched by sync operations"""
+
+    written: int = 0
+    unchanged: int = 0
+    bytes_written: int = 0
+    bytes_skipped: int = 0
+    cloned: int = 0  # written as reflinks or hardlinks rather than byte copies
+
+    def add(self, other: "SyncStats") -> None:
+        self.written += other.written
+        self.unchanged += other.unchanged
+        self.bytes_written += other.bytes_written
+        self.bytes_skipped += other.bytes_skipped
+        self.cloned += other.cloned
+
+    def summary(self) -> str:
+        """e.g. '3 written, 120 unchanged (writes avoided)'
+
+        With byte counts (file syncs): '3 written (1.2 MB, 2 cloned),
+        120 unchanged (45.0 MB skipped)'
+        """
+        if not self.bytes_written and not self.bytes_skipped:
+            return f"{self.written} written, {self.unchanged} unchanged (writes avoided)"
+        written = f"{self.written} written ({_format_bytes(self.bytes_written)}"
+        if self.cloned:
+            written += f", {self.cloned} cloned"
+        return (
+            f"{written}), {self.unchanged} unchanged "
+            f"({_format_bytes(self.bytes_skipped)} skipped)"
+        )
+
+
+def _format_bytes(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def files_identical(a: Path, b: Path) -> bool:
+    """True if both files exist with identical content (size check first)"""
+    try:
+        if os.stat(a).st_size != os.stat(b).st_size:
+            return False
+    except FileNotFoundError:
+        return False
+
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk_a = fa.read(_CHUNK_SIZE)
+            if chunk_a != fb.read(_CHUNK_SIZE):
+                return False
+            if not chunk_a:
+                return True
+
+
+def content_matches(data: bytes, path: Path) -> bool:
+    """True if path exists and contains exactly data"""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+    except FileNotFoundError:
+        return False
+    with open(path, "rb") as f:
+        return f.read() == data
+
+
+def _tmp_path(dst: Path) -> Path:
+    """Temp file next to dst, unique per thread"""
+    return dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone src into dst (copy-on-write); False if the filesystem can't"""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            return False
+
+
+def _hardlink(src: Path, dst: Path) -> bool:
+    """Replace dst with a hardlink to src; False if they're on different devices"""
+    tmp = dst.with_name(f".{dst.name}.link-tmp")
+    try:
+        os.link(src, tmp)
+    except OSError:
+        return False
+    os.replace(tmp, dst)
+    return True
+
+
+def write_file(
+    src: Path, dst: Path, stats: Optional[SyncStats] = None, method: str = "copy"
+) -> None:
+    """Write src to dst with the given copy method, without comparing first
+
+    For callers that already know the content differs (see sync_file).
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    cloned = method == "hardlink" and _hardlink(src, dst)
+    if not cloned:
+        # New inode renamed over dst, which may be a hardlink to a source
+        tmp = _tmp_path(dst)
+        try:
+            cloned = method == "reflink" and _reflink(src, tmp)
+            if not cloned:
+                shutil.copyfile(src, tmp)
+            shutil.copymode(src, tmp)
+            os.replace(tmp, dst)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    if stats is not None:
+        stats.written += 1
+        stats.bytes_written += os.stat(dst).st_size
+        stats.cloned += int(cloned)
+
+
+def sync_file(
+    src: Path, dst: Path, stats: Optional[SyncStats] = None, method: str = "copy"
+) -> bool:
+    """Copy src to dst unless dst already has identical content
+
+    Args:
+        method: copy, reflink or hardlink (see module docstring)
+
+    Returns:
+        True if dst was written, False if it was left untouched
+    """
+    if files_identical(src, dst):
+        if stats is not None:
+            stats.unchanged += 1
+            stats.bytes_skipped += os.stat(src).st_size
+        return False
+
+    write_file(src, dst, stats, method)
+    return True
+
+
+def sync_bytes(data: bytes, dst: Path, stats: Optional[SyncStats] = None) -> bool:
+    """Write data to dst unless dst already contains exactly data
+
+    Returns:
+        True if dst was written, False if it was left untouched
+    """
+    if content_matches(data, dst):
+        if stats is not None:
+            stats.unchanged += 1
+            stats.bytes_skipped += len(data)
+        return False
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # Replace rather than rewrite: dst may be a hardlink to a BrowserOS source
+    tmp = _tmp_path(dst)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        if dst.exists():
+            shutil.copymode(dst, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if stats is not None:
+        stats.written += 1
+        stats.bytes_written += len(data)
+    return True
+
+
+def sync_text(
+    text: str, dst: Path, stats: Optional[SyncStats] = None, encoding: str = "utf-8"
+) -> bool:
+    """Write text to dst unless dst already contains it (see sync_bytes)"""
+    return sync_bytes(text.encode(encoding), dst, stats)
+
+
+def sync_tree(src_dir: Path, dst_dir: Path, stats: Optional[SyncStats] = None) -> SyncStats:
+    """Mirror every file under src_dir into dst_dir, skipping identical files
+
+    Like shutil.copytree(dirs_exist_ok=True): extra files already in dst_dir
+    are left alone.
+
+    Returns:
+        Stats for this tree (also accumulated into stats if given)
+    """
+    tree_stats = SyncStats()
+    for src, dst in tree_pairs(src_dir, dst_dir):
+        sync_file(src, dst, tree_stats)
+    if stats is not None:
+        stats.add(tree_stats)
+    return tree_stats
+
+
+def tree_pairs(src_dir: Path, dst_dir: Path) -> Iterable[Tuple[Path, Path]]:
+    """(src, dst) for every file under src_dir, mirrored into dst_dir"""
+    for root, _dirs, files in os.walk(src_dir, followlinks=True):
+        rel_root = Path(root).relative_to(src_dir)
+        for name in files:
+            yield Path(root) / name, dst_dir / rel_root / name
@@ -3,9 +3,11 @@
 Shared utilities for the build system
 """
 
+import itertools
 import os
 import sys
 import subprocess
+import time
 import yaml
 import shutil
 from pathlib import Path
@@ -17,9 +19,15 @@ from .logger import (  # noqa: F401
     log_error,
     log_warning,
     log_success,
+    log_event,
     _log_to_file,
 )
 
+from .console import ConsoleRenderer
+
+# Sequential id for run_command invocations (subprocess_id in event log)
+_subprocess_ids = itertools.count(1)
+
 
 # Platform detection functions
 def IS_WINDOWS() -> bool:
@@ -42,9 +50,18 @@ def run_command(
     cwd: Optional[Path] = None,
     env: Optional[Dict] = None,
     check: bool = True,
+    console_mode: Optional[str] = None,
 ) -> subprocess.CompletedProcess:
-    """Run a command with real-time streaming output and full capture"""
+    """Run a command with real-time streaming output and full capture
+
+    Console output is rendered by ConsoleRenderer: in "progress" mode ninja
+    [N/M] lines collapse into one status line. console_mode overrides the
+    global mode (set_console_mode / BROWSEROS_CONSOLE) for this call. The
+    file log always receives every line.
+    """
     cmd_str = " ".join(cmd)
+    subprocess_id = next(_subprocess_ids)
+    start_time = time.time()
     _log_to_file(f"RUN_COMMAND: 🔧 Running: {cmd_str}")
     log_info(f"🔧 Running: {cmd_str}")
 
@@ -62,14 +79,18 @@ def run_command(
         )
 
         stdout_lines = []
+        renderer = ConsoleRenderer(console_mode)
 
         # Stream output line by line
-        for line in iter(process.stdout.readline, ""):
-            line = line.rstrip()
-            if line:
-                print(line)  # Print to console in real-time
-                _log_to_file(f"RUN_COMMAND: STDOUT: {line}")  # Log to file
-                stdout_lines.append(line)
+        try:
+            for line in iter(process.stdout.readline, ""):
+                line = line.rstrip()
+                if line:
+                    renderer.write(line)  # Print to console in real-time
+                    _log_to_file(f"RUN_COMMAND: STDOUT: {line}")  # Log to file
+                    stdout_lines.append(line)
+        finally:
+            renderer.close()
 
         # Wait for process to complete
         process.wait()
@@ -77,6 +98,15 @@ def run_command(
         _log_to_file(
             f"RUN_COMMAND: ✅ Command completed with exit code: {process.returncode}"
         )
+        log_event(
+            "info" if process.returncode == 0 else "error",
+            f"Command completed: {cmd_str}",
+            subprocess_id=subprocess_id,
+            pid=process.pid,
+            cmd=cmd_str,
+            exit_code=process.returncode,
+            duration=round(time.time() - start_time, 3),
+        )
 
         # Create a CompletedProcess object with captured output
         result = subprocess.CompletedProcess(
@@ -115,6 +145,13 @@ def run_command(
         return e
     except Exception as e:
         _log_to_file(f"RUN_COMMAND: ❌ Unexpected error: {str(e)}")
+        log_event(
+            "error",
+            f"Command error: {cmd_str}: {e}",
+            subprocess_id=subprocess_id,
+            cmd=cmd_str,
+            duration=round(time.time() - start_time, 3),
+        )
         if check:
             log_error(f"Unexpected error running command: {cmd_str}")
             log_error(f"Error: {str(e)}")
@@ -5,13 +5,21 @@ Compilation modules for BrowserOS build system
 This package contains different build strategies:
 - standard: Single-architecture compilation
 - universal: Multi-architecture compilation (macOS universal binaries)
+- ninja_log: .ninja_log analysis (slowest targets, critical path, baselines)
+- parallelism: Memory-aware -j/-l planning and OOM detection
+- impact: Patch-to-target impact analysis for minimal dev rebuilds
+- multiarch: Shared prep, per-arch configure/compile/package (e.g. Linux x64 + arm64)
 """
 
 from .standard import CompileModule, build_target
 from .universal import UniversalBuildModule
+from .impact import ImpactCompileModule
+from .multiarch import MultiArchBuildModule
 
 __all__ = [
     'CompileModule',
     'UniversalBuildModule',
+    'ImpactCompileModule',
+    'MultiArchBuildModule',
     'build_target',
 ]
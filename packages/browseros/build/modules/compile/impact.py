@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Patch-to-target impact analysis for minimal dev rebuilds
+
+Maps the Chromium files touched by changed patches to the GN targets that
+own them (`gn refs`), and optionally to the nearest test executable that
+depends on those targets, so that a small patch can be validated by building
+e.g. `components_unittests` instead of `chrome`.
+
+Changed files come from either:
+- browseros commits (--commit / --range-start + --range-end), via
+  chromium_patches/ changes
+- the Chromium checkout itself: modified/untracked files newer than the last
+  build in the out dir (.ninja_log)
+
+`gn refs` has to load the whole build graph (several seconds per call), so
+results are cached per out dir in browseros_gn_refs.json and invalidated
+whenever build.ninja is regenerated.
+
+If any changed file isn't listed by a GN target (e.g. a header reached only
+through depfiles) its dependents can't be determined, and the plan falls
+back to building chrome.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ...common.context import Context
+from ...common.module import CommandModule, ValidationError
+from ...common.utils import (
+    IS_WINDOWS,
+    join_paths,
+    log_info,
+    log_success,
+    log_warning,
+    run_command,
+)
+
+CACHE_FILE_NAME = "browseros_gn_refs.json"
+CACHE_VERSION = 1
+
+# Targets built when the change can't be narrowed down
+FULL_BUILD_TARGETS = ["chrome", "chromedriver"]
+
+# Changes to these invalidate the build graph itself - no narrowing possible
+GRAPH_FILES = ("BUILD.gn", ".gni", ".gn", "DEPS")
+
+# Parallel `gn refs` processes for uncached files
+GN_QUERY_WORKERS = 4
+
+
+@dataclass
+class ImpactPlan:
+    """Targets to build for a set of changed files"""
+
+    changed_files: List[str]
+    owners: Dict[str, List[str]] = field(default_factory=dict)
+    tests: List[str] = field(default_factory=list)
+    unmapped: List[str] = field(default_factory=list)
+    full_build_reason: Optional[str] = None
+
+    @property
+    def targets(self) -> List[str]:
+        """Ninja targets to build (owning targets + chosen tests)"""
+        if self.full_build_reason:
+            return list(FULL_BUILD_TARGETS)
+        labels = sorted({label for labels in self.owners.values() for label in labels})
+        return [label_to_ninja_target(label) for label in labels + self.tests]
+
+
+def label_to_ninja_target(label: str) -> str:
+    """//chrome/browser/ui:ui -> chrome/browser/ui:ui (GN-generated ninja alias)"""
+    return label[2:] if label.startswith("//") else label
+
+
+def _label_dir(label: str) -> str:
+    return label_to_ninja_target(label).split(":", 1)[0]
+
+
+def _common_prefix_depth(a: str, b: str) -> int:
+    depth = 0
+    for x, y in zip(a.split("/"), b.split("/")):
+        if x != y:
+            break
+        depth += 1
+    return depth
+
+
+def choose_test_target(owner: str, candidates: List[str]) -> Optional[str]:
+    """Pick the test executable most likely to be small and relevant
+
+    Prefers the candidate sharing the longest directory prefix with the
+    owning target, then unit tests over browser/UI tests, then shortest name.
+    """
+    if not candidates:
+        return None
+    owner_dir = _label_dir(owner)
+
+    def score(label: str):
+        name = label.rsplit(":", 1)[-1]
+        is_unit = "unittest" in name or "unit_test" in name
+        return (-_common_prefix_depth(owner_dir, _label_dir(label)), not is_unit, len(label))
+
+    return min(candidates, key=score)
+
+
+class GnRefsCache:
+    """Per-out-dir cache of `gn refs` answers, invalidated by gn gen"""
+
+    def __init__(self, chromium_src: Path, out_dir: str):
+        self.chromium_src = chromium_src
+        self.out_dir = out_dir
+        self.out_path = join_paths(chromium_src, out_dir)
+        self.path = self.out_path / CACHE_FILE_NAME
+        self.stamp = self._graph_stamp()
+        self.owners: Dict[str, List[str]] = {}
+        self.tests: Dict[str, List[str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _graph_stamp(self) -> int:
+        build_ninja = self.out_path / "build.ninja"
+        return build_ninja.stat().st_mtime_ns if build_ninja.exists() else 0
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("stamp") != self.stamp:
+            return
+        self.owners = data.get("owners", {})
+        self.tests = data.get("tests", {})
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "stamp": self.stamp,
+            "owners": self.owners,
+            "tests": self.tests,
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=1, sort_keys=True))
+        os.replace(tmp, self.path)
+
+    def _gn_refs(self, *args: str) -> List[str]:
+        gn = "gn.bat" if IS_WINDOWS() else "gn"
+        result = subprocess.run(
+            [gn, "refs", self.out_dir, *args, "--as=label"],
+            cwd=self.chromium_src,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return []
+        # Targets in secondary toolchains show up as //foo:bar(//toolchain)
+        return sorted(
+            {
+                line.strip()
+                for line in result.stdout.splitlines()
+                if line.startswith("//") and "(" not in line
+            }
+        )
+
+    def owners_of(self, paths: List[str]) -> Dict[str, List[str]]:
+        """GN targets listing each file (cached; misses queried in parallel)"""
+        missing = [p for p in paths if p not in self.owners]
+        if missing:
+            log_info(
+                f"Querying gn refs for {len(missing)} file(s) "
+                f"({len(paths) - len(missing)} cached)"
+            )
+            with ThreadPoolExecutor(max_workers=GN_QUERY_WORKERS) as pool:
+                results = pool.map(lambda p: self._gn_refs(f"//{p}"), missing)
+                for path, labels in zip(missing, results):
+                    self.owners[path] = labels
+            self._dirty = True
+        return {p: self.owners[p] for p in paths}
+
+    def tests_depending_on(self, labels: List[str]) -> Dict[str, List[str]]:
+        """Test executables transitively depending on each label (cached)"""
+        missing = [label for label in labels if label not in self.tests]
+        if missing:
+            with ThreadPoolExecutor(max_workers=GN_QUERY_WORKERS) as pool:
+                results = pool.map(
+                    lambda label: self._gn_refs(
+                        label, "--all", "--testonly=true", "--type=executable"
+                    ),
+                    missing,
+                )
+                for label, tests in zip(missing, results):
+                    self.tests[label] = tests
+            self._dirty = True
+        return {label: self.tests[label] for label in labels}
+
+
+def changed_since_last_build(chromium_src: Path, out_dir: str) -> List[str]:
+    """Modified/untracked files in the checkout newer than the last build"""
+    result = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=all"],
+        cwd=chromium_src,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git status failed: {result.stderr.strip()}")
+
+    ninja_log = join_paths(chromium_src, out_dir, ".ninja_log")
+    last_build = ninja_log.stat().st_mtime if ninja_log.exists() else 0.0
+
+    out_prefix = out_dir.replace("\\", "/").rstrip("/") + "/"
+    changed = []
+    for line in result.stdout.splitlines():
+        if len(line) < 4:
+            continue
+        path = line[3:].split(" -> ")[-1].strip('"')
+        if path.startswith(out_prefix):
+            continue
+        full_path = chromium_src / path
+        try:
+            if full_path.stat().st_mtime > last_build:
+                changed.append(path)
+        except FileNotFoundError:
+            # Deleted files are still listed in their owner's sources
+            changed.append(path)
+    return sorted(changed)
+
+
+def changed_from_patches(
+    ctx: Context,
+    commit: Optional[str] = None,
+    range_start: Optional[str] = None,
+    range_end: Optional[str] = None,
+) -> List[str]:
+    """Chromium files whose patches changed in browseros commit(s)"""
+    from ..apply.apply_changed import (
+        filter_patch_changes,
+        get_changed_files_in_commit,
+        get_changed_files_in_range,
+        get_git_root,
+    )
+
+    git_root = get_git_root(ctx.root_dir)
+    try:
+        patches_prefix = str(ctx.root_dir.relative_to(git_root) / "chromium_patches") + "/"
+    except ValueError:
+        patches_prefix = "chromium_patches/"
+
+    if commit:
+        changes = get_changed_files_in_commit(commit, ctx.root_dir)
+    elif range_start and range_end:
+        changes = get_changed_files_in_range(range_start, range_end, ctx.root_dir)
+    else:
+        raise ValueError("Either commit or both range_start and range_end are required")
+    return sorted({c.chromium_path for c in filter_patch_changes(changes, patches_prefix)})
+
+
+def plan_impact(
+    cache: GnRefsCache, changed_files: List[str], with_tests: bool = True
+) -> ImpactPlan:
+    """Work out the minimal targets covering changed_files"""
+    plan = ImpactPlan(changed_files=changed_files)
+    if not changed_files:
+        return plan
+
+    graph_changes = [f for f in changed_files if f.endswith(GRAPH_FILES)]
+    if graph_changes:
+        plan.full_build_reason = f"build files changed: {', '.join(graph_changes[:3])}"
+        return plan
+
+    for path, labels in cache.owners_of(changed_files).items():
+        if labels:
+            plan.owners[path] = labels
+        else:
+            plan.unmapped.append(path)
+
+    # A file no target lists (e.g. a header reached only through depfiles)
+    # can't be mapped to its dependents - only a full build covers it
+    if plan.unmapped:
+        plan.full_build_reason = (
+            f"no GN target lists {len(plan.unmapped)} changed file(s): "
+            f"{', '.join(plan.unmapped[:3])}"
+        )
+        return plan
+
+    if with_tests:
+        owner_labels = sorted({label for labels in plan.owners.values() for label in labels})
+        chosen = set()
+        for owner, candidates in cache.tests_depending_on(owner_labels).items():
+            test = choose_test_target(owner, candidates)
+            if test:
+                chosen.add(test)
+        plan.tests = sorted(chosen)
+
+    return plan
+
+
+class ImpactCompileModule(CommandModule):
+    """Build only the targets affected by changed patches"""
+
+    produces = []
+    requires = []
+    description = "Build the minimal GN targets affected by changed patches"
+
+    def validate(self, ctx: Context) -> None:
+        if not ctx.chromium_src.exists():
+            raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
+        if not join_paths(ctx.chromium_src, ctx.out_dir, "build.ninja").exists():
+            raise ValidationError(
+                f"Build not configured - build.ninja not found in {ctx.out_dir}"
+            )
+        if not shutil.which("gn.bat" if IS_WINDOWS() else "gn"):
+            raise ValidationError("gn is not available in PATH (depot_tools)")
+
+    def execute(
+        self,
+        ctx: Context,
+        commit: Optional[str] = None,
+        range_start: Optional[str] = None,
+        range_end: Optional[str] = None,
+        with_tests: bool = True,
+        dry_run: bool = False,
+    ) -> None:
+        """Compute the affected targets and build them
+
+        Args:
+            commit: browseros commit whose patch changes to use
+            range_start: Start of browseros commit range (exclusive)
+            range_end: End of browseros commit range (inclusive)
+            with_tests: Also build the nearest test executable per target
+            dry_run: Only print the targets
+        """
+        if commit or range_start or range_end:
+            if not commit and not (range_start and range_end):
+                raise RuntimeError("--range-start and --range-end must be given together")
+            changed = changed_from_patches(ctx, commit, range_start, range_end)
+            log_info(f"📝 {len(changed)} file(s) touched by changed patches")
+        else:
+            changed = changed_since_last_build(ctx.chromium_src, ctx.out_dir)
+            log_info(f"📝 {len(changed)} file(s) changed since last build in {ctx.out_dir}")
+
+        if not changed:
+            log_success("Nothing changed - nothing to build")
+            return
+
+        cache = GnRefsCache(ctx.chromium_src, ctx.out_dir)
+        plan = plan_impact(cache, changed, with_tests=with_tests)
+        cache.save()
+
+        for path, labels in sorted(plan.owners.items()):
+            log_info(f"  {path} -> {', '.join(labels)}")
+        for path in plan.unmapped:
+            log_warning(f"  {path} -> (no GN target)")
+        if plan.tests:
+            log_info(f"🧪 Test targets: {', '.join(plan.tests)}")
+        if plan.full_build_reason:
+            log_warning(f"Falling back to full build: {plan.full_build_reason}")
+
+        targets = plan.targets
+        log_info(f"🎯 Targets: {' '.join(targets)}")
+        if dry_run:
+            return
+
+        autoninja_cmd = "autoninja.bat" if IS_WINDOWS() else "autoninja"
+        run_command([autoninja_cmd, "-C", ctx.out_dir, *targets], cwd=ctx.chromium_src)
+        log_success(f"Built {len(targets)} affected target(s)")
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Multi-Architecture Build Module - Shared prep, fanned-out configure/compile/package
+
+Builds several architectures (e.g. Linux x64 + arm64) from one prepared
+Chromium checkout instead of repeating the whole pipeline per architecture.
+
+Design:
+    Pipeline (once): chromium_replace -> string_replaces -> patches
+    This module:
+        1. Per-arch contexts with separate out dirs (out/Default_{arch})
+        2. resources + configure for each arch
+        3. compile each arch
+        4. package each arch (Linux) as soon as its compile finishes, on a
+           single background worker so packaging overlaps the next compile
+
+Compile scheduling:
+    If copy_resources.yaml has arch-specific operations for this platform
+    that write different archs' files to the same destination, both archs
+    would read the same source path with different content, so compiles run
+    one after another, each right after its own resources step. The shipped
+    config stages such files per arch (e.g. server/binaries/<arch>/), so
+    this only happens for configs that don't.
+
+    Otherwise compiles run concurrently and split one job budget between
+    them (--jobs N, the memory-aware `auto` plan, or the core count).
+
+    Either way chrome/VERSION is written once before the fan-out, and
+    compiler cache hits/misses are reported once for the whole run since the
+    per-arch compiles share one cache.
+"""
+
+import dataclasses
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, List
+
+import yaml
+
+from ...common.compiler_cache import read_cache_stats
+from ...common.context import Context
+from ...common.module import CommandModule, ValidationError
+from ...common.utils import IS_LINUX, get_platform, log_error, log_info, log_success
+
+# Built when the config doesn't list build.architectures
+DEFAULT_ARCHITECTURES = ["x64", "arm64"]
+
+
+def arch_specific_resources(ctx: Context) -> List[str]:
+    """Names of arch-specific copy_resources operations that share a destination
+
+    Arch-specific operations with a destination of their own (e.g.
+    binaries/<arch>/...) don't conflict and aren't listed.
+    """
+    config_path = ctx.get_copy_resources_config()
+    if not config_path.exists():
+        return []
+
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f) or {}
+
+    by_destination: Dict[str, List[dict]] = {}
+    for operation in config.get("copy_operations", []):
+        if not operation.get("arch"):
+            continue
+        build_type = operation.get("build_type")
+        if build_type and build_type != ctx.build_type:
+            continue
+        os_condition = operation.get("os")
+        if os_condition and get_platform() not in os_condition:
+            continue
+        by_destination.setdefault(operation.get("destination", ""), []).append(operation)
+
+    names = []
+    for destination, operations in by_destination.items():
+        if len(operations) > 1:
+            names.extend(op.get("name", destination) for op in operations)
+    return names
+
+
+def total_job_budget(ctx: Context) -> int:
+    """Jobs to share between concurrent compiles"""
+    jobs = ctx.compile_jobs or "default"
+    if jobs.isdigit():
+        return int(jobs)
+    if jobs == "auto":
+        from .parallelism import plan_parallelism
+
+        return plan_parallelism(memory_per_job_gb=ctx.env.compile_memory_per_job_gb).jobs
+    return os.cpu_count() or 1
+
+
+class MultiArchBuildModule(CommandModule):
+    """Configure, compile and package several architectures from one prep"""
+
+    produces = ["built_app"]
+    requires = []
+    description = "Build multiple architectures from one prepared checkout (shared prep)"
+
+    def validate(self, ctx: Context) -> None:
+        architectures = ctx.architectures or DEFAULT_ARCHITECTURES
+        if len(set(architectures)) != len(architectures):
+            raise ValidationError(f"Duplicate architectures: {architectures}")
+        if not ctx.chromium_src.exists():
+            raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
+
+    def execute(self, ctx: Context) -> None:
+        from ..resources.resources import ResourcesModule
+        from ..setup.configure import ConfigureModule
+        from .standard import create_version_file, report_cache_stats
+
+        architectures = ctx.architectures or DEFAULT_ARCHITECTURES
+        arch_contexts = [self._create_arch_context(ctx, arch) for arch in architectures]
+
+        log_info("\n" + "=" * 70)
+        log_info(f"🔀 Multi-arch build: {', '.join(architectures)}")
+        log_info("=" * 70)
+
+        shared_resources = arch_specific_resources(ctx)
+        concurrent = not shared_resources
+        if concurrent:
+            budget = total_job_budget(ctx)
+            per_arch = max(1, budget // len(arch_contexts))
+            log_info(f"Compiling concurrently: {budget} jobs split {per_arch} per arch")
+            for arch_ctx in arch_contexts:
+                arch_ctx.compile_jobs = str(per_arch)
+        else:
+            log_info(
+                "Compiling sequentially - arch-specific resources share source paths: "
+                + ", ".join(shared_resources)
+            )
+
+        # Shared by every arch's compile - written before any of them start
+        create_version_file(ctx)
+
+        cache_before = None
+        if ctx.compiler_cache:
+            ctx.compiler_cache.apply_environment(ctx.chromium_src)
+            cache_before = read_cache_stats(ctx.compiler_cache)
+
+        errors: Dict[str, Exception] = {}
+        package_futures: Dict[str, Future] = {}
+
+        # One packaging worker: packages share staging dirs in the dist dir
+        with ThreadPoolExecutor(max_workers=1) as packager:
+            if concurrent:
+                for arch_ctx in arch_contexts:
+                    ResourcesModule().execute(arch_ctx)
+                    ConfigureModule().execute(arch_ctx)
+
+                with ThreadPoolExecutor(max_workers=len(arch_contexts)) as compilers:
+                    futures = {
+                        compilers.submit(self._compile, arch_ctx): arch_ctx
+                        for arch_ctx in arch_contexts
+                    }
+                    for future in as_completed(futures):
+                        arch_ctx = futures[future]
+                        try:
+                            future.result()
+                        except Exception as e:
+                            errors[arch_ctx.architecture] = e
+                            continue
+                        package_futures[arch_ctx.architecture] = packager.submit(
+                            self._package, arch_ctx
+                        )
+            else:
+                for arch_ctx in arch_contexts:
+                    try:
+                        ResourcesModule().execute(arch_ctx)
+                        ConfigureModule().execute(arch_ctx)
+                        self._compile(arch_ctx)
+                    except Exception as e:
+                        errors[arch_ctx.architecture] = e
+                        break
+                    package_futures[arch_ctx.architecture] = packager.submit(
+                        self._package, arch_ctx
+                    )
+
+            for arch, future in package_futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[f"{arch} (package)"] = e
+
+        report_cache_stats(ctx, cache_before, ", ".join(architectures))
+
+        for arch_ctx in arch_contexts:
+            ctx.summary.extend(arch_ctx.summary)
+            if arch_ctx.artifact_registry.has("built_app"):
+                ctx.artifact_registry.add(
+                    f"built_app_{arch_ctx.architecture}",
+                    arch_ctx.artifact_registry.get("built_app"),
+                )
+
+        if errors:
+            for arch, error in errors.items():
+                log_error(f"{arch}: {error}")
+            raise RuntimeError(f"Multi-arch build failed for: {', '.join(errors)}")
+
+        log_success(f"Multi-arch build complete: {', '.join(architectures)}")
+
+    def _compile(self, arch_ctx: Context) -> None:
+        from .standard import CompileModule
+
+        log_info(f"\n🏗️  Compiling {arch_ctx.architecture} ({arch_ctx.out_dir})...")
+        module = CompileModule(shared_checkout=True)
+        module.validate(arch_ctx)
+        module.execute(arch_ctx)
+        log_success(f"{arch_ctx.architecture} compile complete")
+
+    def _package(self, arch_ctx: Context) -> None:
+        if not IS_LINUX():
+            log_info(f"Skipping packaging for {arch_ctx.architecture} (Linux only)")
+            return
+
+        from ..package.linux import LinuxPackageModule
+
+        log_info(f"\n📦 Packaging {arch_ctx.architecture}...")
+        module = LinuxPackageModule()
+        module.validate(arch_ctx)
+        module.execute(arch_ctx)
+
+    def _create_arch_context(self, base_ctx: Context, arch: str) -> Context:
+        """Context for one architecture, sharing every base build setting"""
+        # replace() reruns __post_init__, which derives out_dir from arch
+        arch_ctx = dataclasses.replace(
+            base_ctx,
+            architecture=arch,
+            artifacts={},
+            summary=[],
+            _fixed_app_path=None,
+        )
+        arch_ctx.paths.gn_flags_file = base_ctx.paths.gn_flags_file
+        return arch_ctx
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Ninja build-log analyzer for BrowserOS build system
+
+Parses out/<dir>/.ninja_log and reports where compile time went:
+slowest targets, per-directory aggregates, an estimated critical path,
+parallelism utilisation over time, and a diff against a saved baseline.
+
+.ninja_log is append-only across builds, one tab-separated line per finished
+edge (start_ms, end_ms, mtime, output, cmdhash) with times relative to the
+start of that build. Entries are appended as edges finish, so a drop in the
+end time marks the start of a newer build. The parser streams the file and
+keeps only entries of the most recent build.
+"""
+
+import bisect
+import gzip
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ...common.paths import get_package_root
+from ...common.utils import log_info, log_warning
+
+# Baselines store durations rounded to ms; ignore noise below this (seconds)
+MIN_REPORTED_DELTA = 0.05
+
+
+@dataclass
+class NinjaEdge:
+    """One build edge (a command), possibly with several outputs"""
+
+    start: float  # seconds since build start
+    end: float
+    outputs: List[str] = field(default_factory=list)
+    cmdhash: str = ""
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def target(self) -> str:
+        return self.outputs[0] if self.outputs else ""
+
+
+def parse_ninja_log(log_path: Path) -> List[NinjaEdge]:
+    """Stream .ninja_log and return the edges of the most recent build
+
+    Outputs produced by the same command (same start, end and cmdhash) are
+    merged into a single edge.
+    """
+    edges: Dict[Tuple[int, int, str], NinjaEdge] = {}
+    last_end = 0
+
+    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) < 5:
+                continue
+            try:
+                start_ms, end_ms = int(parts[0]), int(parts[1])
+            except ValueError:
+                continue
+
+            if end_ms < last_end:
+                # Times went backwards: a newer build starts here
+                edges.clear()
+            last_end = end_ms
+
+            key = (start_ms, end_ms, parts[4])
+            edge = edges.get(key)
+            if edge is None:
+                edge = edges[key] = NinjaEdge(
+                    start=start_ms / 1000.0, end=end_ms / 1000.0, cmdhash=parts[4]
+                )
+            edge.outputs.append(parts[3])
+
+    return list(edges.values())
+
+
+def directory_of(target: str, depth: int = 3) -> str:
+    """Group key for a target: first `depth` source dirs, without obj/ or gen/
+
+    e.g. obj/chrome/browser/ui/views/foo.o -> chrome/browser/ui
+    """
+    parts = target.split("/")[:-1]
+    if parts and parts[0] in ("obj", "gen"):
+        parts = parts[1:]
+    return "/".join(parts[:depth]) or "."
+
+
+@dataclass
+class DirectoryStats:
+    directory: str
+    count: int = 0
+    total: float = 0.0
+    slowest: float = 0.0
+
+
+def aggregate_by_directory(
+    durations: Iterable[Tuple[str, float]], depth: int = 3
+) -> List[DirectoryStats]:
+    """Aggregate (target, duration) pairs per directory, by total time"""
+    groups: Dict[str, DirectoryStats] = {}
+    for target, duration in durations:
+        key = directory_of(target, depth)
+        stats = groups.get(key)
+        if stats is None:
+            stats = groups[key] = DirectoryStats(directory=key)
+        stats.count += 1
+        stats.total += duration
+        stats.slowest = max(stats.slowest, duration)
+    return sorted(groups.values(), key=lambda s: s.total, reverse=True)
+
+
+def estimate_critical_path(edges: List[NinjaEdge]) -> List[NinjaEdge]:
+    """Estimate the critical path from timings alone (no dependency graph)
+
+    Walks back from the last edge to finish: each edge is assumed to have
+    waited on the edge that finished most recently before it started. This
+    approximates the longest dependency chain well enough to see which
+    links (and the idle gaps between them) bound the build's wall time.
+    """
+    if not edges:
+        return []
+
+    by_end = sorted(edges, key=lambda e: e.end)
+    ends = [e.end for e in by_end]
+
+    index = len(by_end) - 1
+    path = [by_end[index]]
+    while path[-1].start > 0:
+        # Latest edge that ended no later than current started (strictly
+        # earlier in end order, so zero-length edges can't loop)
+        index = min(bisect.bisect_right(ends, path[-1].start) - 1, index - 1)
+        if index < 0:
+            break
+        path.append(by_end[index])
+
+    path.reverse()
+    return path
+
+
+def parallelism_timeline(
+    edges: List[NinjaEdge], buckets: int = 20
+) -> Tuple[List[float], float]:
+    """Average number of running edges per time bucket, and bucket width (s)"""
+    wall = max((e.end for e in edges), default=0.0)
+    if wall <= 0:
+        return [], 0.0
+
+    width = wall / buckets
+    busy = [0.0] * buckets
+    for edge in edges:
+        first = min(int(edge.start / width), buckets - 1)
+        last = min(int(edge.end / width), buckets - 1)
+        for i in range(first, last + 1):
+            overlap = min(edge.end, (i + 1) * width) - max(edge.start, i * width)
+            if overlap > 0:
+                busy[i] += overlap
+    return [b / width for b in busy], width
+
+
+def peak_parallelism(edges: List[NinjaEdge]) -> int:
+    """Maximum number of edges running at the same time"""
+    events = sorted(
+        [(e.start, 1) for e in edges] + [(e.end, -1) for e in edges],
+        key=lambda ev: (ev[0], ev[1]),
+    )
+    running = peak = 0
+    for _, delta in events:
+        running += delta
+        peak = max(peak, running)
+    return peak
+
+
+# === Baselines ===
+
+
+def get_baseline_dir() -> Path:
+    """Directory holding saved .ninja_log baselines"""
+    return get_package_root() / "logs" / "ninja_baselines"
+
+
+def save_baseline(edges: List[NinjaEdge], name: str) -> Path:
+    """Save per-target durations of this build as a named baseline"""
+    baseline_dir = get_baseline_dir()
+    baseline_dir.mkdir(parents=True, exist_ok=True)
+    path = baseline_dir / f"{name}.json.gz"
+
+    data = {
+        "version": 1,
+        "created": time.time(),
+        "wall": max((e.end for e in edges), default=0.0),
+        "cpu": sum(e.duration for e in edges),
+        "targets": {e.target: round(e.duration, 3) for e in edges},
+    }
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(data, f)
+    return path
+
+
+def load_baseline(name: str) -> Optional[Dict]:
+    """Load a named baseline (None if it doesn't exist)"""
+    path = get_baseline_dir() / f"{name}.json.gz"
+    if not path.exists():
+        return None
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# === Report ===
+
+
+def _fmt(seconds: float) -> str:
+    if seconds >= 60:
+        return f"{int(seconds // 60)}m{int(seconds % 60):02d}s"
+    return f"{seconds:.1f}s"
+
+
+def report(
+    edges: List[NinjaEdge],
+    top: int = 20,
+    depth: int = 3,
+    buckets: int = 20,
+    baseline: Optional[Dict] = None,
+) -> None:
+    """Log the full analysis of one build's edges"""
+    wall = max((e.end for e in edges), default=0.0)
+    cpu = sum(e.duration for e in edges)
+    peak = peak_parallelism(edges)
+
+    log_info("\n" + "=" * 70)
+    log_info("Ninja Build Analysis")
+    log_info("=" * 70)
+    log_info(f"  Edges:            {len(edges)}")
+    log_info(f"  Wall time:        {_fmt(wall)}")
+    log_info(f"  CPU time (sum):   {_fmt(cpu)}")
+    if wall > 0:
+        log_info(f"  Avg parallelism:  {cpu / wall:.1f} (peak {peak})")
+
+    log_info(f"\n🐢 Slowest {top} targets:")
+    for edge in sorted(edges, key=lambda e: e.duration, reverse=True)[:top]:
+        log_info(f"  {_fmt(edge.duration):>8}  {edge.target}")
+
+    log_info(f"\n📁 Directories by total time (depth {depth}):")
+    dir_stats = aggregate_by_directory(((e.target, e.duration) for e in edges), depth)
+    for stats in dir_stats[:top]:
+        log_info(
+            f"  {_fmt(stats.total):>8}  {stats.count:>6} edges  "
+            f"max {_fmt(stats.slowest):>7}  {stats.directory}"
+        )
+
+    path = estimate_critical_path(edges)
+    busy = sum(e.duration for e in path)
+    log_info(
+        f"\n⛓️  Estimated critical path: {len(path)} edges, "
+        f"{_fmt(busy)} running + {_fmt(max(wall - busy, 0))} waiting"
+    )
+    for edge in sorted(path, key=lambda e: e.duration, reverse=True)[: min(top, 10)]:
+        log_info(f"  {_fmt(edge.duration):>8}  @{_fmt(edge.start):>7}  {edge.target}")
+
+    timeline, width = parallelism_timeline(edges, buckets)
+    if timeline and peak:
+        log_info(f"\n📈 Parallelism over time (bucket {_fmt(width)}, peak {peak}):")
+        for i, value in enumerate(timeline):
+            bar = "█" * int(round(value / peak * 40))
+            log_info(f"  {_fmt(i * width):>8}  {value:6.1f}  {bar}")
+
+    if baseline is not None:
+        _report_diff(edges, baseline, top, depth)
+
+    log_info("=" * 70 + "\n")
+
+
+def _report_diff(edges: List[NinjaEdge], baseline: Dict, top: int, depth: int) -> None:
+    """Log differences between this build and a saved baseline"""
+    current = {e.target: e.duration for e in edges}
+    old = baseline.get("targets", {})
+    wall = max((e.end for e in edges), default=0.0)
+    cpu = sum(current.values())
+
+    log_info("\n🔍 Diff against baseline:")
+    log_info(
+        f"  Wall: {_fmt(baseline.get('wall', 0))} → {_fmt(wall)}   "
+        f"CPU: {_fmt(baseline.get('cpu', 0))} → {_fmt(cpu)}"
+    )
+
+    common = [t for t in current if t in old]
+    added = len(current) - len(common)
+    removed = sum(1 for t in old if t not in current)
+    log_info(f"  Targets: {len(common)} in both, {added} new, {removed} not rebuilt")
+    if len(common) < len(old) / 2:
+        log_warning(
+            "Less than half of the baseline targets were rebuilt - "
+            "compare full builds for meaningful results"
+        )
+
+    new_dirs = {
+        s.directory: s.total
+        for s in aggregate_by_directory(((t, current[t]) for t in common), depth)
+    }
+    old_dirs_common = {
+        s.directory: s.total
+        for s in aggregate_by_directory(((t, old[t]) for t in common), depth)
+    }
+    deltas = sorted(
+        ((d, new_dirs[d] - old_dirs_common.get(d, 0.0)) for d in new_dirs),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    log_info("\n  Directories that got slower (same targets):")
+    for directory, delta in deltas[:top]:
+        if delta < MIN_REPORTED_DELTA:
+            break
+        before = old_dirs_common.get(directory, 0.0)
+        pct = f"{delta / before * 100:+.0f}%" if before else "new"
+        log_info(f"    +{_fmt(delta):>7} ({pct:>5})  {directory}")
+
+    target_deltas = sorted(
+        ((t, current[t] - old[t]) for t in common), key=lambda item: item[1], reverse=True
+    )
+    log_info("\n  Targets that got slower:")
+    for target, delta in target_deltas[:top]:
+        if delta < MIN_REPORTED_DELTA:
+            break
+        log_info(f"    +{_fmt(delta):>7}  {_fmt(old[target])} → {_fmt(current[target])}  {target}")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Memory-aware ninja parallelism for BrowserOS compiles
+
+autoninja's default -j is derived from the core count alone. Chromium
+compile edges take 1-2 GB each and the final `chrome` link several more, so
+on big-core/modest-RAM builders the default pushes the machine into swap or
+gets edges OOM-killed. This module:
+
+- plans -j/-l from core count, MemAvailable and a per-job memory estimate
+- watches /proc/meminfo while ninja runs and reports memory pressure
+- recognises OOM-killed edges in ninja's output so the caller can retry at
+  lower parallelism (ninja only re-runs edges that did not complete)
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from ...common.env import DEFAULT_MEMORY_PER_JOB_GB
+from ...common.utils import log_info, log_warning
+
+MEMINFO_PATH = Path("/proc/meminfo")
+
+GB = 1024**3
+
+# Headroom left for the chrome link and the rest of the system
+DEFAULT_RESERVE_GB = 8.0
+
+# Warn when MemAvailable drops below this while building
+LOW_MEMORY_WATERMARK_GB = 2.0
+
+# Lines reporting an edge killed for lack of memory. Anchored on whole
+# lines so source file names or compiler warnings mentioning "Killed" or
+# "out of memory" don't trigger a retry.
+OOM_SIGNATURES = re.compile(
+    r"^(?:FAILED: .*[\s:(]Killed\)?"
+    r"|\S*clang\S*: error: unable to execute command: Killed"
+    r"|\S+: fatal error: Killed signal terminated program \S+"
+    r"|LLVM ERROR: out of memory"
+    r"|(?:\S*cc1plus: )?virtual memory exhausted\b.*"
+    r"|\S*cc1plus: out of memory allocating \d+ bytes.*)$",
+    re.MULTILINE,
+)
+
+# Exit codes of a SIGKILLed process (shell-style and Popen-style)
+OOM_EXIT_CODES = (137, -9)
+
+
+@dataclass
+class ParallelismPlan:
+    """Chosen ninja parallelism and why"""
+
+    jobs: int
+    load: float
+    reason: str
+
+    def ninja_args(self) -> list:
+        return ["-j", str(self.jobs), "-l", f"{self.load:g}"]
+
+
+def read_meminfo(path: Path = MEMINFO_PATH) -> Optional[Dict[str, int]]:
+    """Parse /proc/meminfo into bytes per field (None if unavailable)"""
+    try:
+        text = path.read_text()
+    except OSError:
+        return None
+
+    info = {}
+    for line in text.splitlines():
+        key, _, rest = line.partition(":")
+        fields = rest.split()
+        if fields and fields[0].isdigit():
+            multiplier = 1024 if len(fields) > 1 and fields[1] == "kB" else 1
+            info[key] = int(fields[0]) * multiplier
+    return info
+
+
+def available_memory(meminfo: Optional[Dict[str, int]] = None) -> Optional[int]:
+    """Currently available memory in bytes (None if it can't be determined)"""
+    meminfo = meminfo if meminfo is not None else read_meminfo()
+    if meminfo and "MemAvailable" in meminfo:
+        return meminfo["MemAvailable"]
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def plan_parallelism(
+    cpu_count: Optional[int] = None,
+    mem_available: Optional[int] = None,
+    memory_per_job_gb: float = DEFAULT_MEMORY_PER_JOB_GB,
+    reserve_gb: float = DEFAULT_RESERVE_GB,
+) -> ParallelismPlan:
+    """Pick -j/-l so that jobs * memory_per_job fits in available memory
+
+    -j is the smaller of the core count and the memory budget; -l is the core
+    count, so ninja also backs off while the machine is already loaded.
+    """
+    cpus = cpu_count or os.cpu_count() or 1
+    if mem_available is None:
+        mem_available = available_memory()
+
+    if mem_available is None:
+        return ParallelismPlan(
+            jobs=cpus, load=float(cpus), reason=f"{cpus} cores (memory unknown)"
+        )
+
+    budget = max(mem_available - reserve_gb * GB, 0)
+    by_memory = max(1, int(budget // (memory_per_job_gb * GB)))
+    jobs = min(cpus, by_memory)
+    limit = "memory" if by_memory < cpus else "cores"
+    reason = (
+        f"{cpus} cores, {mem_available / GB:.1f} GB available, "
+        f"{memory_per_job_gb:g} GB/job + {reserve_gb:g} GB reserve -> limited by {limit}"
+    )
+    return ParallelismPlan(jobs=jobs, load=float(cpus), reason=reason)
+
+
+def looks_like_oom(output: str, returncode: int) -> bool:
+    """True if a failed ninja run shows signs of edges killed for memory"""
+    if returncode in OOM_EXIT_CODES:
+        return True
+    return bool(OOM_SIGNATURES.search(output or ""))
+
+
+class MemoryMonitor:
+    """Samples /proc/meminfo in the background while a build runs
+
+    Usage:
+        with MemoryMonitor() as monitor:
+            run_command([...])
+        log_info(monitor.summary())
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        low_watermark_gb: float = LOW_MEMORY_WATERMARK_GB,
+        meminfo_path: Path = MEMINFO_PATH,
+    ):
+        self.interval = interval
+        self.low_watermark = low_watermark_gb * GB
+        self.meminfo_path = meminfo_path
+        self.min_available: Optional[int] = None
+        self.max_swap_used = 0
+        self.low_memory_samples = 0
+        self._baseline_swap: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.meminfo_path.exists()
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="memory-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def __enter__(self) -> "MemoryMonitor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def sample(self) -> None:
+        """Take one sample (called periodically by the monitor thread)"""
+        info = read_meminfo(self.meminfo_path)
+        if not info or "MemAvailable" not in info:
+            return
+
+        available = info["MemAvailable"]
+        swap_used = info.get("SwapTotal", 0) - info.get("SwapFree", 0)
+        if self._baseline_swap is None:
+            self._baseline_swap = swap_used
+
+        if self.min_available is None or available < self.min_available:
+            self.min_available = available
+        self.max_swap_used = max(self.max_swap_used, swap_used - self._baseline_swap)
+
+        if available < self.low_watermark:
+            self.low_memory_samples += 1
+            if self.low_memory_samples == 1:
+                log_warning(
+                    f"Memory pressure: {available / GB:.1f} GB available "
+                    f"(below {self.low_watermark / GB:g} GB)"
+                )
+
+    def summary(self) -> str:
+        if self.min_available is None:
+            return "Memory: not monitored"
+        text = f"Memory: min {self.min_available / GB:.1f} GB available"
+        if self.max_swap_used > 0:
+            text += f", swap grew by {self.max_swap_used / GB:.1f} GB"
+        if self.low_memory_samples:
+            text += f", {self.low_memory_samples} low-memory samples"
+        return text
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+
+def log_plan(plan: ParallelismPlan) -> None:
+    log_info(f"Using adaptive parallelism: -j {plan.jobs} -l {plan.load:g}")
+    log_info(f"  ({plan.reason})")
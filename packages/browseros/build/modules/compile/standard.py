@@ -1,19 +1,34 @@
 #!/usr/bin/env python3
 """Standard single-architecture build module for BrowserOS"""
 
-import tempfile
 import shutil
-from pathlib import Path
+import subprocess
+from typing import List, Optional
+
 from ...common.module import CommandModule, ValidationError
+from ...common.compiler_cache import CacheStats, read_cache_stats
 from ...common.context import Context
+from ...common.snapshots import SnapshotStore, make_snapshot_key
+from ...common.sync import sync_text
 from ...common.utils import (
     run_command,
+    log_error,
     log_info,
     log_success,
     log_warning,
     join_paths,
     IS_WINDOWS,
 )
+from .parallelism import (
+    MemoryMonitor,
+    ParallelismPlan,
+    log_plan,
+    looks_like_oom,
+    plan_parallelism,
+)
+
+# Times a memory-killed compile is retried at half the previous -j
+MAX_OOM_RETRIES = 2
 
 
 class CompileModule(CommandModule):
@@ -21,6 +36,16 @@ class CompileModule(CommandModule):
     requires = []
     description = "Build BrowserOS using autoninja"
 
+    def __init__(self, shared_checkout: bool = False):
+        """
+        Args:
+            shared_checkout: Set by MultiArchBuildModule, which compiles several
+                archs from one checkout at once. It writes chrome/VERSION and
+                reports compiler cache stats once for the whole run, so this
+                compile skips both.
+        """
+        self.shared_checkout = shared_checkout
+
     def validate(self, ctx: Context) -> None:
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
@@ -32,15 +57,46 @@ class CompileModule(CommandModule):
         if not args_file.exists():
             raise ValidationError(f"Build not configured - args.gn not found: {args_file}")
 
+        jobs = ctx.compile_jobs or "default"
+        if jobs not in ("default", "auto") and not (jobs.isdigit() and int(jobs) > 0):
+            raise ValidationError(
+                f"Invalid compile jobs: {jobs} (expected default, auto or a positive number)"
+            )
+
+        self._verify_resources(ctx)
+
     def execute(self, ctx: Context) -> None:
         log_info("\n🔨 Building BrowserOS (this will take a while)...")
 
-        self._create_version_file(ctx)
+        if not self.shared_checkout:
+            create_version_file(ctx)
 
         autoninja_cmd = "autoninja.bat" if IS_WINDOWS() else "autoninja"
-        log_info("Using default autoninja parallelism")
+        base_cmd = [autoninja_cmd, "-C", ctx.out_dir]
+        targets = ["chrome", "chromedriver"]
+
+        self._restore_snapshot(ctx)
 
-        run_command([autoninja_cmd, "-C", ctx.out_dir, "chrome", "chromedriver"], cwd=ctx.chromium_src)
+        cache_before = None
+        if ctx.compiler_cache:
+            ctx.compiler_cache.apply_environment(ctx.chromium_src)
+            if not self.shared_checkout:
+                cache_before = read_cache_stats(ctx.compiler_cache)
+
+        jobs = ctx.compile_jobs or "default"
+        if jobs == "auto":
+            self._compile_adaptive(ctx, base_cmd, targets)
+        elif jobs == "default":
+            log_info("Using default autoninja parallelism")
+            run_command(base_cmd + targets, cwd=ctx.chromium_src)
+        else:
+            log_info(f"Using fixed parallelism: -j {jobs}")
+            run_command(base_cmd + ["-j", jobs] + targets, cwd=ctx.chromium_src)
+
+        if cache_before is not None:
+            report_cache_stats(ctx, cache_before, ctx.architecture)
+
+        self._save_snapshot(ctx)
 
         app_path = ctx.get_chromium_app_path()
         new_path = ctx.get_app_path()
@@ -52,23 +108,157 @@ class CompileModule(CommandModule):
 
         log_success("Build complete!")
 
-    def _create_version_file(self, ctx: Context) -> None:
-        parts = ctx.browseros_chromium_version.split(".")
-        if len(parts) != 4:
-            log_warning(f"Invalid version format: {ctx.browseros_chromium_version}")
+    def _compile_adaptive(
+        self, ctx: Context, base_cmd: List[str], targets: List[str]
+    ) -> None:
+        """Compile with memory-derived -j/-l, retrying OOM kills at lower -j
+
+        A rerun of ninja only rebuilds edges that didn't complete, so each
+        retry effectively re-runs just the failed edges and their dependents.
+        """
+        plan = plan_parallelism(memory_per_job_gb=ctx.env.compile_memory_per_job_gb)
+        log_plan(plan)
+
+        for attempt in range(MAX_OOM_RETRIES + 1):
+            with MemoryMonitor() as monitor:
+                result = run_command(
+                    base_cmd + plan.ninja_args() + targets,
+                    cwd=ctx.chromium_src,
+                    check=False,
+                )
+            if monitor.enabled:
+                log_info(monitor.summary())
+
+            if result.returncode == 0:
+                return
+
+            if attempt == MAX_OOM_RETRIES or plan.jobs == 1:
+                break
+            if not looks_like_oom(result.stdout, result.returncode):
+                break
+
+            plan = ParallelismPlan(
+                jobs=max(1, plan.jobs // 2),
+                load=plan.load,
+                reason=f"retry {attempt + 1}/{MAX_OOM_RETRIES} after OOM-killed edges",
+            )
+            log_warning(
+                f"Build failed with out-of-memory signature - "
+                f"retrying failed edges with -j {plan.jobs}"
+            )
+
+        raise subprocess.CalledProcessError(
+            result.returncode, result.args, result.stdout, result.stderr
+        )
+
+    def _restore_snapshot(self, ctx: Context) -> None:
+        """Warm a never-compiled out dir from the best matching snapshot"""
+        if not ctx.snapshots:
+            return
+        out_path = join_paths(ctx.chromium_src, ctx.out_dir)
+        if (out_path / ".ninja_log").exists():
+            return
+
+        manifest = None
+        try:
+            store = SnapshotStore(ctx.snapshots)
+            key = make_snapshot_key(
+                ctx.chromium_version, ctx.get_gn_args_file(), ctx.get_patches_dir()
+            )
+            manifest, match = store.find(key)
+            if manifest is None:
+                log_info("No out-dir snapshot for this Chromium version and args.gn")
+                return
+            log_info(f"♻️  Restoring {match} out-dir snapshot {manifest['id']}...")
+            restored = store.restore(manifest, out_path)
+            log_success(f"Restored {restored} files - ninja will rebuild only what changed")
+        except Exception as e:
+            # restore() leaves the out dir as it was, so a cold compile is safe;
+            # drop the snapshot so later builds don't trip over it again
+            log_warning(f"Snapshot restore failed, building from scratch: {e}")
+            if manifest is not None:
+                try:
+                    store.drop(manifest["id"])
+                    log_warning(f"Dropped unusable snapshot {manifest['id']}")
+                except OSError as drop_error:
+                    log_warning(f"Could not drop snapshot {manifest['id']}: {drop_error}")
+
+    def _save_snapshot(self, ctx: Context) -> None:
+        """Snapshot the compiled out dir and apply retention"""
+        if not ctx.snapshots:
             return
 
-        version_content = f"MAJOR={parts[0]}\nMINOR={parts[1]}\nBUILD={parts[2]}\nPATCH={parts[3]}"
+        try:
+            store = SnapshotStore(ctx.snapshots)
+            key = make_snapshot_key(
+                ctx.chromium_version, ctx.get_gn_args_file(), ctx.get_patches_dir()
+            )
+            log_info(f"📸 Saving out-dir snapshot {key.id}...")
+            manifest = store.save(join_paths(ctx.chromium_src, ctx.out_dir), key)
+            removed, freed = store.evict(protect=manifest["id"])
+            line = (
+                f"Snapshot {manifest['id']}: {len(manifest['files'])} files, "
+                f"{manifest['bytes_written'] / 1024**3:.1f} GB new objects"
+            )
+            if removed:
+                line += f", evicted {removed} ({freed / 1024**3:.1f} GB)"
+            log_info(line)
+            ctx.summary.append(line)
+        except Exception as e:
+            log_warning(f"Failed to save out-dir snapshot: {e}")
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
-            temp_file.write(version_content)
-            temp_path = temp_file.name
+    def _verify_resources(self, ctx: Context) -> None:
+        """Check copied resources against the manifest ResourcesModule wrote"""
+        from ..resources.manifest import verify_manifest
 
-        chrome_version_path = join_paths(ctx.chromium_src, "chrome", "VERSION")
-        shutil.copy2(temp_path, chrome_version_path)
-        Path(temp_path).unlink()
+        result = verify_manifest(ctx)
+        if result is None:
+            log_info("No resource manifest in out dir - skipping resource check")
+            return
+
+        errors, warnings = result
+        for warning in warnings:
+            log_warning(f"Resource {warning}")
+        if errors:
+            for error in errors:
+                log_error(f"Resource {error}")
+            raise ValidationError(
+                f"{len(errors)} resource problem(s) - re-run the resources step "
+                f"(browseros build --modules resources) before compiling"
+            )
+        log_success("Resources match the manifest")
+
+
+def create_version_file(ctx: Context) -> None:
+    """Write chrome/VERSION for ctx.browseros_chromium_version"""
+    parts = ctx.browseros_chromium_version.split(".")
+    if len(parts) != 4:
+        log_warning(f"Invalid version format: {ctx.browseros_chromium_version}")
+        return
 
+    version_content = f"MAJOR={parts[0]}\nMINOR={parts[1]}\nBUILD={parts[2]}\nPATCH={parts[3]}"
+
+    # Only rewrite when the version changed - a fresh mtime on
+    # chrome/VERSION makes ninja rebuild everything that embeds it
+    chrome_version_path = join_paths(ctx.chromium_src, "chrome", "VERSION")
+    if sync_text(version_content, chrome_version_path):
         log_info(f"Created VERSION file: {ctx.browseros_chromium_version}")
+    else:
+        log_info(f"VERSION file unchanged: {ctx.browseros_chromium_version}")
+
+
+def report_cache_stats(ctx: Context, before: Optional[CacheStats], scope: str) -> None:
+    """Log compiler cache hits/misses since `before` and add them to the summary"""
+    cache = ctx.compiler_cache
+    if cache is None or before is None:
+        return
+    after = read_cache_stats(cache)
+    if after is None:
+        log_warning(f"Could not read {cache.tool} statistics")
+        return
+    line = f"Compiler cache ({cache.tool}, {scope}): {(after - before).summary()}"
+    log_info(line)
+    ctx.summary.append(line)
 
 
 def build_target(ctx: Context, target: str) -> bool:
@@ -140,6 +140,7 @@ class UniversalBuildModule(CommandModule):
             # Compile (ninja)
             log_info(f"\n🏗️  Compiling {arch}...")
             CompileModule().execute(arch_ctx)
+            ctx.summary.extend(arch_ctx.summary)
 
             # Get app path for this architecture
             app_path = arch_ctx.get_app_path()
@@ -262,6 +263,9 @@ class UniversalBuildModule(CommandModule):
             chromium_src=base_ctx.chromium_src,
             architecture=arch,
             build_type=base_ctx.build_type,
+            compile_jobs=base_ctx.compile_jobs,
+            compiler_cache=base_ctx.compiler_cache,
+            snapshots=base_ctx.snapshots,
         )
         # Set fixed app path to prevent universal auto-detection in get_app_path()
         # This is critical: after arm64 is built, get_app_path() would otherwise
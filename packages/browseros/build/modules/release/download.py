@@ -6,8 +6,6 @@ import tempfile
 from pathlib import Path
 from typing import Optional
 
-import requests
-
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
 from ...common.utils import log_info, log_error
@@ -102,6 +100,8 @@ class DownloadModule(CommandModule):
         self, url: str, dest: Path, filename: str, expected_size: int
     ) -> None:
         """Download a file with progress indicator"""
+        import requests
+
         try:
             response = requests.get(url, stream=True, timeout=30)
             response.raise_for_status()
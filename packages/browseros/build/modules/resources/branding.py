@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Compiled branding replacement engine
+
+branding_config.json is an ordered list of (pattern, replacement) rules that
+used to be applied one after another with re.findall + re.sub, i.e. 2×N
+scans per file. BrandingEngine compiles the rules once into as few
+single-pass stages as possible: each stage is one alternation regex whose
+capture group index dispatches to the rule's replacement and match counter.
+
+Results are identical to sequential application. Literal rules (no regex
+metacharacters, no backslashes in the replacement) share a stage only when
+they cannot interact - a later rule can neither overlap an earlier rule's
+match nor match inside (or across the edge of) its replacement. Otherwise,
+and for real regex rules, a new stage starts. For the stock config:
+
+    eGovernmentOS, Browser OS, Chromium  -> one pass
+    Chrome         -> own pass ("Chrom" + "eGovernmentOS" spells "Chrome...")
+    Google Chrome  -> own pass (overlaps Chrome)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@dataclass(frozen=True)
+class BrandingRule:
+    """One (pattern, replacement) pair from branding_config.json"""
+
+    pattern: str
+    replacement: str
+
+    @property
+    def is_literal(self) -> bool:
+        """Plain text in, plain text out - safe to reason about statically"""
+        return (
+            bool(self.pattern)
+            and not REGEX_METACHARACTERS.intersection(self.pattern)
+            and "\\" not in self.replacement
+        )
+
+
+def can_overlap(a: str, b: str) -> bool:
+    """True if occurrences of literals a and b can share a character in some text"""
+    for offset in range(len(a)):
+        n = min(len(a) - offset, len(b))
+        if a[offset : offset + n] == b[:n]:
+            return True
+    for offset in range(1, len(b)):
+        n = min(len(b) - offset, len(a))
+        if b[offset : offset + n] == a[:n]:
+            return True
+    return False
+
+
+def _interacts(earlier: BrandingRule, later: BrandingRule) -> bool:
+    """Could applying `earlier` first change what `later` matches?"""
+    if can_overlap(earlier.pattern, later.pattern):
+        return True
+    # An empty replacement joins its neighbours, creating arbitrary new text
+    if not earlier.replacement:
+        return True
+    return can_overlap(earlier.replacement, later.pattern)
+
+
+class _Stage:
+    """Rules applied together in one regex pass"""
+
+    def __init__(self, indices: List[int], rules: Sequence[BrandingRule]):
+        self.indices = indices
+        if len(indices) == 1 and not rules[indices[0]].is_literal:
+            # Real regex: keep re.sub semantics (groups, backreferences)
+            self.regex = re.compile(rules[indices[0]].pattern)
+            self.template = rules[indices[0]].replacement
+            self.replacements: Optional[List[str]] = None
+        else:
+            self.regex = re.compile(
+                "|".join(f"({re.escape(rules[i].pattern)})" for i in indices)
+            )
+            self.replacements = [rules[i].replacement for i in indices]
+
+    def apply(self, text: str, counts: List[int]) -> str:
+        if self.replacements is None:
+            rule = self.indices[0]
+            text, count = self.regex.subn(self.template, text)
+            counts[rule] += count
+            return text
+
+        replacements = self.replacements
+        indices = self.indices
+
+        def dispatch(match: "re.Match") -> str:
+            # Every alternative is one group, so the matched one is lastindex
+            assert match.lastindex is not None
+            group = match.lastindex - 1
+            counts[indices[group]] += 1
+            return replacements[group]
+
+        return self.regex.sub(dispatch, text)
+
+
+class BrandingEngine:
+    """Branding rules compiled into single-pass stages
+
+    Usage:
+        engine = load_branding_rules(ctx).engine
+        new_text, counts = engine.apply(text)
+    """
+
+    def __init__(
+        self, rules: Sequence[BrandingRule], groups: Optional[List[List[int]]] = None
+    ):
+        """groups: a stage plan from stage_groups(), to skip planning"""
+        self.rules = list(rules)
+        self.stages = [_Stage(indices, self.rules) for indices in groups or self._plan_groups()]
+
+    @classmethod
+    def from_pairs(cls, pairs: Sequence[Tuple[str, str]]) -> "BrandingEngine":
+        return cls([BrandingRule(pattern, replacement) for pattern, replacement in pairs])
+
+    def _plan_groups(self) -> List[List[int]]:
+        groups: List[List[int]] = []
+        for index, rule in enumerate(self.rules):
+            current = groups[-1] if groups else None
+            joinable = (
+                current is not None
+                and rule.is_literal
+                and self.rules[current[0]].is_literal
+                and not any(_interacts(self.rules[i], rule) for i in current)
+            )
+            if current is not None and joinable:
+                current.append(index)
+            else:
+                groups.append([index])
+        return groups
+
+    def stage_groups(self) -> List[List[int]]:
+        """Rule indices per stage, e.g. [[0, 1, 2], [3], [4]]"""
+        return [list(stage.indices) for stage in self.stages]
+
+    def apply(self, text: str) -> Tuple[str, List[int]]:
+        """Rewrite text; returns (new text, matches per rule in config order)"""
+        counts = [0] * len(self.rules)
+        for stage in self.stages:
+            text = stage.apply(text, counts)
+        return text, counts
+
+    def required_literals(self) -> Optional[List[str]]:
+        """Literals at least one of which a file must contain to be changed
+
+        Identity rules (pattern == replacement) never change anything and are
+        left out. None if a regex rule makes the answer unknowable.
+        """
+        literals = []
+        for rule in self.rules:
+            if rule.is_literal and rule.pattern == rule.replacement:
+                continue
+            if not rule.is_literal:
+                return None
+            literals.append(rule.pattern)
+        return literals
+
+    def describe(self) -> str:
+        """e.g. '5 rules in 2 passes'"""
+        return f"{len(self.rules)} rules in {len(self.stages)} passes"
+
+
+def apply_sequential(pairs: Sequence[Tuple[str, str]], text: str) -> Tuple[str, List[int]]:
+    """Reference implementation: one re.subn per rule, in order"""
+    counts = []
+    for pattern, replacement in pairs:
+        text, count = re.subn(pattern, replacement, text)
+        counts.append(count)
+    return text, counts
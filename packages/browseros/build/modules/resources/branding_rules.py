@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Validated branding rule set
+
+resources/branding_config.json is validated once per content hash instead
+of being reparsed - and silently replaced by defaults on any error - on
+every run:
+
+    errors    not a list of {pattern, replacement} strings, empty pattern,
+              pattern that doesn't compile, replacement referring to a group
+              the pattern doesn't have, regex that fails the backtracking
+              probe
+    warnings  literal rules whose patterns overlap, so their order decides
+              the result - in particular a rule that can never match because
+              an earlier rule rewrites every occurrence first
+
+The backtracking probe runs each regex rule in a child process against
+pumped inputs (runs of the pattern's own characters with a failing suffix)
+and gives up after PROBE_TIMEOUT seconds. Literal rules can't backtrack and
+are not probed.
+
+A valid config is cached with its stage plan in <state dir>/
+browseros_branding_rules.json keyed by the file's sha256, and memoized in
+process, so StringReplacesModule and the tree-wide branding scan share one
+BrandingRuleSet.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...common.context import Context
+from ...common.module import ValidationError
+from ...common.utils import log_warning
+from .branding import BrandingEngine, BrandingRule, can_overlap
+
+CONFIG_PATH = "resources/branding_config.json"
+CACHE_NAME = "browseros_branding_rules.json"
+CACHE_VERSION = 1
+
+# Used only when branding_config.json doesn't exist
+DEFAULT_RULES = [
+    BrandingRule("BrowserOS", "eGovernmentOS"),
+    BrandingRule("Chrome", "eGovernmentOS"),
+    BrandingRule("Chromium", "eGovernmentOS"),
+]
+
+# Seconds a regex rule may spend on the pumped inputs
+PROBE_TIMEOUT = 2.0
+
+# Short pumps catch exponential blowup, long ones steep polynomial blowup
+PROBE_LENGTHS = (24, 4096)
+
+_GROUP_REFERENCE = re.compile(r"\\(?:g<([^>]*)>|(\d{1,2}))")
+
+
+@dataclass
+class BrandingRuleSet:
+    """Branding rules that passed validation, compiled into an engine"""
+
+    engine: BrandingEngine
+    sha256: str = ""
+    source: Optional[Path] = None  # None when using DEFAULT_RULES
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def rules(self) -> List[BrandingRule]:
+        return self.engine.rules
+
+
+def parse_rules(data: Any) -> Tuple[List[BrandingRule], List[str]]:
+    """(rules, schema errors) for the parsed branding_config.json"""
+    if not isinstance(data, dict) or not isinstance(data.get("replacements"), list):
+        return [], ['expected an object with a "replacements" list']
+
+    rules: List[BrandingRule] = []
+    errors: List[str] = []
+    for number, item in enumerate(data["replacements"], 1):
+        if not isinstance(item, dict):
+            errors.append(f"rule {number}: expected an object")
+            continue
+        pattern = item.get("pattern")
+        replacement = item.get("replacement")
+        if not isinstance(pattern, str) or not isinstance(replacement, str):
+            errors.append(f'rule {number}: "pattern" and "replacement" must be strings')
+            continue
+        if not pattern:
+            errors.append(f"rule {number}: empty pattern")
+            continue
+        rules.append(BrandingRule(pattern, replacement))
+    if not rules and not errors:
+        errors.append("no replacements")
+    return rules, errors
+
+
+def _check_regex(number: int, rule: BrandingRule) -> Optional[str]:
+    """Compile error or bad group reference in the replacement, if any"""
+    try:
+        regex = re.compile(rule.pattern)
+    except re.error as e:
+        return f"rule {number} '{rule.pattern}': invalid regex ({e})"
+    for match in _GROUP_REFERENCE.finditer(rule.replacement):
+        name, index = match.groups()
+        if name is not None:
+            known = name in regex.groupindex or (name.isdigit() and int(name) <= regex.groups)
+        else:
+            known = int(index) <= regex.groups
+        if not known:
+            return f"rule {number} '{rule.pattern}': replacement refers to missing group {match.group(0)}"
+    return None
+
+
+def pump_inputs(pattern: str) -> List[str]:
+    """Inputs that make backtracking regexes blow up on `pattern`
+
+    Runs of single characters and of the pattern's literal pieces, each
+    followed by a character nothing matches, so every way of splitting the
+    run gets tried before the match fails.
+    """
+    units = {c for c in pattern if c.isalnum() or c in " -_."}
+    units.update(("a", "0", " "))
+    units.update(re.findall(r"[A-Za-z0-9 ]{2,}", pattern))
+    return [
+        unit * max(1, length // len(unit)) + "\x00"
+        for unit in sorted(units)
+        for length in PROBE_LENGTHS
+    ]
+
+
+def _probe(pattern: str) -> None:
+    regex = re.compile(pattern)
+    for text in pump_inputs(pattern):
+        regex.sub("", text)
+
+
+def probe_backtracking(patterns: List[str], timeout: float = PROBE_TIMEOUT) -> List[str]:
+    """Patterns that didn't finish their pumped inputs within timeout"""
+    processes = []
+    for pattern in patterns:
+        process = multiprocessing.Process(target=_probe, args=(pattern,), daemon=True)
+        process.start()
+        processes.append((pattern, process))
+
+    slow = []
+    deadline = time.monotonic() + timeout
+    for pattern, process in processes:
+        process.join(max(0.0, deadline - time.monotonic()))
+        if process.is_alive():
+            process.kill()
+            process.join()
+            slow.append(pattern)
+    return slow
+
+
+def order_warnings(rules: List[BrandingRule]) -> List[str]:
+    """Literal rules whose relative order changes the result"""
+    warnings = []
+    for j, later in enumerate(rules):
+        for i, earlier in enumerate(rules[:j]):
+            if not (earlier.is_literal and later.is_literal):
+                continue
+            # Identity rules never change anything
+            if earlier.pattern == earlier.replacement or later.pattern == later.replacement:
+                continue
+            if earlier.pattern in later.pattern and earlier.pattern not in earlier.replacement:
+                warnings.append(
+                    f"rule {j + 1} '{later.pattern}' never matches: rule {i + 1} "
+                    f"'{earlier.pattern}' rewrites every occurrence first"
+                )
+            elif can_overlap(earlier.pattern, later.pattern):
+                warnings.append(
+                    f"rules {i + 1} '{earlier.pattern}' and {j + 1} '{later.pattern}' "
+                    f"overlap: their order decides the result"
+                )
+    return warnings
+
+
+def validate_rules(rules: List[BrandingRule]) -> Tuple[List[str], List[str]]:
+    """(errors, warnings) for a parsed rule list"""
+    errors = []
+    regex_rules: Dict[str, int] = {}
+    for number, rule in enumerate(rules, 1):
+        if rule.is_literal:
+            continue
+        error = _check_regex(number, rule)
+        if error:
+            errors.append(error)
+        else:
+            regex_rules.setdefault(rule.pattern, number)
+
+    for pattern in probe_backtracking(list(regex_rules)) if regex_rules else []:
+        errors.append(
+            f"rule {regex_rules[pattern]} '{pattern}': catastrophic backtracking "
+            f"(pumped inputs took over {PROBE_TIMEOUT:.0f}s)"
+        )
+    return errors, order_warnings(rules)
+
+
+# Rule sets by config sha256, shared by everything in this process
+_rule_sets: Dict[str, BrandingRuleSet] = {}
+
+
+def _cache_path(ctx: Context) -> Optional[Path]:
+    if not ctx.chromium_src.exists():
+        return None
+    return ctx.get_state_dir() / CACHE_NAME
+
+
+def _load_cached(cache_path: Optional[Path], sha256: str) -> Optional[Tuple[BrandingEngine, List[str]]]:
+    if not cache_path:
+        return None
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != CACHE_VERSION or data.get("sha256") != sha256:
+        return None
+    rules = [BrandingRule(pattern, replacement) for pattern, replacement in data["rules"]]
+    return BrandingEngine(rules, data["stages"]), data["warnings"]
+
+
+def _save_cached(cache_path: Optional[Path], rule_set: BrandingRuleSet) -> None:
+    if not cache_path:
+        return
+    data = {
+        "version": CACHE_VERSION,
+        "sha256": rule_set.sha256,
+        "rules": [[rule.pattern, rule.replacement] for rule in rule_set.rules],
+        "stages": rule_set.engine.stage_groups(),
+        "warnings": rule_set.warnings,
+    }
+    try:
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=1))
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        log_warning(f"Could not write branding rule cache: {e}")
+
+
+def load_branding_rules(ctx: Context) -> BrandingRuleSet:
+    """Validated rules from resources/branding_config.json
+
+    Falls back to DEFAULT_RULES only if the file doesn't exist.
+
+    Raises:
+        ValidationError: If the config can't be read or fails validation
+    """
+    config_path = ctx.root_dir / CONFIG_PATH
+    if not config_path.exists():
+        log_warning(f"Config not found: {config_path}, using defaults")
+        return BrandingRuleSet(engine=BrandingEngine(DEFAULT_RULES))
+
+    try:
+        content = config_path.read_bytes()
+    except OSError as e:
+        raise ValidationError(f"Failed to read {config_path}: {e}")
+    sha256 = hashlib.sha256(content).hexdigest()
+    if sha256 in _rule_sets:
+        return _rule_sets[sha256]
+
+    cache_path = _cache_path(ctx)
+    cached = _load_cached(cache_path, sha256)
+    if cached:
+        engine, warnings = cached
+        rule_set = BrandingRuleSet(engine, sha256, config_path, warnings)
+    else:
+        try:
+            data = json.loads(content.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ValidationError(f"Invalid branding config {config_path}: {e}")
+        rules, errors = parse_rules(data)
+        if not errors:
+            errors, warnings = validate_rules(rules)
+        if errors:
+            raise ValidationError(
+                f"Invalid branding config {config_path}:\n  " + "\n  ".join(errors)
+            )
+        rule_set = BrandingRuleSet(BrandingEngine(rules), sha256, config_path, warnings)
+        _save_cached(cache_path, rule_set)
+
+    _rule_sets[sha256] = rule_set
+    return rule_set
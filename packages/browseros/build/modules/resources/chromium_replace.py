@@ -1,12 +1,29 @@
 #!/usr/bin/env python3
-"""Chromium file replacement module for BrowserOS build system"""
+"""Chromium file replacement module for BrowserOS build system
 
+Replacement runs from an index of chromium_files/ mapping each destination
+to its source per build type (generic file, .debug and .release variants).
+The index is cached next to the checkout's git state and rebuilt only when
+a directory mtime changes - i.e. when files are added, removed or renamed;
+edits to file contents don't change the mapping.
+"""
+
+import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
+from ...common.sync import SYNC_WORKERS, SyncStats, sync_file
 from ...common.utils import log_info, log_success, log_error, log_warning
 
+# Files named <dest>.debug / <dest>.release replace <dest> for that build type
+BUILD_TYPE_VARIANTS = ("debug", "release")
+
+INDEX_VERSION = 1
+
 
 class ChromiumReplaceModule(CommandModule):
     produces = []
@@ -23,6 +40,62 @@ class ChromiumReplaceModule(CommandModule):
             raise RuntimeError("Failed to replace chromium files")
 
 
+def build_replacement_index(replacement_dir: Path) -> Dict[str, Any]:
+    """Map every destination to its source per build type, in one walk
+
+    Returns:
+        {"dirs": {relative dir: mtime_ns},
+         "files": {destination: {"default"|"debug"|"release": relative source}}}
+    """
+    dirs: Dict[str, int] = {}
+    files: Dict[str, Dict[str, str]] = {}
+    for root, _dirnames, filenames in os.walk(replacement_dir):
+        rel_root = Path(root).relative_to(replacement_dir)
+        dirs[rel_root.as_posix()] = os.stat(root).st_mtime_ns
+        for name in filenames:
+            relative = (rel_root / name).as_posix()
+            variant = "default"
+            destination = relative
+            for build_type in BUILD_TYPE_VARIANTS:
+                if name.endswith(f".{build_type}"):
+                    variant = build_type
+                    destination = relative[: -len(build_type) - 1]
+            files.setdefault(destination, {})[variant] = relative
+    return {"version": INDEX_VERSION, "dirs": dirs, "files": files}
+
+
+def _index_is_fresh(index: Dict[str, Any], replacement_dir: Path) -> bool:
+    """Adding, removing or renaming a file changes its directory's mtime"""
+    if index.get("version") != INDEX_VERSION:
+        return False
+    for relative, mtime_ns in index.get("dirs", {}).items():
+        try:
+            if os.stat(replacement_dir / relative).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def load_replacement_index(replacement_dir: Path, index_path: Path) -> Dict[str, Any]:
+    """Cached index, rebuilt only when chromium_files/ changed shape"""
+    try:
+        index = json.loads(index_path.read_text())
+        if _index_is_fresh(index, replacement_dir):
+            return index
+    except (OSError, ValueError):
+        pass
+
+    index = build_replacement_index(replacement_dir)
+    try:
+        tmp = index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index, indent=1, sort_keys=True))
+        os.replace(tmp, index_path)
+    except OSError as e:
+        log_warning(f"  Could not save chromium_files index: {e}")
+    return index
+
+
 def replace_chromium_files_impl(ctx: Context, replacements=None) -> bool:
     """Replace files in chromium source with custom files from chromium_files directory"""
     log_info("\n🔄 Replacing chromium files...")
@@ -35,73 +108,56 @@ def replace_chromium_files_impl(ctx: Context, replacements=None) -> bool:
         log_info(f"⚠️  No chromium_files directory found at: {replacement_dir}")
         return True
 
-    replaced_count = 0
-    skipped_count = 0
-
-    # Find all files recursively in the replacement directory
-    for src_file in replacement_dir.rglob("*"):
-        if src_file.is_file():
-            # Skip build-type specific files that don't match current build type
-            if src_file.suffix in [".debug", ".release"]:
-                # Check if this file matches the current build type
-                if (ctx.build_type == "debug" and src_file.suffix != ".debug") or (
-                    ctx.build_type == "release" and src_file.suffix != ".release"
-                ):
-                    skipped_count += 1
-                    continue
-
-                # For matching build type files, determine the actual destination
-                # Remove the .debug/.release suffix for the destination path
-                relative_path = src_file.relative_to(replacement_dir)
-                # Convert path to string, remove suffix, then back to Path
-                dest_relative = Path(str(relative_path).rsplit(".", 1)[0])
-            else:
-                # Regular file without build type suffix
-                relative_path = src_file.relative_to(replacement_dir)
-                dest_relative = relative_path
-
-                # Check if build-type specific version exists
-                debug_variant = src_file.with_suffix(src_file.suffix + ".debug")
-                release_variant = src_file.with_suffix(src_file.suffix + ".release")
-
-                # If a build-type specific variant exists for current build type, skip the generic file
-                if (ctx.build_type == "debug" and debug_variant.exists()) or (
-                    ctx.build_type == "release" and release_variant.exists()
-                ):
-                    log_info(
-                        f"    ⏭️  Skipping {relative_path} (using {ctx.build_type} variant instead)"
-                    )
-                    skipped_count += 1
-                    continue
-
-            # Destination path in actual chromium source
-            dst_file = ctx.chromium_src / dest_relative
-
-            # Check if destination exists
-            # Check if destination exists (Relaxed to Warning)
-            if not dst_file.exists():
-                log_warning(
-                    f"    Destination file not found in chromium_src (Creating it): {dest_relative}"
-                )
-                # Create parent directory if needed
-                dst_file.parent.mkdir(parents=True, exist_ok=True)
-                # raise FileNotFoundError(
-                #    f"Destination file not found in chromium_src: {dest_relative}"
-                # )
+    index = load_replacement_index(
+        replacement_dir, ctx.get_state_dir() / "browseros_chromium_files_index.json"
+    )
 
+    skipped_count = 0
+    pairs: List[Tuple[str, str]] = []
+    for dest_relative, sources in sorted(index["files"].items()):
+        # A variant for the current build type wins over the generic file;
+        # variants for other build types are never copied
+        source = sources.get(ctx.build_type)
+        if source and "default" in sources:
+            log_info(
+                f"    ⏭️  Skipping {sources['default']} (using {ctx.build_type} variant instead)"
+            )
+        source = source or sources.get("default")
+        skipped_count += len(sources) - (1 if source else 0)
+        if source:
+            pairs.append((source, dest_relative))
+
+    for _, dest_relative in pairs:
+        if not (ctx.chromium_src / dest_relative).exists():
+            log_warning(
+                f"    Destination file not found in chromium_src (Creating it): {dest_relative}"
+            )
+
+    def replace(pair: Tuple[str, str]) -> Tuple[bool, SyncStats]:
+        source, dest_relative = pair
+        stats = SyncStats()
+        # Identical content is left untouched so ninja doesn't rebuild its dependents
+        written = sync_file(replacement_dir / source, ctx.chromium_src / dest_relative, stats)
+        return written, stats
+
+    sync_stats = SyncStats()
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+        for (source, dest_relative), future in zip(
+            pairs, [pool.submit(replace, pair) for pair in pairs]
+        ):
             try:
-                # Replace the file
-                shutil.copy2(src_file, dst_file)
-                log_info(f"    ✓ Replaced: {relative_path} → {dest_relative}")
-                replaced_count += 1
-
+                written, stats = future.result()
             except Exception as e:
-                log_error(f"    Error replacing file {relative_path}: {e}")
+                log_error(f"    Error replacing file {source}: {e}")
                 raise
+            if written:
+                log_info(f"    ✓ Replaced: {source} → {dest_relative}")
+            sync_stats.add(stats)
 
     log_success(
-        f"Replaced {replaced_count} files (skipped {skipped_count} non-matching files)"
+        f"Replaced {len(pairs)} files (skipped {skipped_count} non-matching files)"
     )
+    log_info(f"  {sync_stats.summary()}")
     return True
 
 
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Resource integrity manifest
+
+ResourcesModule records every file it places in the Chromium checkout in
+<out dir>/browseros_resources_manifest.json (per arch, since each arch has
+its own out dir):
+
+    destination and source path, size and mtime of both, their sha256, the
+    arch the operation was selected for and - for executables - the CPU
+    architecture read from the ELF / Mach-O / PE header
+
+CompileModule verifies it before building, so a stale or wrong-arch
+browseros_server is caught before a multi-hour compile instead of after
+packaging. Verification stats each file and only hashes those whose size or
+mtime moved since the copy.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...common.context import Context
+from ...common.utils import join_paths
+from .plan import SUPERSEDED, ResourcePlan, file_sha256
+
+MANIFEST_NAME = "browseros_resources_manifest.json"
+MANIFEST_VERSION = 1
+
+# ELF e_machine
+_ELF_MACHINES = {0x3E: "x64", 0xB7: "arm64", 0x03: "x86"}
+# Mach-O cputype
+_MACHO_CPUS = {0x01000007: "x64", 0x0100000C: "arm64"}
+# PE/COFF machine
+_PE_MACHINES = {0x8664: "x64", 0xAA64: "arm64", 0x014C: "x86"}
+
+# Fat Mach-O binaries run on either architecture
+UNIVERSAL = "universal"
+
+
+def manifest_path(ctx: Context) -> Path:
+    return join_paths(ctx.chromium_src, ctx.out_dir, MANIFEST_NAME)
+
+
+def binary_arch(path: Path) -> Optional[str]:
+    """CPU architecture of an executable from its header (None if not one)"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(64)
+            if header[:4] == b"\x7fELF" and len(header) >= 20:
+                endian = "<" if header[5] == 1 else ">"
+                (machine,) = struct.unpack_from(endian + "H", header, 18)
+                return _ELF_MACHINES.get(machine, f"elf-{machine:#x}")
+            if header[:4] in (b"\xcf\xfa\xed\xfe", b"\xce\xfa\xed\xfe"):
+                (cpu,) = struct.unpack_from("<I", header, 4)
+                return _MACHO_CPUS.get(cpu, f"macho-{cpu:#x}")
+            if header[:4] == b"\xca\xfe\xba\xbe":
+                return UNIVERSAL
+            if header[:2] == b"MZ" and len(header) >= 64:
+                (pe_offset,) = struct.unpack_from("<I", header, 0x3C)
+                f.seek(pe_offset)
+                pe_header = f.read(6)
+                if pe_header[:4] == b"PE\0\0":
+                    (machine,) = struct.unpack_from("<H", pe_header, 4)
+                    return _PE_MACHINES.get(machine, f"pe-{machine:#x}")
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+def write_manifest(ctx: Context, plan: ResourcePlan) -> Path:
+    """Record the plan's files as they are now in chromium_src"""
+    entries = []
+    for op in plan.operations:
+        if op.skip_reason:
+            continue
+        for entry in op.entries:
+            if entry.status == SUPERSEDED or not entry.dst.exists():
+                continue
+            dst_stat = os.stat(entry.dst)
+            src_stat = os.stat(entry.src)
+            entries.append(
+                {
+                    "path": entry.destination,
+                    "source": os.path.relpath(entry.src, ctx.root_dir).replace(os.sep, "/"),
+                    "size": dst_stat.st_size,
+                    "mtime_ns": dst_stat.st_mtime_ns,
+                    "source_size": src_stat.st_size,
+                    "source_mtime_ns": src_stat.st_mtime_ns,
+                    "sha256": entry.sha256,
+                    "for_arch": ctx.architecture if op.arch_specific else None,
+                    "arch": binary_arch(entry.dst),
+                }
+            )
+
+    path = manifest_path(ctx)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": MANIFEST_VERSION,
+        "architecture": ctx.architecture,
+        "build_type": ctx.build_type,
+        "files": entries,
+    }
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=1))
+    os.replace(tmp, path)
+    return path
+
+
+def _matches(path: Path, size: int, mtime_ns: int, sha256: str) -> Tuple[bool, bool]:
+    """(exists, content matches) - stat first, hash only when stat moved"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False, False
+    if st.st_size != size:
+        return True, False
+    if st.st_mtime_ns == mtime_ns:
+        return True, True
+    return True, file_sha256(path) == sha256
+
+
+def verify_manifest(ctx: Context) -> Optional[Tuple[List[str], List[str]]]:
+    """(errors, warnings) for the resources in chromium_src (None if no manifest)
+
+    Errors:
+    - a copied file is missing, or an executable was changed after the copy
+    - its source in the BrowserOS tree changed since (copy is stale)
+    - it was copied for another arch, or is an executable for another arch
+
+    Warnings:
+    - a non-executable was changed after the copy (later prep steps such as
+      string replacement may legitimately edit copied text files)
+    """
+    path = manifest_path(ctx)
+    try:
+        data: Dict[str, Any] = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != MANIFEST_VERSION:
+        return None
+
+    problems: List[str] = []
+    warnings: List[str] = []
+    for entry in data.get("files", []):
+        name = entry["path"]
+        arch = entry.get("arch")
+        exists, same = _matches(
+            ctx.chromium_src / name, entry["size"], entry["mtime_ns"], entry["sha256"]
+        )
+        if not exists:
+            problems.append(f"{name}: missing")
+            continue
+        if not same:
+            (problems if arch else warnings).append(f"{name}: changed since it was copied")
+
+        source = ctx.root_dir / entry["source"]
+        src_exists, src_same = _matches(
+            source, entry["source_size"], entry["source_mtime_ns"], entry["sha256"]
+        )
+        if src_exists and not src_same:
+            problems.append(f"{name}: stale - {entry['source']} changed since the copy")
+
+        if entry.get("for_arch") and entry["for_arch"] != ctx.architecture:
+            problems.append(f"{name}: copied for {entry['for_arch']}, building {ctx.architecture}")
+        if arch and arch not in (ctx.architecture, UNIVERSAL):
+            problems.append(f"{name}: {arch} executable, building {ctx.architecture}")
+    return problems, warnings
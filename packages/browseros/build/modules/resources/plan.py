@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Declarative copy_resources plan
+
+copy_resources.yaml is compiled into a plan of concrete entries - one per
+file, with source, destination and source sha256 - grouped by operation.
+Conditions (build_type/os/arch) and globs are evaluated once, at compile
+time; later operations writing the same destination supersede earlier ones.
+
+Each entry is then diffed against the Chromium checkout:
+
+    new        destination missing
+    modified   size or sha256 differs
+    unchanged  identical - never rewritten, so its mtime survives for ninja
+
+`browseros dev resources --plan` prints the diff without touching anything;
+ResourcesModule writes only new/modified entries.
+"""
+
+import glob
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ...common.context import Context
+from ...common.sync import SYNC_WORKERS, tree_pairs
+from ...common.utils import get_platform, log_info, log_warning
+
+_CHUNK_SIZE = 1024 * 1024
+
+NEW = "new"
+MODIFIED = "modified"
+UNCHANGED = "unchanged"
+SUPERSEDED = "superseded"  # a later operation writes the same destination
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class ResourceEntry:
+    """One file the plan copies"""
+
+    src: Path
+    dst: Path
+    destination: str  # dst relative to chromium_src (posix)
+    size: int = 0
+    sha256: str = ""
+    status: str = ""
+
+    @property
+    def changed(self) -> bool:
+        return self.status in (NEW, MODIFIED)
+
+
+@dataclass
+class OperationPlan:
+    """Entries produced by one copy_operations item"""
+
+    name: str
+    source: str
+    destination: str
+    entries: List[ResourceEntry] = field(default_factory=list)
+    arch_specific: bool = False  # has an arch condition
+    skip_reason: Optional[str] = None  # condition not met
+    warning: Optional[str] = None  # source missing
+
+    @property
+    def changed(self) -> List[ResourceEntry]:
+        return [e for e in self.entries if e.changed]
+
+
+@dataclass
+class ResourcePlan:
+    """All operations of copy_resources.yaml, evaluated for one build"""
+
+    operations: List[OperationPlan]
+
+    @property
+    def entries(self) -> List[ResourceEntry]:
+        return [e for op in self.operations for e in op.entries]
+
+    @property
+    def changed(self) -> List[ResourceEntry]:
+        return [e for e in self.entries if e.changed]
+
+    def summary(self) -> str:
+        """e.g. '3 to copy (1.2 MB), 89 unchanged'"""
+        changed = self.changed
+        unchanged = sum(1 for e in self.entries if e.status == UNCHANGED)
+        size = sum(e.size for e in changed) / 1024**2
+        return f"{len(changed)} to copy ({size:.1f} MB), {unchanged} unchanged"
+
+
+def _skip_reason(operation: Dict[str, Any], ctx: Context) -> Optional[str]:
+    build_type_condition = operation.get("build_type")
+    if build_type_condition and build_type_condition != ctx.build_type:
+        return f"build_type: {build_type_condition}, current: {ctx.build_type}"
+    os_condition = operation.get("os")
+    if os_condition and get_platform() not in os_condition:
+        return f"os: {os_condition}, current: {get_platform()}"
+    arch_condition = operation.get("arch")
+    if arch_condition and ctx.architecture not in arch_condition:
+        return f"arch: {arch_condition}, current: {ctx.architecture}"
+    return None
+
+
+def _expand(operation: Dict[str, Any], ctx: Context, op: OperationPlan) -> None:
+    """Fill op.entries with concrete (src, dst) pairs"""
+    src_path = ctx.root_dir / op.source
+    dst_base = ctx.chromium_src / op.destination
+    op_type = operation.get("type", "directory")
+
+    pairs = []
+    if op_type == "directory":
+        if src_path.is_dir():
+            pairs = list(tree_pairs(src_path, dst_base))
+        else:
+            op.warning = f"Source directory not found: {op.source}"
+    elif op_type == "files":
+        files = [Path(f) for f in sorted(glob.glob(str(src_path))) if Path(f).is_file()]
+        if files:
+            pairs = [(f, dst_base / f.name) for f in files]
+        else:
+            op.warning = f"No files found matching: {op.source}"
+    elif op_type == "file":
+        if src_path.is_file():
+            dst_file = dst_base / src_path.name if dst_base.is_dir() else dst_base
+            pairs = [(src_path, dst_file)]
+        else:
+            op.warning = f"Source file not found: {op.source}"
+
+    for src, dst in pairs:
+        op.entries.append(
+            ResourceEntry(
+                src=src,
+                dst=dst,
+                destination=os.path.relpath(dst, ctx.chromium_src).replace(os.sep, "/"),
+            )
+        )
+
+
+def _diff_entry(entry: ResourceEntry) -> None:
+    entry.size = os.stat(entry.src).st_size
+    entry.sha256 = file_sha256(entry.src)
+    try:
+        dst_size = os.stat(entry.dst).st_size
+    except FileNotFoundError:
+        entry.status = NEW
+        return
+    if dst_size != entry.size or file_sha256(entry.dst) != entry.sha256:
+        entry.status = MODIFIED
+    else:
+        entry.status = UNCHANGED
+
+
+def compile_plan(ctx: Context, config: Dict[str, Any]) -> ResourcePlan:
+    """Evaluate copy_resources.yaml for ctx and diff it against chromium_src"""
+    operations = []
+    for operation in config.get("copy_operations", []):
+        op = OperationPlan(
+            name=operation.get("name", "Unnamed operation"),
+            source=operation["source"],
+            destination=operation["destination"],
+            arch_specific=bool(operation.get("arch")),
+        )
+        op.skip_reason = _skip_reason(operation, ctx)
+        if not op.skip_reason:
+            _expand(operation, ctx, op)
+        operations.append(op)
+
+    plan = ResourcePlan(operations=operations)
+
+    # Last writer wins, as when the operations ran one after another
+    latest: Dict[Path, ResourceEntry] = {}
+    for entry in plan.entries:
+        if entry.dst in latest:
+            latest[entry.dst].status = SUPERSEDED
+        latest[entry.dst] = entry
+
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+        list(pool.map(_diff_entry, latest.values()))
+    return plan
+
+
+def print_plan(plan: ResourcePlan) -> None:
+    """Show what executing the plan would change"""
+    for op in plan.operations:
+        if op.skip_reason:
+            log_info(f"  ⏭️  {op.name} (skipped: {op.skip_reason})")
+            continue
+        if op.warning:
+            log_warning(f"  {op.name}: {op.warning}")
+            continue
+        changed = op.changed
+        log_info(f"  • {op.name}: {len(changed)} of {len(op.entries)} to copy")
+        for entry in changed:
+            marker = "+" if entry.status == NEW else "~"
+            log_info(f"      {marker} {entry.destination} ({entry.size} bytes)")
+    log_info(f"  Plan: {plan.summary()}")
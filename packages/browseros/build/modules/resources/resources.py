@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 """Resource management module for BrowserOS build system"""
 
-import glob
-import shutil
 import yaml
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import log_info, log_success, log_error, log_warning, get_platform
+from ...common.env import EnvConfig
+from ...common.sync import COPY_METHODS, SYNC_WORKERS, SyncStats, write_file
+from ...common.utils import log_info, log_success, log_error, log_warning
+from .manifest import manifest_path, write_manifest
+from .plan import UNCHANGED, ResourceEntry, compile_plan, print_plan
 
 
 class ResourcesModule(CommandModule):
@@ -27,11 +31,8 @@ class ResourcesModule(CommandModule):
             raise RuntimeError("Failed to copy resources")
 
 
-def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
-    """Copy AI extensions and icons based on YAML configuration"""
-    log_info("\n📦 Copying resources...")
-
-    # Load copy configuration
+def load_copy_config(ctx: Context) -> dict:
+    """Parsed copy_resources.yaml"""
     copy_config_path = ctx.get_copy_resources_config()
     if not copy_config_path.exists():
         log_error(f"Copy configuration file not found: {copy_config_path}")
@@ -40,120 +41,118 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
         )
 
     with open(copy_config_path, "r") as f:
-        config = yaml.safe_load(f)
+        return yaml.safe_load(f) or {}
+
+
+def copy_resources_impl(
+    ctx: Context, commit_each: bool = False, plan_only: bool = False
+) -> bool:
+    """Copy AI extensions and icons based on YAML configuration
+
+    Args:
+        commit_each: Commit the changed files of each operation separately
+        plan_only: Only print what would be copied (nothing is written)
+    """
+    log_info("\n📦 Copying resources...")
+
+    config = load_copy_config(ctx)
 
     if "copy_operations" not in config:
         log_info("⚠️  No copy_operations defined in configuration")
         return True
 
+    # copy | reflink | hardlink (see common/sync.py)
+    copy_method = EnvConfig().copy_method or config.get("copy_method", "reflink")
+    if copy_method not in COPY_METHODS:
+        log_error(f"Unknown copy_method: {copy_method} (expected {', '.join(COPY_METHODS)})")
+        return False
+
+    plan = compile_plan(ctx, config)
+    if plan_only:
+        print_plan(plan)
+        return True
+
     if commit_each:
         log_info(
             "📝 Git commit mode enabled - will create a commit after each resource copy"
         )
 
-    # Process each copy operation
-    for operation in config["copy_operations"]:
-        name = operation.get("name", "Unnamed operation")
-        source = operation["source"]
-        destination = operation["destination"]
-        op_type = operation.get("type", "directory")
-        build_type_condition = operation.get("build_type")
-        os_condition = operation.get("os")
-        arch_condition = operation.get("arch")
-
-        # Skip operation if build_type condition doesn't match
-        if build_type_condition and build_type_condition != ctx.build_type:
-            log_info(
-                f"  ⏭️  Skipping {name} (build_type: {build_type_condition}, current: {ctx.build_type})"
-            )
-            continue
-
-        # Skip operation if os condition doesn't match
-        if os_condition:
-            current_os = get_platform()
-            if current_os not in os_condition:
-                log_info(
-                    f"  ⏭️  Skipping {name} (os: {os_condition}, current: {current_os})"
-                )
+    # Only new/modified entries are written; identical files keep their
+    # mtimes so ninja doesn't rebuild their dependents
+    sync_stats = SyncStats()
+    for entry in plan.entries:
+        if entry.status == UNCHANGED:
+            sync_stats.unchanged += 1
+            sync_stats.bytes_skipped += entry.size
+
+    def write(entry: ResourceEntry) -> SyncStats:
+        stats = SyncStats()
+        write_file(entry.src, entry.dst, stats, copy_method)
+        return stats
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+        for op in plan.operations:
+            if op.skip_reason:
+                log_info(f"  ⏭️  Skipping {op.name} ({op.skip_reason})")
                 continue
-
-        # Skip operation if arch condition doesn't match
-        if arch_condition:
-            if ctx.architecture not in arch_condition:
-                log_info(
-                    f"  ⏭️  Skipping {name} (arch: {arch_condition}, current: {ctx.architecture})"
-                )
+            log_info(f"  • {op.name}")
+            if op.warning:
+                log_warning(f"    {op.warning}")
                 continue
 
-        # Resolve paths
-        src_path = ctx.root_dir / source
-        dst_base = ctx.chromium_src / destination
-
-        log_info(f"  • {name}")
-
-        try:
-            if op_type == "directory":
-                # Copy entire directory
-                if src_path.exists() and src_path.is_dir():
-                    dst_path = dst_base
-                    dst_path.mkdir(parents=True, exist_ok=True)
-                    shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
-                    log_info(f"    ✓ Copied directory: {source} → {destination}")
-                    if commit_each:
-                        commit_resource_copy(
-                            name, source, destination, ctx.chromium_src
-                        )
-                else:
-                    log_warning(f"    Source directory not found: {source}")
-
-            elif op_type == "files":
-                # Copy files matching pattern
-                files = glob.glob(str(ctx.root_dir / source))
-                if files:
-                    dst_base.mkdir(parents=True, exist_ok=True)
-                    for file_path in files:
-                        file_path = Path(file_path)
-                        if file_path.is_file():
-                            shutil.copy2(file_path, dst_base)
-                    log_info(
-                        f"    ✓ Copied {len(files)} files: {source} → {destination}"
+            changed = op.changed
+            log_info(
+                f"    ✓ {op.source} → {op.destination} "
+                f"({len(changed)} of {len(op.entries)} files changed)"
+            )
+            if commit_each:
+                # Write this operation's files before committing them
+                try:
+                    for stats in pool.map(write, changed):
+                        sync_stats.add(stats)
+                except Exception as e:
+                    log_error(f"    Error: {e}")
+                    failed = True
+                    continue
+                if changed:
+                    commit_resource_copy(
+                        op.name, [e.destination for e in changed], ctx.chromium_src
                     )
-                    if commit_each:
-                        commit_resource_copy(
-                            name, source, destination, ctx.chromium_src
-                        )
-                else:
-                    log_warning(f"    No files found matching: {source}")
-
-            elif op_type == "file":
-                # Copy single file
-                if src_path.exists() and src_path.is_file():
-                    dst_base.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src_path, dst_base)
-                    log_info(f"    ✓ Copied file: {source} → {destination}")
-                    if commit_each:
-                        commit_resource_copy(
-                            name, source, destination, ctx.chromium_src
-                        )
-                else:
-                    log_warning(f"    Source file not found: {source}")
-
-        except Exception as e:
-            log_error(f"    Error: {e}")
-
-    log_success("Resources copied")
+
+        if not commit_each:
+            try:
+                for stats in pool.map(write, plan.changed):
+                    sync_stats.add(stats)
+            except Exception as e:
+                log_error(f"    Error: {e}")
+                failed = True
+
+    log_success(f"Resources copied with {copy_method} ({sync_stats.summary()})")
+
+    # Checked by CompileModule before building (stale / wrong-arch resources).
+    # After a failed copy the old manifest can't be trusted either.
+    if failed:
+        manifest_path(ctx).unlink(missing_ok=True)
+        log_warning("  Resource manifest not written (copy errors)")
+    else:
+        manifest = write_manifest(ctx, plan)
+        log_info(f"  Resource manifest: {manifest}")
     return True
 
 
-def commit_resource_copy(
-    name: str, source: str, destination: str, chromium_src: Path
-) -> bool:
-    """Create a git commit for the copied resource"""
+def commit_resource_copy(name: str, paths: List[str], chromium_src: Path) -> bool:
+    """Create a git commit for the copied resource files in paths"""
     try:
-        # Stage all changes
-        cmd_add = ["git", "add", "-A"]
+        # Stage just these files, passing the paths on stdin (one git add,
+        # no command-line length limit)
+        cmd_add = ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"]
         result = subprocess.run(
-            cmd_add, capture_output=True, text=True, cwd=chromium_src
+            cmd_add,
+            input="\0".join(paths),
+            capture_output=True,
+            text=True,
+            cwd=chromium_src,
         )
         if result.returncode != 0:
             log_warning(f"Failed to stage changes for resource copy: {name}")
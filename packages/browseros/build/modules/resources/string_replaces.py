@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 """String replacement module for BrowserOS build system"""
 
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Tuple
+
 from ...common.module import CommandModule, ValidationError
+from ...common.branding_scan import BrandingScanConfig
 from ...common.context import Context
+from ...common.sync import SyncStats, sync_text
 from ...common.utils import log_info, log_success, log_error, log_warning
+from .branding import BrandingEngine
+from .branding_rules import load_branding_rules
 
 
 class StringReplacesModule(CommandModule):
@@ -15,6 +23,7 @@ class StringReplacesModule(CommandModule):
     def validate(self, ctx: Context) -> None:
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
+        load_branding_rules(ctx)
 
     def execute(self, ctx: Context) -> None:
         log_info("\n🔤 Applying string replacements...")
@@ -22,24 +31,6 @@ class StringReplacesModule(CommandModule):
             raise RuntimeError("Failed to apply string replacements")
 
 
-import json
-from pathlib import Path
-
-# Load replacements from config
-def load_branding_config(ctx: Context) -> list:
-    config_path = ctx.root_dir / "resources/branding_config.json"
-    if not config_path.exists():
-        log_warning(f"⚠️  Config not found: {config_path}, using defaults")
-        return []
-    
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return [(r["pattern"], r["replacement"]) for r in data.get("replacements", [])]
-    except Exception as e:
-        log_error(f"Failed to load branding config: {e}")
-        return []
-
 # Additional non-code files to rebrand (relative to browseros root)
 additional_files = [
     "chromium_patches/chrome/app/app-Info.plist",
@@ -58,99 +49,127 @@ target_files = [
     "extensions/strings/extensions_strings.grd",
 ]
 
+# Files rewritten concurrently (I/O overlaps; the regex passes are short)
+MAX_WORKERS = 8
+
+
+def _process_file(
+    engine: BrandingEngine, full_path: Path, display_path: str, report_only: bool = False
+) -> Tuple[List[Tuple[Callable[[str], None], str]], SyncStats]:
+    """Brand one file; returns its (log function, message) lines and sync stats"""
+    stats = SyncStats()
+
+    with open(full_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    new_content, counts = engine.apply(content)
+    if report_only:
+        if new_content == content:
+            return [], stats
+        return [(log_warning, f"  Unbranded: {display_path} ({sum(counts)} matches)")], stats
+
+    lines = [(log_info, f"  • Processing: {display_path}")]
+    for rule, matches in zip(engine.rules, counts):
+        if matches > 0:
+            lines.append((log_info, f"    ✓ Replaced {matches} occurrences of '{rule.pattern}'"))
+
+    # Write back only if changes were made (keeps mtime for ninja)
+    if new_content != content:
+        sync_text(new_content, full_path, stats)
+        lines.append((log_success, f"    Updated with {sum(counts)} total replacements"))
+    else:
+        stats.unchanged += 1
+        lines.append((log_info, "    No replacements needed"))
+    return lines, stats
+
+
+def scan_tree(ctx: Context, engine: BrandingEngine, config: BrandingScanConfig) -> List[str]:
+    """Chromium files outside target_files that contain branding literals"""
+    from ...common.branding_scan import BrandingScanner
+
+    literals = engine.required_literals()
+    if literals is None:
+        log_warning("  Tree-wide branding scan skipped: it needs literal (non-regex) rules")
+        return []
+
+    scanner = BrandingScanner(
+        ctx.chromium_src,
+        config,
+        literals,
+        cache_path=ctx.get_state_dir() / "browseros_branding_scan.json",
+    )
+
+    log_info(f"\n🔎 Scanning {', '.join(config.globs)} for branding...")
+    start = time.time()
+    result = scanner.scan()
+    log_info(f"  {result.summary()} in {time.time() - start:.1f}s")
+
+    listed = set(target_files)
+    return [path for path in result.hits if path not in listed]
+
+
 def apply_string_replacements_impl(ctx: Context) -> bool:
     """Internal implementation for applying string replacements"""
 
     success = True
-    
-    # Load dynamic replacements
-    branding_replacements = load_branding_config(ctx)
-    
-    if not branding_replacements:
-        # Fallback defaults if config missing (or empty)
-        branding_replacements = [
-            (r"BrowserOS", r"eGovernmentOS"),
-            (r"Chrome", r"eGovernmentOS"),
-            (r"Chromium", r"eGovernmentOS"),
-        ]
-
-
-    # Process Chromium source files
-    for file_path in target_files:
-        full_path = ctx.chromium_src / file_path
-
-        if not full_path.exists():
-            log_warning(f"  ⚠️  File not found: {file_path}")
-            continue
-
-        log_info(f"  • Processing: {file_path}")
-
-        try:
-            # Read the file content
-            with open(full_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            original_content = content
-            replacement_count = 0
-
-            # Apply each replacement
-            for pattern, replacement in branding_replacements:
-                matches = len(re.findall(pattern, content))
-                if matches > 0:
-                    content = re.sub(pattern, replacement, content)
-                    replacement_count += matches
-                    log_info(f"    ✓ Replaced {matches} occurrences of '{pattern}'")
-
-            # Write back if changes were made
-            if content != original_content:
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                log_success(f"    Updated with {replacement_count} total replacements")
-            else:
-                log_info("    No replacements needed")
-
-        except Exception as e:
-            log_error(f"    Error processing {file_path}: {e}")
-            success = False
-
-    # Process additional BrowserOS files (patches, docs, etc.)
-    for file_path in additional_files:
-        full_path = ctx.root_dir / file_path
-
-        if not full_path.exists():
-            log_warning(f"  ⚠️  File not found: {file_path}")
-            continue
-
-        log_info(f"  • Processing: {file_path}")
-
-        try:
-            # Read the file content
-            with open(full_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            original_content = content
-            replacement_count = 0
-
-            # Apply each replacement
-            for pattern, replacement in branding_replacements:
-                matches = len(re.findall(pattern, content))
-                if matches > 0:
-                    content = re.sub(pattern, replacement, content)
-                    replacement_count += matches
-                    log_info(f"    ✓ Replaced {matches} occurrences of '{pattern}'")
-
-            # Write back if changes were made
-            if content != original_content:
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                log_success(f"    Updated with {replacement_count} total replacements")
-            else:
-                log_info("    No replacements needed")
-
-        except Exception as e:
-            log_error(f"    Error processing {file_path}: {e}")
-            success = False
+    sync_stats = SyncStats()
 
+    try:
+        rule_set = load_branding_rules(ctx)
+    except ValidationError as e:
+        log_error(str(e))
+        return False
+    for warning in rule_set.warnings:
+        log_warning(f"  Branding config: {warning}")
+    engine = rule_set.engine
+    log_info(f"  Branding rules compiled: {engine.describe()}")
+
+    # Chromium source files, then additional BrowserOS files (patches, docs, etc.)
+    files = [(ctx.chromium_src / f, f) for f in target_files]
+    files += [(ctx.root_dir / f, f) for f in additional_files]
+
+    existing = []
+    for full_path, display_path in files:
+        if full_path.exists():
+            existing.append((full_path, display_path))
+        else:
+            log_warning(f"  File not found: {display_path}")
+    jobs = [(full_path, display_path, False) for full_path, display_path in existing]
+
+    # Optional tree-wide scan: files the list above misses
+    report_only = False
+    scan_config = ctx.branding_scan
+    if scan_config:
+        report_only = scan_config.mode == "report"
+        jobs += [(ctx.chromium_src / f, f, True) for f in scan_tree(ctx, engine, scan_config)]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [
+            pool.submit(
+                _process_file, engine, full_path, display_path, scanned and report_only
+            )
+            for full_path, display_path, scanned in jobs
+        ]
+        # Report in list order so the log reads the same on every run
+        for (_, display_path, scanned), future in zip(jobs, futures):
+            try:
+                lines, stats = future.result()
+            except UnicodeDecodeError as e:
+                if scanned:
+                    log_warning(f"  Skipping {display_path}: not UTF-8 text ({e.reason})")
+                    continue
+                log_error(f"  Error processing {display_path}: {e}")
+                success = False
+                continue
+            except Exception as e:
+                log_error(f"  Error processing {display_path}: {e}")
+                success = False
+                continue
+            for log, message in lines:
+                log(message)
+            sync_stats.add(stats)
+
+    log_info(f"  {sync_stats.summary()}")
     if success:
         log_success("✅ String replacements completed")
     else:
@@ -1,9 +1,166 @@
 #!/usr/bin/env python3
-"""Clean module for BrowserOS build system"""
+"""Clean module for BrowserOS build system
+
+Modes (--clean-mode / build.clean_mode / BROWSEROS_CLEAN_MODE):
+    full                git reset --hard + git clean chrome/ components/,
+                        remove the out dir and Sparkle build (default)
+    sources-only        same source reset, but keep the out dir so ninja
+                        only rebuilds what the re-applied patches change
+    patched-files-only  keep the out dir and reset just the files BrowserOS
+                        touches (chromium_patches/, series_patches/,
+                        chromium_files/, copy_resources.yaml destinations and
+                        string replacement targets), plus any other tracked
+                        file that differs from HEAD
+
+full and sources-only also drop git_setup's sync record: git clean -x deletes
+ignored files gclient hooks generated, so the next git_setup has to run
+gclient sync again to restore them.
+
+patched-files-only skips the tree-wide git clean. Untracked files added by a
+patch that has since been removed from chromium_patches/ are not listed
+anywhere any more, so they stay behind - use sources-only after dropping
+such a patch.
+"""
+
+import glob
+import subprocess
+from pathlib import Path
+from typing import Iterator, List, Set
+
+import yaml
 
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import run_command, log_info, log_success, safe_rmtree
+from ...common.utils import (
+    get_platform,
+    log_info,
+    log_success,
+    log_warning,
+    run_command,
+    safe_rmtree,
+)
+from .git import forget_sync_state
+
+CLEAN_MODES = ("full", "sources-only", "patched-files-only")
+
+# Marker suffixes next to chromium_patches/ entries (see apply/common.py)
+PATCH_MARKER_SUFFIXES = (".deleted", ".binary", ".rename")
+
+# Build-type variants in chromium_files/ (see resources/chromium_replace.py)
+BUILD_TYPE_SUFFIXES = (".debug", ".release")
+
+# Paths per git invocation - keeps command lines under OS limits
+GIT_PATHSPEC_BATCH = 500
+
+
+def _strip_suffix(path: str, suffixes: tuple) -> str:
+    for suffix in suffixes:
+        if path.endswith(suffix):
+            return path[: -len(suffix)]
+    return path
+
+
+def _chromium_patch_paths(ctx: Context) -> Iterator[str]:
+    """Chromium paths with a per-file patch or marker in chromium_patches/"""
+    patches_dir = ctx.get_patches_dir()
+    if not patches_dir.exists():
+        return
+    for path in patches_dir.rglob("*"):
+        if path.is_file() and not path.name.startswith("."):
+            relative = path.relative_to(patches_dir).as_posix()
+            yield _strip_suffix(relative, PATCH_MARKER_SUFFIXES)
+
+
+def _series_patch_paths(ctx: Context) -> Iterator[str]:
+    """Files named in the diff headers of the applicable series patches"""
+    from ..patches.series_patches import get_series_files, parse_series
+
+    series_dir = ctx.get_series_patches_dir()
+    if not series_dir.exists():
+        return
+    for series_file in get_series_files(series_dir):
+        for entry in parse_series(series_file):
+            patch_path = series_dir / entry
+            if not patch_path.exists():
+                continue
+            with open(patch_path, "r", errors="replace") as f:
+                for line in f:
+                    if line.startswith(("--- a/", "+++ b/")):
+                        yield line[6:].rstrip("\n").split("\t", 1)[0]
+
+
+def _chromium_files_paths(ctx: Context) -> Iterator[str]:
+    """Destinations of chromium_files/ replacements (all build-type variants)"""
+    replace_dir = ctx.get_chromium_replace_files_dir()
+    if not replace_dir.exists():
+        return
+    for path in replace_dir.rglob("*"):
+        if path.is_file():
+            relative = path.relative_to(replace_dir).as_posix()
+            yield _strip_suffix(relative, BUILD_TYPE_SUFFIXES)
+
+
+def _resource_paths(ctx: Context) -> Iterator[str]:
+    """Destinations of copy_resources.yaml operations for this platform
+
+    Directory operations yield the destination directory itself, which is
+    reset (and cleaned of untracked files) as a whole.
+    """
+    config_path = ctx.get_copy_resources_config()
+    if not config_path.exists():
+        return
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f) or {}
+
+    for operation in config.get("copy_operations", []):
+        os_condition = operation.get("os")
+        if os_condition and get_platform() not in os_condition:
+            continue
+        destination = operation.get("destination")
+        if not destination:
+            continue
+        op_type = operation.get("type", "file")
+        if op_type == "files":
+            for source in glob.glob(str(ctx.root_dir / operation.get("source", ""))):
+                yield f"{destination.rstrip('/')}/{Path(source).name}"
+        elif op_type == "file" and destination.endswith("/"):
+            yield destination + Path(operation.get("source", "")).name
+        else:
+            yield destination.rstrip("/")
+
+
+def _string_replace_paths() -> Iterator[str]:
+    from ..resources.string_replaces import target_files
+
+    yield from target_files
+
+
+def collect_touched_paths(ctx: Context) -> List[str]:
+    """Chromium paths that patches, replacements and resources write to"""
+    paths: Set[str] = set()
+    for source in (
+        _chromium_patch_paths(ctx),
+        _series_patch_paths(ctx),
+        _chromium_files_paths(ctx),
+        _resource_paths(ctx),
+        _string_replace_paths(),
+    ):
+        paths.update(p for p in source if p and p != "/dev/null")
+    return sorted(paths)
+
+
+def _batches(paths: List[str]) -> Iterator[List[str]]:
+    for i in range(0, len(paths), GIT_PATHSPEC_BATCH):
+        yield paths[i : i + GIT_PATHSPEC_BATCH]
+
+
+def _git_lines(args: List[str], cwd: Path) -> List[str]:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+    return [line for line in result.stdout.split("\0") if line]
 
 
 class CleanModule(CommandModule):
@@ -14,14 +171,25 @@ class CleanModule(CommandModule):
     def validate(self, ctx: Context) -> None:
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
+        if ctx.clean_mode not in CLEAN_MODES:
+            raise ValidationError(
+                f"Invalid clean mode: {ctx.clean_mode} (expected one of {', '.join(CLEAN_MODES)})"
+            )
 
     def execute(self, ctx: Context) -> None:
-        log_info("🧹 Cleaning build artifacts...")
+        if ctx.clean_mode == "patched-files-only":
+            log_info(f"🧹 Resetting patched files (keeping {ctx.out_dir})...")
+            self._reset_touched_files(ctx)
+            return
 
-        out_path = ctx.chromium_src / ctx.out_dir
-        if out_path.exists():
-            safe_rmtree(out_path)
-            log_success("Cleaned build directory")
+        if ctx.clean_mode == "full":
+            log_info("🧹 Cleaning build artifacts...")
+            out_path = ctx.chromium_src / ctx.out_dir
+            if out_path.exists():
+                safe_rmtree(out_path)
+                log_success("Cleaned build directory")
+        else:
+            log_info(f"🧹 Keeping build directory {ctx.out_dir} (sources-only)")
 
         log_info("\n🔀 Resetting git branch and removing tracked files...")
         self._git_reset(ctx)
@@ -55,4 +223,42 @@ class CleanModule(CommandModule):
             ],
             cwd=ctx.chromium_src,
         )
+        # Hook outputs (e.g. chrome/build/pgo_profiles) are gone now
+        forget_sync_state(ctx.chromium_src)
         log_success("Git reset and clean complete")
+
+    def _reset_touched_files(self, ctx: Context) -> None:
+        """Restore touched paths from HEAD and delete the ones HEAD doesn't have"""
+        src = ctx.chromium_src
+        touched = collect_touched_paths(ctx)
+        log_info(f"  {len(touched)} path(s) touched by patches, chromium_files and resources")
+
+        # Tracked files modified by anything else (e.g. a patch removed since
+        # the last apply) - the index can list these without walking the tree
+        modified = _git_lines(["diff", "--name-only", "-z", "--diff-filter=a", "HEAD"], src)
+
+        in_head: Set[str] = set()
+        for batch in _batches(touched):
+            in_head.update(
+                _git_lines(["ls-tree", "-r", "-z", "--name-only", "HEAD", "--", *batch], src)
+            )
+        to_restore = sorted(in_head.union(modified))
+
+        for batch in _batches(to_restore):
+            run_command(["git", "checkout", "HEAD", "--", *batch], cwd=src)
+
+        # Files HEAD doesn't have were added by a patch or resource copy;
+        # directory destinations may also hold copies next to tracked files
+        added = [
+            p for p in touched
+            if p not in in_head and (src / p).is_file()
+        ]
+        directories = [p for p in touched if (src / p).is_dir()]
+        for batch in _batches(added + directories):
+            run_command(["git", "clean", "-fdx", "-q", "--", *batch], cwd=src)
+
+        if not to_restore and not added:
+            log_warning("No patched files found to reset")
+        log_success(
+            f"Restored {len(to_restore)} file(s) from HEAD, removed {len(added)} added file(s)"
+        )
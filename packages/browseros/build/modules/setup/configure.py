@@ -1,10 +1,51 @@
 #!/usr/bin/env python3
 """Build configuration module for BrowserOS build system"""
 
+import os
+import re
+from pathlib import Path
+from typing import List, Optional
+
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
+from ...common.sync import content_matches
 from ...common.utils import run_command, log_info, log_success, join_paths, IS_WINDOWS
 
+# Depfile paths are space-separated, with literal spaces escaped as "\ "
+_DEPFILE_SEPARATOR = re.compile(r"(?<!\\)\s+")
+
+
+def read_gn_depfile(depfile: Path) -> List[str]:
+    """Inputs listed in build.ninja.d (paths relative to the out dir)"""
+    text = depfile.read_text(errors="replace").replace("\\\n", " ")
+    _, _, inputs = text.partition(": ")
+    return [p.replace("\\ ", " ") for p in _DEPFILE_SEPARATOR.split(inputs.strip()) if p]
+
+
+def gn_gen_stale_reason(out_path: Path, args_content: str) -> Optional[str]:
+    """Why `gn gen` must run for out_path, or None if the build graph is fresh
+
+    Fresh means args.gn already holds args_content and build.ninja is newer
+    than every .gn/.gni input gn recorded in build.ninja.d.
+    """
+    args_file = out_path / "args.gn"
+    if not content_matches(args_content.encode("utf-8"), args_file):
+        return "args.gn changed" if args_file.exists() else "no args.gn yet"
+
+    build_ninja = out_path / "build.ninja"
+    depfile = out_path / "build.ninja.d"
+    if not build_ninja.exists() or not depfile.exists():
+        return "build.ninja not generated yet"
+
+    generated = build_ninja.stat().st_mtime_ns
+    for rel_path in read_gn_depfile(depfile):
+        try:
+            if os.stat(out_path / rel_path).st_mtime_ns > generated:
+                return f"{os.path.normpath(rel_path)} changed since last gn gen"
+        except FileNotFoundError:
+            return f"{os.path.normpath(rel_path)} no longer exists"
+    return None
+
 
 class ConfigureModule(CommandModule):
     produces = []
@@ -22,6 +63,11 @@ class ConfigureModule(CommandModule):
         if not flags_file.exists():
             raise ValidationError(f"GN flags file not found: {flags_file}")
 
+        if ctx.compiler_cache and not ctx.compiler_cache.is_available():
+            raise ValidationError(
+                f"Compiler cache {ctx.compiler_cache.tool} not found in PATH"
+            )
+
     def execute(self, ctx: Context) -> None:
         log_info(f"\n⚙️  Configuring {ctx.build_type} build for {ctx.architecture}...")
 
@@ -33,8 +79,22 @@ class ConfigureModule(CommandModule):
 
         args_content = flags_file.read_text()
         args_content += f'\ntarget_cpu = "{ctx.architecture}"\n'
+        if ctx.compiler_cache:
+            args_content += ctx.compiler_cache.gn_args()
+            ctx.compiler_cache.apply_environment(ctx.chromium_src)
+            log_info(f"Using compiler cache: {ctx.compiler_cache.tool}")
+
+        # Leaving args.gn untouched and skipping gn gen keeps ninja's own
+        # regeneration check quiet, saving a minute+ per configure
+        stale_reason = gn_gen_stale_reason(out_path, args_content)
+        if stale_reason is None:
+            log_info("args.gn unchanged and build.ninja newer than all GN inputs")
+            log_success("Build already configured - skipping gn gen")
+            return
 
-        args_file.write_text(args_content)
+        log_info(f"Running gn gen: {stale_reason}")
+        if not content_matches(args_content.encode("utf-8"), args_file):
+            args_file.write_text(args_content)
 
         gn_cmd = "gn.bat" if IS_WINDOWS() else "gn"
         run_command([gn_cmd, "gen", ctx.out_dir, "--fail-on-unused-args"], cwd=ctx.chromium_src)
@@ -1,13 +1,51 @@
 #!/usr/bin/env python3
-"""Git operations module for BrowserOS build system"""
+"""Git operations module for BrowserOS build system
 
+GitSetupModule records what it last synced (tag, commit, hash of DEPS and
+.gclient) in <git dir>/browseros_sync_state.json. When the checkout already
+sits on the requested tag with the same DEPS, the fetch and the multi-minute
+`gclient sync` are skipped. Delete the state file to force a sync.
+
+`git clean -x` also removes ignored files gclient hooks generated (PGO
+profiles, etc.), so CleanModule drops the state file whenever it cleans the
+tree - only a checkout untouched since the last sync skips gclient.
+"""
+
+import hashlib
+import json
 import subprocess
 import tarfile
 import urllib.request
+from pathlib import Path
+from typing import Dict, Optional
+
+from ...common.env import EnvConfig
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import run_command, log_info, log_error, log_success, IS_WINDOWS, safe_rmtree
 
+SYNC_STATE_NAME = "browseros_sync_state.json"
+
+
+def sync_state_path(chromium_src: Path) -> Optional[Path]:
+    """Where GitSetupModule records its last sync (None outside a git checkout)"""
+    # Inside the git dir: invisible to git status and untouched by git clean
+    result = subprocess.run(
+        ["git", "rev-parse", "--absolute-git-dir"],
+        text=True,
+        capture_output=True,
+        cwd=chromium_src,
+    )
+    git_dir = result.stdout.strip() if result.returncode == 0 else ""
+    return Path(git_dir) / SYNC_STATE_NAME if git_dir else None
+
+
+def forget_sync_state(chromium_src: Path) -> None:
+    """Make the next git_setup run gclient sync (and its hooks) again"""
+    state_path = sync_state_path(chromium_src)
+    if state_path is not None:
+        state_path.unlink(missing_ok=True)
+
 
 class GitSetupModule(CommandModule):
     produces = []
@@ -24,22 +62,89 @@ class GitSetupModule(CommandModule):
     def execute(self, ctx: Context) -> None:
         log_info(f"\n🔀 Setting up Chromium {ctx.chromium_version}...")
 
-        log_info("📥 Fetching all tags from remote...")
-        run_command(["git", "fetch", "--tags", "--force"], cwd=ctx.chromium_src)
+        state_path = self._state_path(ctx)
+        previous = self._load_state(state_path)
 
-        self._verify_tag_exists(ctx)
+        tag_commit = self._tag_commit(ctx)
+        if tag_commit is None:
+            log_info(f"📥 Fetching tag {ctx.chromium_version} from remote...")
+            tag_ref = f"refs/tags/{ctx.chromium_version}"
+            run_command(
+                ["git", "fetch", "--force", "--no-tags", "origin", f"{tag_ref}:{tag_ref}"],
+                cwd=ctx.chromium_src,
+            )
+            self._verify_tag_exists(ctx)
+            tag_commit = self._tag_commit(ctx)
+        else:
+            log_info(f"✓ Tag {ctx.chromium_version} already present locally, skipping fetch")
+
+        if self._head_commit(ctx) != tag_commit:
+            log_info(f"🔀 Checking out tag: {ctx.chromium_version}")
+            run_command(["git", "checkout", f"tags/{ctx.chromium_version}"], cwd=ctx.chromium_src)
+
+        current = {
+            "tag": ctx.chromium_version,
+            "commit": tag_commit,
+            "deps_sha256": self._deps_hash(ctx),
+        }
+        if previous == current:
+            log_success(
+                f"Dependencies already synced for {ctx.chromium_version} "
+                f"(DEPS unchanged), skipping gclient sync"
+            )
+            return
 
-        log_info(f"🔀 Checking out tag: {ctx.chromium_version}")
-        run_command(["git", "checkout", f"tags/{ctx.chromium_version}"], cwd=ctx.chromium_src)
+        # Drop the old record first so an interrupted sync is never trusted
+        if state_path.exists():
+            state_path.unlink()
 
-        log_info("📥 Syncing dependencies (this may take a while)...")
-        if IS_WINDOWS():
-            run_command(["gclient.bat", "sync", "-D", "--no-history", "--shallow"], cwd=ctx.chromium_src)
-        else:
-            run_command(["gclient", "sync", "-D", "--no-history", "--shallow"], cwd=ctx.chromium_src)
+        jobs = EnvConfig().gclient_jobs
+        log_info(f"📥 Syncing dependencies with {jobs} jobs (this may take a while)...")
+        gclient = "gclient.bat" if IS_WINDOWS() else "gclient"
+        run_command(
+            [gclient, "sync", "-D", "--no-history", "--shallow", "--jobs", str(jobs)],
+            cwd=ctx.chromium_src,
+        )
 
+        state_path.write_text(json.dumps(current, indent=2) + "\n")
         log_success("Git setup complete")
 
+    def _git_output(self, ctx: Context, *args: str) -> Optional[str]:
+        result = subprocess.run(
+            ["git", *args], text=True, capture_output=True, cwd=ctx.chromium_src
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+
+    def _tag_commit(self, ctx: Context) -> Optional[str]:
+        return self._git_output(
+            ctx, "rev-parse", "-q", "--verify", f"refs/tags/{ctx.chromium_version}^{{commit}}"
+        )
+
+    def _head_commit(self, ctx: Context) -> Optional[str]:
+        return self._git_output(ctx, "rev-parse", "HEAD")
+
+    def _state_path(self, ctx: Context) -> Path:
+        state_path = sync_state_path(ctx.chromium_src)
+        if state_path is None:
+            raise RuntimeError(f"Not a git checkout: {ctx.chromium_src}")
+        return state_path
+
+    def _load_state(self, path: Path) -> Optional[Dict[str, str]]:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _deps_hash(self, ctx: Context) -> str:
+        """Hash of DEPS plus the .gclient solution file (target_os etc.)"""
+        digest = hashlib.sha256()
+        for path in (ctx.chromium_src / "DEPS", ctx.chromium_src.parent / ".gclient"):
+            if path.exists():
+                digest.update(path.name.encode() + b"\0" + path.read_bytes())
+        return digest.hexdigest()
+
     def _verify_tag_exists(self, ctx: Context) -> None:
         result = subprocess.run(
             ["git", "tag", "-l", ctx.chromium_version],
@@ -5,8 +5,10 @@ import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Set, Tuple
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.env import EnvConfig
@@ -78,8 +80,10 @@ class MacOSSignModule(CommandModule):
         env_ok, env_vars = check_environment(ctx.env)
 
         self._clear_extended_attributes(app_path)
-        self._sign_all_components(app_path, env_vars["certificate_name"], ctx)
-        self._verify_signature(app_path)
+        log_info("🔍 Discovering components to sign...")
+        inventory = find_components_to_sign(app_path, ctx)
+        self._sign_all_components(app_path, env_vars["certificate_name"], ctx, inventory)
+        self._verify_signature(app_path, inventory)
         self._notarize(app_path, env_vars, ctx)
 
         ctx.artifact_registry.add("signed_app", app_path)
@@ -89,12 +93,18 @@ class MacOSSignModule(CommandModule):
         log_info("🧹 Clearing extended attributes...")
         run_command(["xattr", "-cs", str(app_path)])
 
-    def _sign_all_components(self, app_path: Path, certificate_name: str, ctx: Context) -> None:
-        if not sign_all_components(app_path, certificate_name, ctx.root_dir, ctx):
+    def _sign_all_components(
+        self,
+        app_path: Path,
+        certificate_name: str,
+        ctx: Context,
+        inventory: "ComponentInventory",
+    ) -> None:
+        if not sign_all_components(app_path, certificate_name, ctx.root_dir, ctx, inventory):
             raise RuntimeError("Failed to sign all components")
 
-    def _verify_signature(self, app_path: Path) -> None:
-        if not verify_signature(app_path):
+    def _verify_signature(self, app_path: Path, inventory: "ComponentInventory") -> None:
+        if not verify_signature(app_path, inventory):
             raise RuntimeError("Signature verification failed")
 
     def _notarize(self, app_path: Path, env_vars: Dict[str, str], ctx: Context) -> None:
@@ -167,98 +177,140 @@ def check_environment(env: Optional[EnvConfig] = None) -> Tuple[bool, Dict[str,
     return True, env_vars
 
 
-def find_components_to_sign(
-    app_path: Path, ctx: Optional[Context] = None
-) -> Dict[str, List[Path]]:
-    """Dynamically find all components that need signing"""
-    components = {
-        "helpers": [],
-        "xpc_services": [],
-        "frameworks": [],
-        "dylibs": [],
-        "executables": [],
-        "apps": [],
-    }
+@dataclass
+class ComponentInventory:
+    """Signable components of an app bundle, by kind
 
-    framework_path = join_paths(app_path, "Contents", "Frameworks")
+    Paths are unique by their resolved location, so a component reachable
+    through a framework's Versions/Current-style symlinks is listed once.
+    """
 
-    # Check both versioned and non-versioned paths for BrowserOS Framework
-    # Handle both release and debug framework names
-    framework_names = [
-        "BrowserOS Framework.framework",
-        "BrowserOS Dev Framework.framework",
-    ]
-    nxtscape_framework_paths = []
+    helpers: List[Path] = field(default_factory=list)
+    xpc_services: List[Path] = field(default_factory=list)
+    frameworks: List[Path] = field(default_factory=list)
+    dylibs: List[Path] = field(default_factory=list)
+    executables: List[Path] = field(default_factory=list)
+    apps: List[Path] = field(default_factory=list)
+    _seen: Set[str] = field(default_factory=set, repr=False)
+
+    def add(self, kind: str, path: Path, is_symlink: bool = False) -> None:
+        key = os.path.realpath(path) if is_symlink else str(path)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        getattr(self, kind).append(path)
+
+    def categories(self) -> Dict[str, List[Path]]:
+        return {
+            "helpers": self.helpers,
+            "xpc_services": self.xpc_services,
+            "frameworks": self.frameworks,
+            "dylibs": self.dylibs,
+            "executables": self.executables,
+            "apps": self.apps,
+        }
+
+    def all(self) -> List[Path]:
+        return [path for items in self.categories().values() for path in items]
+
+
+# Bundle suffix -> inventory kind
+_BUNDLE_KINDS = {".xpc": "xpc_services", ".framework": "frameworks", ".app": "apps"}
+
+
+def _is_executable_file(entry: os.DirEntry) -> bool:
+    """File without an extension and with the executable bit"""
+    return (
+        not os.path.splitext(entry.name)[1]
+        and entry.is_file()
+        and os.access(entry.path, os.X_OK)
+    )
 
-    for fw_name in framework_names:
+
+def _helpers_dir(framework_path: Path, ctx: Optional[Context]) -> Optional[str]:
+    """Resolved Helpers dir of the BrowserOS framework (versioned path preferred)"""
+    # Handle both release and debug framework names
+    for fw_name in ["BrowserOS Framework.framework", "BrowserOS Dev Framework.framework"]:
         fw_path = join_paths(framework_path, fw_name)
-        if fw_path.exists():
-            nxtscape_framework_paths.append(fw_path)
+        if not fw_path.exists():
+            continue
+        candidates = [fw_path]
+        if ctx and ctx.browseros_chromium_version:
+            candidates.insert(0, join_paths(fw_path, "Versions", ctx.browseros_chromium_version))
+        for candidate in candidates:
+            helpers_dir = join_paths(candidate, "Helpers")
+            if helpers_dir.is_dir():
+                return os.path.realpath(helpers_dir)
+    return None
 
-            # Add versioned path if context is available
-            if ctx and ctx.browseros_chromium_version:
-                versioned_path = join_paths(
-                    fw_path, "Versions", ctx.browseros_chromium_version
-                )
-                if versioned_path.exists():
-                    nxtscape_framework_paths.insert(
-                        0, versioned_path
-                    )  # Prioritize versioned path
-
-    # Find all helper apps
-    for nxtscape_fw_path in nxtscape_framework_paths:
-        helpers_dir = join_paths(nxtscape_fw_path, "Helpers")
-        if helpers_dir.exists():
-            # Find all .app helpers
-            components["helpers"].extend(helpers_dir.glob("*.app"))
-            # Find all executable helpers (files without extension)
-            for item in helpers_dir.iterdir():
-                if item.is_file() and not item.suffix and os.access(item, os.X_OK):
-                    components["executables"].append(item)
-            break  # Use the first valid path found
-
-    # Find all XPC services
-    for xpc_path in framework_path.rglob("*.xpc"):
-        components["xpc_services"].append(xpc_path)
-
-    # Find all frameworks (with special handling for Sparkle)
-    for fw_path in framework_path.rglob("*.framework"):
-        components["frameworks"].append(fw_path)
-
-        # Special handling for Sparkle framework versioned structure
-        if "Sparkle.framework" in str(fw_path):
-            # Look for Sparkle's versioned executables at Versions/B/
-            sparkle_version_b = join_paths(fw_path, "Versions", "B")
-            if sparkle_version_b.exists():
-                # Add Autoupdate executable if it exists
-                autoupdate = join_paths(sparkle_version_b, "Autoupdate")
-                if autoupdate.exists() and autoupdate.is_file():
-                    components["executables"].append(autoupdate)
-
-    # Find all dylibs (check versioned path for BrowserOS Framework libraries)
-    for nxtscape_fw_path in nxtscape_framework_paths:
-        libraries_dir = join_paths(nxtscape_fw_path, "Libraries")
-        if libraries_dir.exists():
-            components["dylibs"].extend(libraries_dir.glob("*.dylib"))
-
-    # Also find dylibs in other frameworks
-    for dylib_path in framework_path.rglob("*.dylib"):
-        if dylib_path not in components["dylibs"]:
-            components["dylibs"].append(dylib_path)
-
-    # Find all nested apps (like Updater.app in Sparkle)
-    for nested_app in framework_path.rglob("*.app"):
-        if nested_app not in components["helpers"]:
-            components["apps"].append(nested_app)
-
-    # Find BrowserOS Server binaries
-    browseros_server_dir = join_paths(app_path, "Contents", "Resources", "BrowserOSServer")
-    if browseros_server_dir.exists():
-        for item in browseros_server_dir.rglob("*"):
-            if item.is_file() and not item.suffix and os.access(item, os.X_OK):
-                components["executables"].append(item)
-
-    return components
+
+def find_components_to_sign(
+    app_path: Path, ctx: Optional[Context] = None
+) -> ComponentInventory:
+    """Find all components that need signing in one walk of the bundle
+
+    Contents/Frameworks and Contents/Resources/BrowserOSServer are walked
+    once with os.scandir (symlinked directories are not followed) and every
+    entry is classified on the spot:
+
+        *.xpc / *.framework / *.dylib / *.app   by suffix
+        BrowserOS Framework Helpers/            *.app are helpers, extensionless
+                                                executables are executables
+        Sparkle.framework                       plus Versions/B/Autoupdate
+        BrowserOSServer/                        extensionless executables
+    """
+    inventory = ComponentInventory()
+    contents = os.path.realpath(join_paths(app_path, "Contents"))
+    framework_path = Path(contents, "Frameworks")
+    helpers_dir = _helpers_dir(framework_path, ctx)
+
+    stack = [str(framework_path)]
+    while stack:
+        directory = stack.pop()
+        in_helpers = directory == helpers_dir
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            is_symlink = entry.is_symlink()
+            is_dir = entry.is_dir()
+            suffix = os.path.splitext(entry.name)[1]
+
+            if in_helpers and suffix == ".app":
+                inventory.add("helpers", path, is_symlink)
+            elif in_helpers and not is_dir and _is_executable_file(entry):
+                inventory.add("executables", path, is_symlink)
+            elif suffix in _BUNDLE_KINDS:
+                inventory.add(_BUNDLE_KINDS[suffix], path, is_symlink)
+            elif suffix == ".dylib":
+                inventory.add("dylibs", path, is_symlink)
+
+            # Sparkle keeps a versioned Autoupdate executable
+            if entry.name == "Sparkle.framework":
+                autoupdate = join_paths(path, "Versions", "B", "Autoupdate")
+                if autoupdate.is_file():
+                    inventory.add("executables", autoupdate)
+
+            if is_dir and not is_symlink:
+                stack.append(entry.path)
+
+    # BrowserOS Server binaries
+    stack = [os.path.join(contents, "Resources", "BrowserOSServer")]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif _is_executable_file(entry):
+                inventory.add("executables", Path(entry.path), entry.is_symlink())
+
+    return inventory
 
 
 def get_identifier_for_component(
@@ -372,126 +424,158 @@ def sign_component(
         return False
 
 
+# codesign calls in flight per tier; each mostly waits on the timestamp server
+SIGN_WORKERS = 8
+
+
+@dataclass
+class SignJob:
+    """One codesign invocation"""
+
+    path: Path
+    identifier: Optional[str] = None
+    options: Optional[str] = None
+    entitlements: Optional[Path] = None
+
+
+def _find_entitlements(name: Optional[str], entitlements_dirs: List[Path]) -> Optional[Path]:
+    if not name:
+        return None
+    for ent_dir in entitlements_dirs:
+        ent_path = join_paths(ent_dir, name)
+        if ent_path.exists():
+            return ent_path
+    return None
+
+
+def _helper_entitlements_name(helper: Path) -> Optional[str]:
+    if "Renderer" in helper.name:
+        return "helper-renderer-entitlements.plist"
+    if "GPU" in helper.name:
+        return "helper-gpu-entitlements.plist"
+    if "Plugin" in helper.name:
+        return "helper-plugin-entitlements.plist"
+    return None
+
+
+def plan_sign_jobs(
+    inventory: ComponentInventory, ctx: Optional[Context] = None
+) -> List[SignJob]:
+    """Identifier, options and entitlements for every discovered component"""
+    entitlements_dirs = [ctx.get_entitlements_dir()] if ctx else []
+    jobs = []
+
+    for path in inventory.xpc_services + inventory.apps:
+        jobs.append(SignJob(path, get_identifier_for_component(path), get_signing_options(path)))
+
+    for exe in inventory.executables:
+        server_info = get_browseros_server_binary_info(exe) or {}
+        jobs.append(
+            SignJob(
+                exe,
+                get_identifier_for_component(exe),
+                get_signing_options(exe),
+                _find_entitlements(server_info.get("entitlements"), entitlements_dirs),
+            )
+        )
+
+    for path in inventory.dylibs + inventory.frameworks:
+        jobs.append(SignJob(path, get_identifier_for_component(path)))
+
+    for helper in inventory.helpers:
+        jobs.append(
+            SignJob(
+                helper,
+                get_identifier_for_component(helper),
+                get_signing_options(helper),
+                _find_entitlements(_helper_entitlements_name(helper), entitlements_dirs),
+            )
+        )
+    return jobs
+
+
+def plan_sign_tiers(jobs: List[SignJob]) -> List[List[SignJob]]:
+    """Group jobs so that everything nested in a component is in an earlier tier
+
+    A component's tier is one more than the highest tier among the components
+    inside it; leaves (dylibs, executables, bundles with nothing signable
+    inside) are tier 0. Components within a tier are independent.
+    """
+    # Keyed by real path: a component reached through a symlink (e.g.
+    # Versions/Current) is the same component and must be signed once
+    unique: Dict[Path, SignJob] = {}
+    for job in jobs:
+        unique.setdefault(Path(os.path.realpath(job.path)), job)
+
+    # Deepest paths first, so nested components are placed before their parents
+    ordered = sorted(unique, key=lambda path: len(path.parts), reverse=True)
+    tier_of: Dict[Path, int] = {}
+    for path in ordered:
+        parts = path.parts
+        nested = [
+            tier_of[other]
+            for other in tier_of
+            if len(other.parts) > len(parts) and other.parts[: len(parts)] == parts
+        ]
+        tier_of[path] = max(nested) + 1 if nested else 0
+
+    tiers: List[List[SignJob]] = [[] for _ in range(max(tier_of.values(), default=-1) + 1)]
+    for path, job in unique.items():
+        tiers[tier_of[path]].append(job)
+    return tiers
+
+
+def sign_in_tiers(
+    tiers: List[List[SignJob]], certificate_name: str, workers: int = SIGN_WORKERS
+) -> bool:
+    """Sign tier by tier, each tier concurrently; stops after a failed tier
+
+    codesign is looked up on PATH, so the orchestration can be exercised on
+    any platform with a stand-in script that records call order.
+    """
+    for number, tier in enumerate(tiers, 1):
+        log_info(f"\n🔏 Signing tier {number}/{len(tiers)} ({len(tier)} components)...")
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tier)))) as pool:
+            results = list(
+                pool.map(
+                    lambda job: sign_component(
+                        job.path,
+                        certificate_name,
+                        job.identifier,
+                        job.options,
+                        job.entitlements,
+                    ),
+                    tier,
+                )
+            )
+        if not all(results):
+            return False
+    return True
+
+
 def sign_all_components(
     app_path: Path,
     certificate_name: str,
     root_dir: Path,
     ctx: Optional[Context] = None,
+    inventory: Optional[ComponentInventory] = None,
 ) -> bool:
-    """Sign all components in the correct order (bottom-up)"""
-    log_info("🔍 Discovering components to sign...")
-    components = find_components_to_sign(app_path, ctx)
+    """Sign all components in the correct order (bottom-up)
+
+    inventory: components from find_components_to_sign, discovered here if
+    not given (pass it on to verify_signature to reuse the walk).
+    """
+    if inventory is None:
+        log_info("🔍 Discovering components to sign...")
+        inventory = find_components_to_sign(app_path, ctx)
 
     # Print summary
-    total_components = sum(len(items) for items in components.values())
-    log_info(f"Found {total_components} components to sign:")
-    for category, items in components.items():
+    log_info(f"Found {len(inventory.all())} components to sign:")
+    for category, items in inventory.categories().items():
         if items:
             log_info(f"  • {category}: {len(items)} items")
 
-    # Sign in correct order (bottom-up)
-    # 1. Sign XPC Services first
-    log_info("\n🔏 Signing XPC Services...")
-    for xpc in components["xpc_services"]:
-        identifier = get_identifier_for_component(xpc)
-        options = get_signing_options(xpc)
-        if not sign_component(xpc, certificate_name, identifier, options):
-            return False
-
-    # 2. Sign nested apps (like Sparkle's Updater.app)
-    if components["apps"]:
-        log_info("\n🔏 Signing nested applications...")
-        for nested_app in components["apps"]:
-            identifier = get_identifier_for_component(nested_app)
-            options = get_signing_options(nested_app)
-            if not sign_component(nested_app, certificate_name, identifier, options):
-                return False
-
-    # 3. Sign executables
-    if components["executables"]:
-        log_info("\n🔏 Signing executables...")
-        # Get entitlements directory from context
-        entitlements_dirs = []
-        if ctx:
-            entitlements_dirs.append(ctx.get_entitlements_dir())
-
-        for exe in components["executables"]:
-            identifier = get_identifier_for_component(exe)
-            options = get_signing_options(exe)
-
-            # Check for specific entitlements
-            entitlements = None
-            browseros_server_info = get_browseros_server_binary_info(exe)
-            if browseros_server_info:
-                entitlements_name = browseros_server_info.get("entitlements")
-                if entitlements_name:
-                    for ent_dir in entitlements_dirs:
-                        ent_path = join_paths(ent_dir, entitlements_name)
-                        if ent_path.exists():
-                            entitlements = ent_path
-                            break
-
-            if not sign_component(exe, certificate_name, identifier, options, entitlements):
-                return False
-
-    # 4. Sign dylibs
-    if components["dylibs"]:
-        log_info("\n🔏 Signing dynamic libraries...")
-        for dylib in components["dylibs"]:
-            identifier = get_identifier_for_component(dylib)
-            if not sign_component(dylib, certificate_name, identifier):
-                return False
-
-    # 5. Sign helper apps
-    if components["helpers"]:
-        log_info("\n🔏 Signing helper applications...")
-        # Get entitlements directory from context
-        entitlements_dirs = []
-        if ctx:
-            entitlements_dirs.append(ctx.get_entitlements_dir())
-
-        for helper in components["helpers"]:
-            identifier = get_identifier_for_component(helper)
-            options = get_signing_options(helper)
-
-            # Check for specific entitlements
-            entitlements = None
-            entitlements_name = None
-
-            if "Renderer" in helper.name:
-                entitlements_name = "helper-renderer-entitlements.plist"
-            elif "GPU" in helper.name:
-                entitlements_name = "helper-gpu-entitlements.plist"
-            elif "Plugin" in helper.name:
-                entitlements_name = "helper-plugin-entitlements.plist"
-
-            if entitlements_name:
-                for ent_dir in entitlements_dirs:
-                    ent_path = join_paths(ent_dir, entitlements_name)
-                    if ent_path.exists():
-                        entitlements = ent_path
-                        break
-
-            if not sign_component(
-                helper, certificate_name, identifier, options, entitlements
-            ):
-                return False
-
-    # 6. Sign frameworks (except the main BrowserOS Framework)
-    if components["frameworks"]:
-        log_info("\n🔏 Signing frameworks...")
-        # Sort to sign Sparkle.framework before BrowserOS Framework.framework
-        frameworks_sorted = sorted(
-            components["frameworks"], key=lambda x: 0 if "Sparkle" in x.name else 1
-        )
-        for framework in frameworks_sorted:
-            identifier = get_identifier_for_component(framework)
-            if not sign_component(framework, certificate_name, identifier):
-                return False
-
-    # 7. Sign main executable
-    log_info("\n🔏 Signing main executable...")
-    # Handle both release and debug executable names
+    # Main executable (release and debug names); the bundle itself is last
     main_exe_names = ["BrowserOS", "BrowserOS Dev"]
     main_exe = None
     for exe_name in main_exe_names:
@@ -506,10 +590,14 @@ def sign_all_components(
         )
         return False
 
-    if not sign_component(main_exe, certificate_name, "com.browseros.BrowserOS"):
+    jobs = plan_sign_jobs(inventory, ctx)
+    jobs.append(SignJob(main_exe, "com.browseros.BrowserOS"))
+
+    # Bottom-up: each tier only holds components whose nested code is signed
+    if not sign_in_tiers(plan_sign_tiers(jobs), certificate_name):
         return False
 
-    # 8. Finally sign the app bundle
+    # Finally sign the app bundle
     log_info("\n🔏 Signing application bundle...")
     requirements = (
         '=designated => identifier "com.browseros.BrowserOS" and '
@@ -575,8 +663,14 @@ def sign_all_components(
     return True
 
 
-def verify_signature(app_path: Path) -> bool:
-    """Verify application signature"""
+def verify_signature(
+    app_path: Path, inventory: Optional[ComponentInventory] = None
+) -> bool:
+    """Verify application signature
+
+    If the deep check fails and an inventory is given, every component is
+    verified on its own to name the ones at fault.
+    """
     log_info("\n🔍 Verifying application signature integrity...")
 
     result = run_command(
@@ -586,12 +680,34 @@ def verify_signature(app_path: Path) -> bool:
 
     if result.returncode != 0:
         log_error("Signature verification failed!")
+        if inventory is not None:
+            failed = find_unverified_components(inventory)
+            for path in failed:
+                log_error(f"  Invalid signature: {path}")
+            if not failed:
+                log_error("  All components verify on their own; the bundle itself is at fault")
         return False
 
     log_success("Signature verification passed")
     return True
 
 
+def find_unverified_components(
+    inventory: ComponentInventory, workers: int = SIGN_WORKERS
+) -> List[Path]:
+    """Components whose own signature fails `codesign --verify --strict`"""
+
+    def verify(path: Path) -> bool:
+        return run_command(
+            ["codesign", "--verify", "--strict", str(path)], check=False
+        ).returncode == 0
+
+    components = inventory.all()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(components)))) as pool:
+        results = list(pool.map(verify, components))
+    return [path for path, ok in zip(components, results) if not ok]
+
+
 def notarize_app(
     app_path: Path,
     root_dir: Path,
@@ -743,13 +859,15 @@ def sign_app(ctx: Context, create_dmg: bool = True) -> bool:
         run_command(["xattr", "-cs", str(app_path)])
 
         # Sign all components
+        log_info("🔍 Discovering components to sign...")
+        inventory = find_components_to_sign(app_path, ctx)
         if not sign_all_components(
-            app_path, env_vars["certificate_name"], ctx.root_dir, ctx
+            app_path, env_vars["certificate_name"], ctx.root_dir, ctx, inventory
         ):
             return False
 
         # Verify signature
-        if not verify_signature(app_path):
+        if not verify_signature(app_path, inventory):
             return False
 
         # Notarize app
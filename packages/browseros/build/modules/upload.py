@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Cloudflare R2 upload module for BrowserOS build artifacts"""
 
+import importlib.util
 import json
 import os
 from datetime import datetime, timezone
@@ -21,14 +22,9 @@ from ..common.utils import (
 )
 from ..common.notify import get_notifier, COLOR_GREEN
 
-# Try to import boto3 for R2 (S3-compatible)
-try:
-    import boto3
-    from botocore.config import Config
-
-    BOTO3_AVAILABLE = True
-except ImportError:
-    BOTO3_AVAILABLE = False
+# boto3 for R2 (S3-compatible) - only probed here, imported lazily in
+# get_r2_client() since it dominates CLI startup time otherwise
+BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
 
 
 def _get_platform() -> str:
@@ -90,6 +86,9 @@ def get_r2_client(env: Optional[EnvConfig] = None):
     if not env.has_r2_config():
         return None
 
+    import boto3
+    from botocore.config import Config
+
     return boto3.client(
         "s3",
         endpoint_url=env.r2_endpoint_url,
@@ -191,6 +190,7 @@ def _get_artifact_key(filename: str, platform: str) -> str:
         BrowserOS_v0.31.0_x64_installer.exe -> x64_installer
         BrowserOS_v0.31.0_x64.AppImage -> x64_appimage
         browseros_0.31.0_amd64.deb -> x64_deb
+        browseros_0.31.0_arm64.deb -> arm64_deb
     """
     lower = filename.lower()
 
@@ -209,10 +209,11 @@ def _get_artifact_key(filename: str, platform: str) -> str:
             return "x64_zip"
 
     elif platform == "linux":
+        arch = "arm64" if ("arm64" in lower or "aarch64" in lower) else "x64"
         if ".appimage" in lower:
-            return "x64_appimage"
+            return f"{arch}_appimage"
         elif ".deb" in lower:
-            return "x64_deb"
+            return f"{arch}_deb"
 
     # Fallback: use filename without extension
     return Path(filename).stem
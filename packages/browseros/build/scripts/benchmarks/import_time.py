@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+CLI import-time benchmark for BrowserOS build system.
+
+Measures how long a fresh interpreter takes to import the CLI entry point
+(what every `browseros ...` invocation pays before doing any work) and fails
+if the median cost on top of bare interpreter startup exceeds the budget. Run it after touching imports in build/cli
+or build/common to catch eager heavy imports (boto3, sign/package modules).
+
+Usage:
+    python build/scripts/benchmarks/import_time.py [--budget-ms 200] [--runs 7]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[3]
+
+DEFAULT_BUDGET_MS = 200
+DEFAULT_RUNS = 7
+
+# Imports that must stay lazy - if any shows up, the budget is at risk
+FORBIDDEN_EAGER_IMPORTS = [
+    "boto3",
+    "requests",
+    "build.modules.upload",
+    "build.modules.sign.macos",
+    "build.modules.package.macos",
+    "build.modules.package.linux",
+]
+
+
+def measure_once(entry_module: str) -> float:
+    """Import entry_module in a fresh interpreter, return wall time in ms."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {entry_module}"],
+        cwd=PACKAGE_ROOT,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def find_eager_imports(entry_module: str) -> list[str]:
+    """Return forbidden modules that get imported by entry_module at import time."""
+    check = (
+        f"import sys, {entry_module}; "
+        f"print('\\n'.join(m for m in {FORBIDDEN_EAGER_IMPORTS!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=PACKAGE_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="CLI import-time benchmark for BrowserOS build system"
+    )
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--entry", default="build.browseros")
+    args = parser.parse_args()
+
+    # Baseline: bare interpreter startup, so the report shows our own cost
+    baseline = statistics.median(measure_once("sys") for _ in range(args.runs))
+    samples = [measure_once(args.entry) for _ in range(args.runs)]
+    median = statistics.median(samples)
+    import_cost = median - baseline
+
+    print(f"Interpreter startup: {baseline:.0f} ms")
+    print(
+        f"import {args.entry}: median {median:.0f} ms "
+        f"(min {min(samples):.0f}, max {max(samples):.0f}, {args.runs} runs)"
+    )
+    print(f"Import cost: {import_cost:.0f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+
+    eager = find_eager_imports(args.entry)
+    if eager:
+        print(f"✗ Imported eagerly (should be lazy): {', '.join(eager)}")
+        failed = True
+
+    if import_cost > args.budget_ms:
+        print(f"✗ Over budget by {import_cost - args.budget_ms:.0f} ms")
+        failed = True
+
+    if not failed:
+        print("✓ Within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
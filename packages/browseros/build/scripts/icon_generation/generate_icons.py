@@ -5,19 +5,31 @@ Unified icon generation script for BrowserOS.
 Generates all platform-specific icons (Windows, macOS, Linux, ChromeOS) from
 a single high-resolution source PNG.
 
+Generation is content-addressed: every operation is keyed by the sha256 of
+its source plus its spec (type, sizes, destination), and outputs whose cache
+entry matches - and whose files still hash to what was written - are
+skipped. The remaining renders run in a process pool; each worker decodes
+the sources once and reuses resized images across operations.
+
 Requirements:
 - Python 3.12+
 - Pillow (pip install Pillow)
-- ImageMagick (brew install imagemagick) - for XPM generation
 - macOS tools (iconutil, actool) - for .icns and Assets.car generation
 
 Usage:
-    python generate_icons.py [--config generate_icons.txt]
+    python generate_icons.py [--config generate_icons.txt] [--force] [--jobs N]
 """
 
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -34,6 +46,30 @@ OUTPUT_DIR = SCRIPT_DIR.parent.parent.parent / "resources" / "icons"
 
 MIN_SOURCE_SIZE = 1024
 
+CACHE_FILE = SCRIPT_DIR / ".generate_icons_cache.json"
+CACHE_VERSION = 1
+
+# Bump when the output of a generator changes for the same source and spec
+GENERATOR_VERSION = 2
+
+# Operations rendered in the process pool (copy runs inline, assets_car
+# depends on the xcassets output)
+RENDER_TYPES = ("png", "mono", "ico", "xpm", "icns", "xcassets")
+
+# XPM pixel characters, in the order ImageMagick's `convert` uses them
+XPM_CHARS = (
+    " .XoO+@#$%&*=-;:>,<1234567890qwertyuipasdfghjk"
+    "lzxcvbnmMNBVCZASDFGHJKLPIUYTREWQ!~^/()_`'][{}|"
+)
+XPM_NAMED_COLORS = {"#FFFFFF": "white", "#000000": "black"}
+
+# Opaque colors in an XPM (plus "None"), like ImageMagick's 256-color limit
+XPM_MAX_COLORS = 255
+
+APPICONSET_SIZES = [16, 32, 64, 128, 256, 512, 1024]
+
+UP_TO_DATE = "  ✓ Up to date\n"
+
 
 def validate_source(source_path: Path) -> Image.Image:
     """Load and validate source image meets minimum requirements."""
@@ -55,11 +91,24 @@ def validate_source(source_path: Path) -> Image.Image:
     return img
 
 
+# Resized images per worker, keyed by (id(source image), size). Sources live
+# for the whole run, so their ids are stable.
+_resized: dict[tuple[int, int], Image.Image] = {}
+
+
+def resize(img: Image.Image, size: int) -> Image.Image:
+    """LANCZOS resize, cached so ICO/ICNS/PNG ops share the same render."""
+    key = (id(img), size)
+    if key not in _resized:
+        _resized[key] = img.resize((size, size), Image.Resampling.LANCZOS)
+    return _resized[key]
+
+
 def generate_png(img: Image.Image, size: int, output_path: Path) -> bool:
     """Generate a PNG at specified size."""
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
+        resized = resize(img, size)
         resized.save(output_path, "PNG", optimize=True)
         return True
     except Exception as e:
@@ -71,7 +120,7 @@ def generate_mono_png(img: Image.Image, size: int, output_path: Path) -> bool:
     """Generate a monochrome (white silhouette) PNG from alpha channel."""
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
+        resized = resize(img, size)
 
         # Extract alpha channel and create white silhouette
         if resized.mode != "RGBA":
@@ -97,7 +146,7 @@ def generate_ico(img: Image.Image, sizes: list[int], output_path: Path) -> bool:
         sorted_sizes = sorted(sizes, reverse=True)
         icons = []
         for size in sorted_sizes:
-            resized = img.resize((size, size), Image.Resampling.LANCZOS)
+            resized = resize(img, size)
             icons.append(resized)
 
         icons[0].save(
@@ -112,33 +161,66 @@ def generate_ico(img: Image.Image, sizes: list[int], output_path: Path) -> bool:
         return False
 
 
+def encode_xpm(img: Image.Image, name: str) -> str:
+    """Encode an image as XPM in the layout ImageMagick's `convert` writes.
+
+    Alpha is thresholded at 50%: transparent pixels become "None", the rest
+    are quantized to at most XPM_MAX_COLORS colors. Colors are listed
+    sorted, "None" first.
+    """
+    rgba = img.convert("RGBA")
+    width, height = rgba.size
+    alpha = rgba.getchannel("A").tobytes()
+    quantized = rgba.convert("RGB").quantize(XPM_MAX_COLORS)
+    palette = quantized.getpalette() or []
+    palette_colors = [
+        f"#{palette[i]:02X}{palette[i + 1]:02X}{palette[i + 2]:02X}"
+        for i in range(0, len(palette) - 2, 3)
+    ]
+    pixels = [
+        "None" if a < 128 else palette_colors[index]
+        for a, index in zip(alpha, quantized.tobytes())
+    ]
+
+    colors = sorted(set(pixels), key=lambda c: (c != "None", c))
+    cpp = 1
+    capacity = len(XPM_CHARS)
+    while len(colors) > capacity:
+        cpp += 1
+        capacity *= len(XPM_CHARS)
+
+    def symbol(index: int) -> str:
+        chars = []
+        for _ in range(cpp):
+            chars.append(XPM_CHARS[index % len(XPM_CHARS)])
+            index //= len(XPM_CHARS)
+        return "".join(chars)
+
+    symbols = {color: symbol(i) for i, color in enumerate(colors)}
+    lines = [
+        "/* XPM */",
+        f"static char *{re.sub(r'[^A-Za-z0-9_]', '_', name)}[] = {{",
+        "/* columns rows colors chars-per-pixel */",
+        f'"{width} {height} {len(colors)} {cpp} ",',
+    ]
+    for color in colors:
+        lines.append(f'"{symbols[color]} c {XPM_NAMED_COLORS.get(color, color)}",')
+    lines.append("/* pixels */")
+    rows = [
+        "".join(symbols[p] for p in pixels[y * width : (y + 1) * width])
+        for y in range(height)
+    ]
+    lines.append(",\n".join(f'"{row}"' for row in rows))
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
 def generate_xpm(img: Image.Image, size: int, output_path: Path) -> bool:
-    """Generate XPM using ImageMagick."""
+    """Generate XPM (encoded in-process, no ImageMagick needed)."""
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # First create a temporary PNG
-        temp_png = output_path.with_suffix(".tmp.png")
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(temp_png, "PNG")
-
-        # Convert to XPM using ImageMagick
-        result = subprocess.run(
-            ["convert", str(temp_png), str(output_path)],
-            capture_output=True,
-            text=True,
-        )
-
-        temp_png.unlink()  # Clean up temp file
-
-        if result.returncode != 0:
-            print(f"  ✗ ImageMagick error: {result.stderr}")
-            return False
-
+        output_path.write_text(encode_xpm(resize(img, size), output_path.stem))
         return True
-    except FileNotFoundError:
-        print("  ✗ ImageMagick not found. Install with: brew install imagemagick")
-        return False
     except Exception as e:
         print(f"  ✗ Failed to generate {output_path}: {e}")
         return False
@@ -168,7 +250,7 @@ def generate_icns(img: Image.Image, output_path: Path) -> bool:
         ]
 
         for size, filename in iconset_sizes:
-            resized = img.resize((size, size), Image.Resampling.LANCZOS)
+            resized = resize(img, size)
             resized.save(iconset_dir / filename, "PNG")
 
         # Run iconutil
@@ -201,9 +283,8 @@ def generate_xcassets(img: Image.Image, output_dir: Path) -> bool:
         appiconset_dir = output_dir / "Assets.xcassets" / "AppIcon.appiconset"
         appiconset_dir.mkdir(parents=True, exist_ok=True)
 
-        appiconset_sizes = [16, 32, 64, 128, 256, 512, 1024]
-        for size in appiconset_sizes:
-            resized = img.resize((size, size), Image.Resampling.LANCZOS)
+        for size in APPICONSET_SIZES:
+            resized = resize(img, size)
             resized.save(appiconset_dir / f"appicon_{size}.png", "PNG", optimize=True)
 
         # Contents.json for AppIcon.appiconset
@@ -228,10 +309,10 @@ def generate_xcassets(img: Image.Image, output_dir: Path) -> bool:
         iconset_dir = output_dir / "Assets.xcassets" / "Icon.iconset"
         iconset_dir.mkdir(parents=True, exist_ok=True)
 
-        resized_256 = img.resize((256, 256), Image.Resampling.LANCZOS)
+        resized_256 = resize(img, 256)
         resized_256.save(iconset_dir / "icon_256x256.png", "PNG", optimize=True)
 
-        resized_512 = img.resize((512, 512), Image.Resampling.LANCZOS)
+        resized_512 = resize(img, 512)
         resized_512.save(iconset_dir / "icon_256x256@2x.png", "PNG", optimize=True)
 
         # Root Contents.json
@@ -383,6 +464,159 @@ def parse_config(config_path: Path) -> list[dict]:
     return operations
 
 
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tree_sha256(root: Path) -> str:
+    """Digest of every file under root (paths and contents)."""
+    digest = hashlib.sha256()
+    if root.is_dir():
+        for path in sorted(p for p in root.rglob("*") if p.is_file()):
+            digest.update(f"{path.relative_to(root).as_posix()}\0".encode())
+            digest.update(file_sha256(path).encode())
+    return digest.hexdigest()
+
+
+def op_key(op: dict, input_digest: str) -> str:
+    """Content address of an operation: its input plus its spec."""
+    spec = {k: v for k, v in op.items() if k not in ("line", "raw")}
+    data = json.dumps([GENERATOR_VERSION, spec, input_digest], sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def op_outputs(op: dict, output_dir: Path) -> list[Path]:
+    """Files an operation writes."""
+    dest = output_dir / op.get("dest", "")
+    if op["type"] == "xcassets":
+        xcassets = dest / "Assets.xcassets"
+        appiconset = xcassets / "AppIcon.appiconset"
+        return [
+            xcassets / "Contents.json",
+            appiconset / "Contents.json",
+            *(appiconset / f"appicon_{size}.png" for size in APPICONSET_SIZES),
+            xcassets / "Icon.iconset" / "icon_256x256.png",
+            xcassets / "Icon.iconset" / "icon_256x256@2x.png",
+        ]
+    if op["type"] == "assets_car":
+        return [dest / "Assets.car"]
+    return [dest]
+
+
+def load_cache(cache_path: Path) -> dict[str, dict]:
+    """Cache entries by config line: {"key": ..., "outputs": {path: sha256}}"""
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("operations", {})
+
+
+def save_cache(cache_path: Path, entries: dict[str, dict]) -> None:
+    data = {"version": CACHE_VERSION, "operations": entries}
+    tmp = cache_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=1, sort_keys=True))
+    os.replace(tmp, cache_path)
+
+
+def cache_entry(op: dict, key: str, output_dir: Path) -> dict:
+    return {
+        "key": key,
+        "outputs": {
+            path.relative_to(output_dir).as_posix(): file_sha256(path)
+            for path in op_outputs(op, output_dir)
+        },
+    }
+
+
+def is_current(entry: dict | None, key: str, output_dir: Path) -> bool:
+    """True if the entry has this key and every output still has its hash."""
+    if not entry or entry.get("key") != key:
+        return False
+    for relative, sha256 in entry.get("outputs", {}).items():
+        path = output_dir / relative
+        if not path.is_file() or file_sha256(path) != sha256:
+            return False
+    return True
+
+
+def describe(op: dict) -> str:
+    """Config line as printed before an operation's result."""
+    op_type = op["type"]
+    if op_type in ("png", "mono", "xpm"):
+        return f"{op_type.upper()} {op['source']} @ {op['size']} -> {op['dest']}"
+    if op_type == "ico":
+        return f"ICO {op['source']} @ {op['sizes']} -> {op['dest']}"
+    if op_type == "assets_car":
+        return f"ASSETS_CAR -> {op['dest']}"
+    return f"{op_type.upper()} {op['source']} -> {op['dest']}"
+
+
+def run_operation(op: dict, output_dir: Path) -> tuple[bool, str]:
+    """Run a copy or assets_car operation; returns (success, its output to print)."""
+    dest_path = output_dir / op.get("dest", "")
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        if op["type"] == "copy":
+            ok = copy_static(SCRIPT_DIR / op["source"], dest_path)
+            message = "Copied"
+        else:
+            ok = generate_assets_car(dest_path)
+            message = "Generated Assets.car"
+        if ok:
+            print(f"  ✓ {message}")
+    return ok, out.getvalue()
+
+
+def render_operation(op: dict, output_dir: Path, img: Image.Image) -> tuple[bool, str]:
+    """Run one of RENDER_TYPES from its source image; returns (success, its output to print)."""
+    op_type = op["type"]
+    dest_path = output_dir / op["dest"]
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        if op_type == "png":
+            ok = generate_png(img, op["size"], dest_path)
+            message = f"Generated {op['size']}x{op['size']}"
+        elif op_type == "mono":
+            ok = generate_mono_png(img, op["size"], dest_path)
+            message = f"Generated mono {op['size']}x{op['size']}"
+        elif op_type == "ico":
+            ok = generate_ico(img, op["sizes"], dest_path)
+            message = f"Generated ICO with {len(op['sizes'])} sizes"
+        elif op_type == "xpm":
+            ok = generate_xpm(img, op["size"], dest_path)
+            message = f"Generated XPM {op['size']}x{op['size']}"
+        elif op_type == "icns":
+            ok = generate_icns(img, dest_path)
+            message = "Generated ICNS"
+        else:
+            ok = generate_xcassets(img, dest_path)
+            message = "Generated Assets.xcassets"
+        if ok:
+            print(f"  ✓ {message}")
+    return ok, out.getvalue()
+
+
+# Decoded sources in a pool worker, set once by _init_worker
+_sources: dict[str, Image.Image] = {}
+
+
+def _init_worker(sources: dict[str, tuple[str, tuple[int, int], bytes]]) -> None:
+    for name, (mode, size, data) in sources.items():
+        _sources[name] = Image.frombytes(mode, size, data)
+
+
+def render(op: dict, output_dir: Path) -> tuple[bool, str]:
+    """Pool entry point for RENDER_TYPES operations."""
+    return render_operation(op, output_dir, _sources[op["source"]])
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -400,6 +634,17 @@ def main():
         default=OUTPUT_DIR,
         help="Output directory for generated icons",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every output, ignoring the cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Render worker processes (default: one per CPU)",
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -413,99 +658,93 @@ def main():
     operations = parse_config(args.config)
     print(f"Loaded {len(operations)} operations from config\n")
 
-    # Cache for loaded source images
-    source_cache: dict[str, Image.Image] = {}
-
-    def get_source(source_path: str) -> Image.Image:
-        """Get source image, loading and validating if needed."""
-        if source_path not in source_cache:
-            full_path = SCRIPT_DIR / source_path
-            source_cache[source_path] = validate_source(full_path)
-        return source_cache[source_path]
-
-    # Process operations
-    success_count = 0
-    fail_count = 0
-
-    for op in operations:
-        op_type = op["type"]
-        dest_path = args.output / op.get("dest", "")
+    cache = {} if args.force else load_cache(CACHE_FILE)
+    new_cache: dict[str, dict] = {}
+    results: dict[int, tuple[bool, str]] = {}
 
-        if op_type == "copy":
-            source_path = SCRIPT_DIR / op["source"]
-            print(f"COPY {op['source']} -> {op['dest']}")
-            if copy_static(source_path, dest_path):
-                print(f"  ✓ Copied")
-                success_count += 1
-            else:
-                fail_count += 1
-
-        elif op_type == "png":
-            print(f"PNG {op['source']} @ {op['size']} -> {op['dest']}")
-            img = get_source(op["source"])
-            if generate_png(img, op["size"], dest_path):
-                print(f"  ✓ Generated {op['size']}x{op['size']}")
-                success_count += 1
-            else:
-                fail_count += 1
+    source_digests: dict[str, str] = {}
 
-        elif op_type == "mono":
-            print(f"MONO {op['source']} @ {op['size']} -> {op['dest']}")
-            img = get_source(op["source"])
-            if generate_mono_png(img, op["size"], dest_path):
-                print(f"  ✓ Generated mono {op['size']}x{op['size']}")
-                success_count += 1
-            else:
-                fail_count += 1
+    def source_digest(source: str) -> str:
+        if source not in source_digests:
+            path = SCRIPT_DIR / source
+            source_digests[source] = file_sha256(path) if path.is_file() else ""
+        return source_digests[source]
 
-        elif op_type == "ico":
-            print(f"ICO {op['source']} @ {op['sizes']} -> {op['dest']}")
-            img = get_source(op["source"])
-            if generate_ico(img, op["sizes"], dest_path):
-                print(f"  ✓ Generated ICO with {len(op['sizes'])} sizes")
-                success_count += 1
-            else:
-                fail_count += 1
-
-        elif op_type == "xpm":
-            print(f"XPM {op['source']} @ {op['size']} -> {op['dest']}")
-            img = get_source(op["source"])
-            if generate_xpm(img, op["size"], dest_path):
-                print(f"  ✓ Generated XPM {op['size']}x{op['size']}")
-                success_count += 1
-            else:
-                fail_count += 1
+    def finish(index: int, op: dict, key: str, result: tuple[bool, str]) -> None:
+        results[index] = result
+        if result[0]:
+            new_cache[op["raw"]] = cache_entry(op, key, args.output)
 
-        elif op_type == "icns":
-            print(f"ICNS {op['source']} -> {op['dest']}")
-            img = get_source(op["source"])
-            if generate_icns(img, dest_path):
-                print(f"  ✓ Generated ICNS")
-                success_count += 1
-            else:
-                fail_count += 1
-
-        elif op_type == "xcassets":
-            print(f"XCASSETS {op['source']} -> {op['dest']}")
-            img = get_source(op["source"])
-            if generate_xcassets(img, dest_path):
-                print(f"  ✓ Generated Assets.xcassets")
-                success_count += 1
-            else:
-                fail_count += 1
+    def check(index: int, op: dict, key: str) -> bool:
+        """Record a cache hit; False if the operation has to run."""
+        if not is_current(cache.get(op["raw"]), key, args.output):
+            return False
+        new_cache[op["raw"]] = cache[op["raw"]]
+        results[index] = (True, UP_TO_DATE)
+        return True
 
-        elif op_type == "assets_car":
-            print(f"ASSETS_CAR -> {op['dest']}")
-            if generate_assets_car(dest_path):
-                print(f"  ✓ Generated Assets.car")
-                success_count += 1
-            else:
-                fail_count += 1
+    # Content-address every operation; copy inline, queue renders
+    pending: list[tuple[int, dict, str]] = []
+    for index, op in enumerate(operations):
+        if op["type"] == "assets_car":
+            continue
+        key = op_key(op, source_digest(op["source"]))
+        if check(index, op, key):
+            continue
+        if op["type"] in RENDER_TYPES:
+            pending.append((index, op, key))
+        else:
+            finish(index, op, key, run_operation(op, args.output))
+
+    if pending:
+        # Decode each source once; workers rebuild it from raw pixels
+        sources: dict[str, tuple[str, tuple[int, int], bytes]] = {}
+        for _, op, _ in pending:
+            if op["source"] not in sources:
+                img = validate_source(SCRIPT_DIR / op["source"])
+                sources[op["source"]] = (img.mode, img.size, img.tobytes())
+
+        workers = args.jobs or min(len(pending), os.cpu_count() or 1)
+        print(f"Rendering {len(pending)} operations with {workers} workers\n")
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(sources,)
+        ) as pool:
+            futures = [pool.submit(render, op, args.output) for _, op, _ in pending]
+            for (index, op, key), future in zip(pending, futures):
+                finish(index, op, key, future.result())
+
+    # Assets.car is compiled from the xcassets just rendered
+    for index, op in enumerate(operations):
+        if op["type"] != "assets_car":
+            continue
+        dest_path = args.output / op["dest"]
+        key = op_key(op, tree_sha256(dest_path / "Assets.xcassets"))
+        if not check(index, op, key):
+            finish(index, op, key, run_operation(op, args.output))
+
+    save_cache(CACHE_FILE, new_cache)
+
+    # Results, in config order
+    success_count = 0
+    fail_count = 0
+    up_to_date = 0
+    for index, op in enumerate(operations):
+        ok, output = results[index]
+        print(describe(op))
+        print(output, end="")
+        if ok:
+            success_count += 1
+            up_to_date += output == UP_TO_DATE
+        else:
+            fail_count += 1
 
     # Summary
     print()
     print("=" * 60)
-    print(f"Complete: {success_count} succeeded, {fail_count} failed")
+    print(
+        f"Complete: {success_count} succeeded ({up_to_date} up to date), "
+        f"{fail_count} failed"
+    )
     print("=" * 60)
 
     if fail_count > 0:
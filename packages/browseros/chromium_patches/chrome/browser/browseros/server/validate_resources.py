@@ -1,9 +1,9 @@
 diff --git a/chrome/browser/browseros/server/validate_resources.py b/chrome/browser/browseros/server/validate_resources.py
 new file mode 100644
-index 0000000000000..d7dc82b132dad
+index 0000000000000..9494b5ea0c970
 --- /dev/null
 +++ b/chrome/browser/browseros/server/validate_resources.py
-@@ -0,0 +1,43 @@
+@@ -0,0 +1,35 @@
 +#!/usr/bin/env python3
 +# Copyright 2024 The Chromium Authors
 +# Use of this source code is governed by a BSD-style license that can be
@@ -11,25 +11,17 @@ index 0000000000000..d7dc82b132dad
 +
 +"""Validates that required BrowserOS resources exist.
 +
-+Required resources must be listed in REQUIRED_RESOURCES below.
++Required resources are passed as arguments (paths relative to the build
++directory) by the validate_browseros_resources action in BUILD.gn.
 +"""
 +
 +import os
 +import sys
 +
-+# Required resources that must exist in the resources/ directory
-+# Add more resources as needed - paths are relative to resources/
-+REQUIRED_RESOURCES = [
-+    "bin/browseros_server",
-+]
-+
-+script_dir = os.path.dirname(os.path.abspath(__file__))
-+resources_dir = os.path.join(script_dir, "resources")
++required_resources = sys.argv[1:]
 +
 +all_valid = True
-+for resource in REQUIRED_RESOURCES:
-+  resource_path = os.path.join(resources_dir, resource)
-+
++for resource_path in required_resources:
 +  if not os.path.exists(resource_path):
 +    print(f"ERROR: Required BrowserOS resource not found: {resource_path}")
 +    all_valid = False
@@ -40,10 +32,10 @@ index 0000000000000..d7dc82b132dad
 +    all_valid = False
 +
 +if not all_valid:
-+  print(f"\nEnsure all required resources exist in resources/ directory:")
-+  for resource in REQUIRED_RESOURCES:
-+    print(f"  - resources/{resource}")
++  print(f"\nEnsure all required resources exist (see copy_resources.yaml):")
++  for resource_path in required_resources:
++    print(f"  - {resource_path}")
 +  sys.exit(1)
 +
-+print(f"✓ BrowserOS resources validated ({len(REQUIRED_RESOURCES)} resources)")
++print(f"✓ BrowserOS resources validated ({len(required_resources)} resources)")
 +sys.exit(0)